@@ -2,11 +2,23 @@
 콘솔(Console) 어댑터입니다.
 """
 
-from typing import Dict, List
+import glob
+import os
+import queue
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
 import pandas as pd
+from domain.model.criteria import QoQTemplate
 from domain.ports.inbound import ScreeningUseCasePort
 from domain.ports.outbound import ResultPersistencePort # <-- (1) 신규 포트 임포트
 
+# 스트리밍 실행에서 저장/출력 스레드에 결과가 끝났음을 알리는 표식
+_END_OF_RESULTS = object()
+# 가득 찬 큐에 넣으며 기다리는 동안, 받는 스레드가 살아 있는지 확인하는 간격(초)
+_HAND_OFF_POLL_SECONDS = 0.5
+
+
 class ConsoleRunner:
     """
     콘솔 환경에서 UseCase(핵심 로직)를 실행시키고
@@ -26,8 +38,12 @@ class ConsoleRunner:
         self.persistence_adapter = persistence_adapter # <--- (3) 저장 어댑터 할당
         print("[Adapter] ConsoleRunner 초기화. UseCase 및 Persistence가 주입되었습니다.")
 
-    def run(self):
-        """스크리닝을 실행하고 결과를 콘솔에 출력합니다."""
+    def run(self) -> Dict[str, pd.DataFrame]:
+        """스크리닝을 실행하고 결과를 콘솔에 출력합니다.
+
+        Returns:
+            Dict[str, pd.DataFrame]: {전략_이름: 결과 DataFrame} 딕셔너리.
+        """
         print("\n" + "="*30)
         print("🚀 퀀트 스크리닝 실행을 시작합니다...")
         print("="*30)
@@ -47,6 +63,263 @@ class ConsoleRunner:
         
         # 3. 결과 출력 (프레젠테이션 로직)
         self._print_results(results)
+        return results
+
+    def run_streaming(self, queue_size: int = 8) -> int:
+        """스크리닝을 실행하면서, 끝난 전략부터 바로 저장하고 출력합니다.
+
+        계산(현재 스레드)과 저장/출력(각각 전용 스레드)을 크기 제한 큐로 잇는
+        파이프라인입니다. 첫 결과가 나오자마자 저장/출력이 시작되고, 큐가 가득
+        차면 계산이 기다리므로 전체 결과를 한꺼번에 메모리에 들고 있지 않습니다.
+        (결과 출력 순서는 전략이 끝나는 순서입니다.)
+
+        저장/출력 스레드가 예외로 죽으면 그 스레드에는 더 이상 결과를 넘기지 않아,
+        가득 찬 큐 때문에 계산이 영원히 멈추지 않습니다.
+
+        Args:
+            queue_size (int): 저장/출력 큐에 대기할 수 있는 최대 결과 수.
+
+        Returns:
+            int: 실행된 전략 수.
+        """
+        print("\n" + "="*30)
+        print("🚀 퀀트 스크리닝 스트리밍 실행을 시작합니다...")
+        print("="*30)
+
+        strategy_names = list(self.screening_service.get_active_strategies())
+        persist_queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        print_queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        workers = [
+            threading.Thread(
+                target=self._persist_worker, args=(persist_queue, strategy_names),
+                name="result-persist", daemon=True
+            ),
+            threading.Thread(
+                target=self._print_worker, args=(print_queue,), name="result-print", daemon=True
+            ),
+        ]
+        for worker in workers:
+            worker.start()
+        channels = [(persist_queue, workers[0]), (print_queue, workers[1])]
+
+        start = time.perf_counter()
+        first_result_seconds = None
+        count = 0
+        try:
+            # 1. Inbound Port를 호출하여 핵심 로직 실행 (끝나는 대로 결과를 받음)
+            for strategy_name, result_df in self.screening_service.iter_active_strategies():
+                if first_result_seconds is None:
+                    first_result_seconds = time.perf_counter() - start
+                count += 1
+                # 2~3. 저장/출력 스레드로 넘김 (큐가 가득 차면 대기)
+                for channel in list(channels):
+                    if not self._hand_off(*channel, (strategy_name, result_df)):
+                        print(f"🚨 [Adapter] '{channel[1].name}' 스레드가 종료되어 "
+                              "이후 결과는 넘기지 않습니다.")
+                        channels.remove(channel)
+        finally:
+            # (실행이 중간에 실패해도 받은 결과까지는 저장/출력하고 종료)
+            for channel in channels:
+                self._hand_off(*channel, _END_OF_RESULTS)
+            for worker in workers:
+                worker.join()
+
+        print("\n" + "="*30)
+        if first_result_seconds is None:
+            print("🏁 실행된 전략이 없거나 결과가 없습니다.")
+        else:
+            print(f"🏁 모든 전략 실행 완료. {count}개 전략 "
+                  f"(첫 결과 {first_result_seconds:.3f}s, 전체 {time.perf_counter() - start:.3f}s)")
+        print("="*30)
+        return count
+
+    @staticmethod
+    def _hand_off(results: "queue.Queue", worker: threading.Thread, item) -> bool:
+        """작업 스레드의 큐에 항목을 넣습니다. (큐가 가득 차면 자리가 날 때까지 대기)
+
+        Returns:
+            bool: 넣었으면 True. 기다리는 사이 작업 스레드가 끝나 있으면 False.
+        """
+        while True:
+            try:
+                results.put(item, timeout=_HAND_OFF_POLL_SECONDS)
+                return True
+            except queue.Full:
+                if not worker.is_alive():
+                    return False
+
+    def _persist_worker(self, results: "queue.Queue", strategy_names: List[str]):
+        """큐로 받은 결과를 하나씩 저장합니다. (저장 스레드)"""
+        try:
+            batch = self.persistence_adapter.begin_results(strategy_names)
+        except Exception as e:
+            print(f"🚨 [Adapter] 결과 저장 시작 중 오류 발생: {e}")
+            # (저장은 포기하되, 계산이 막히지 않도록 큐는 끝까지 비움)
+            while results.get() is not _END_OF_RESULTS:
+                pass
+            return
+
+        while (item := results.get()) is not _END_OF_RESULTS:
+            try:
+                batch.save_result(*item)
+            except Exception as e:
+                print(f"🚨 [Adapter] 결과 저장 중 오류 발생: {item[0]} ({e})")
+
+        try:
+            batch.end_results()
+        except Exception as e:
+            print(f"🚨 [Adapter] 결과 저장 중 오류 발생: {e}")
+
+    def _print_worker(self, results: "queue.Queue"):
+        """큐로 받은 결과를 하나씩 출력합니다. (출력 스레드)"""
+        while (item := results.get()) is not _END_OF_RESULTS:
+            strategy_name, result_df = item
+            self._print_results({strategy_name: result_df})
+
+    def watch(
+        self,
+        strategies_path: str,
+        data_file_path: str,
+        poll_interval: float = 1.0,
+        max_cycles: Optional[int] = None
+    ):
+        """전략 폴더와 데이터 파일을 감시하며, 바뀐 부분만 다시 스크리닝합니다.
+
+        - 전략(TOML)이 바뀌면: 그 전략만 다시 파싱/실행하고 나머지 결과는 메모리의 것을 재사용
+        - 데이터 파일이 바뀌면: 데이터를 한 번 다시 로드하고 모든 전략을 재실행
+        저장은 persistence_adapter.update_results()로 바뀐 출력만 반영합니다.
+
+        변경 감지는 파일 stat(크기, 수정 시각) 폴링으로 하며, 저장 도중의 파일을
+        읽지 않도록 stat이 한 주기 동안 그대로일 때까지 기다린 뒤 반영합니다.
+
+        Args:
+            strategies_path (str): 'strategies/active' 폴더 경로.
+            data_file_path (str): 재무 데이터 엑셀 파일 경로.
+            poll_interval (float): 폴링 간격(초).
+            max_cycles (Optional[int]): 최대 폴링 횟수. None이면 Ctrl+C까지 계속.
+        """
+        results = self.run()
+        strategy_snapshot = self._snapshot_strategies(strategies_path)
+        data_stat = self._stat_key(data_file_path)
+
+        print(f"\n👀 변경 감시 중: {strategies_path}, {data_file_path} (Ctrl+C로 종료)")
+        cycles = 0
+        try:
+            while max_cycles is None or cycles < max_cycles:
+                cycles += 1
+                time.sleep(poll_interval)
+
+                new_snapshot = self._snapshot_strategies(strategies_path)
+                new_data_stat = self._stat_key(data_file_path)
+                if new_snapshot == strategy_snapshot and new_data_stat == data_stat:
+                    continue
+
+                # (저장이 끝날 때까지 대기: stat이 한 주기 동안 그대로여야 반영)
+                time.sleep(min(poll_interval, 0.5))
+                if (self._snapshot_strategies(strategies_path) != new_snapshot
+                        or self._stat_key(data_file_path) != new_data_stat):
+                    continue
+
+                changed, removed = set(), set()
+                try:
+                    if new_snapshot != strategy_snapshot:
+                        changed, removed = self.screening_service.reload_strategies()
+                        strategy_snapshot = new_snapshot
+
+                    if new_data_stat != data_stat:
+                        print("\n🔄 데이터 파일 변경 감지: 데이터를 다시 로드하고 모든 전략을 재실행합니다.")
+                        self.screening_service.reload_financial_data()
+                        results = self.screening_service.run_all_active_strategies()
+                        changed = set(results)
+                        data_stat = new_data_stat
+                    else:
+                        results = self._rerun_changed(results, changed, removed)
+
+                except Exception as e:
+                    # (실패한 변경은 반영하지 않고 다음 주기에 다시 시도)
+                    print(f"🚨 [Adapter] 변경 반영 중 오류 발생: {e}")
+                    continue
+
+                if not changed and not removed:
+                    print("\n🔄 전략 파일 변경 감지: 내용 변화 없음.")
+                    continue
+
+                try:
+                    self.persistence_adapter.update_results(results, changed, removed)
+                except Exception as e:
+                    print(f"🚨 [Adapter] 결과 저장 중 오류 발생: {e}")
+
+                for strategy_name in sorted(removed):
+                    print(f"\n--- [전략: {strategy_name}] ---\n  -> 비활성화됨 (결과 제거)")
+                self._print_results({
+                    name: result_df for name, result_df in results.items() if name in changed
+                })
+        except KeyboardInterrupt:
+            print("\n👋 감시 모드를 종료합니다.")
+
+    def _rerun_changed(
+        self,
+        results: Dict[str, pd.DataFrame],
+        changed: Set[str],
+        removed: Set[str]
+    ) -> Dict[str, pd.DataFrame]:
+        """바뀐 전략만 다시 실행하고, 나머지 결과는 그대로 재사용합니다."""
+        if changed:
+            print(f"\n🔄 전략 변경 감지: {sorted(changed)} 재실행...")
+
+        results = {name: df for name, df in results.items() if name not in removed}
+        for strategy_name in changed:
+            results[strategy_name] = self.screening_service.run_strategy(strategy_name)
+
+        # (결과 순서는 항상 전략 로드 순서)
+        return {
+            name: results[name]
+            for name in self.screening_service.get_active_strategies() if name in results
+        }
+
+    @staticmethod
+    def _snapshot_strategies(strategies_path: str) -> Dict[str, Tuple[int, int]]:
+        """전략 폴더의 TOML 파일별 (크기, 수정 시각)을 구합니다."""
+        snapshot = {}
+        for file_path in glob.glob(os.path.join(strategies_path, "*.toml")):
+            stat_key = ConsoleRunner._stat_key(file_path)
+            if stat_key is not None:
+                snapshot[file_path] = stat_key
+        return snapshot
+
+    @staticmethod
+    def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def run_backtest(self, templates: Dict[str, QoQTemplate]):
+        """QoQ 템플릿 워크포워드 백테스트를 실행하고 결과를 저장/출력합니다.
+
+        Args:
+            templates (Dict[str, QoQTemplate]): {템플릿_이름: QoQTemplate}.
+        """
+        print("\n" + "="*30)
+        print(f"📈 QoQ 백테스트 실행 ({len(templates)}개 템플릿)...")
+        print("="*30)
+
+        results = self.screening_service.run_qoq_backtest(templates)
+
+        try:
+            self.persistence_adapter.save_results(results)
+        except Exception as e:
+            print(f"🚨 [Adapter] 결과 저장 중 오류 발생: {e}")
+
+        for template_name, result_df in results.items():
+            print(f"\n--- [백테스트: {template_name}] ---")
+            if result_df.empty:
+                print("  -> 결과 없음")
+                continue
+
+            with pd.option_context('display.width', 1000, 'display.max_rows', None):
+                print(result_df.to_string())
 
     def _print_results(self, results: Dict[str, pd.DataFrame]):
         """스크리닝 결과를 콘솔에 예쁘게 출력합니다."""
@@ -0,0 +1,281 @@
+"""ScreeningUseCasePort(Inbound Port)를 호출하는
+로컬 HTTP API(데몬) 어댑터입니다.
+
+표준 라이브러리 asyncio만으로 동작하는 최소한의 HTTP/1.1 서버로,
+서비스와 재무 데이터를 메모리에 상주시킨 채 반복 요청에 응답합니다.
+스크리닝 계산은 스레드에서 실행하므로 여러 요청을 동시에 처리할 수 있습니다.
+
+엔드포인트:
+    GET  /health                   상태 및 활성 전략 수
+    GET  /strategies               활성 전략 목록
+    POST /strategies/run           모든 활성 전략 실행
+    POST /strategies/{이름}/run     활성 전략 하나 실행
+    POST /criteria/run             JSON 본문의 임의 전략 실행
+                                   (criteria 테이블 또는 {"criteria": {...}})
+"""
+
+import asyncio
+import dataclasses
+import json
+import math
+import os
+import time
+from http import HTTPStatus
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from domain.model.criteria import CompositeCriteria
+from domain.model.criteria_parser import parse_criteria
+from domain.ports.inbound import ScreeningUseCasePort
+
+
+# (HTTP 상태 코드, JSON으로 직렬화할 응답 본문)
+Response = Tuple[HTTPStatus, Dict[str, Any]]
+
+
+class HttpScreeningServer:
+    """
+    로컬 HTTP 요청으로 UseCase(핵심 로직)를 실행시키는 Inbound Adapter입니다.
+    """
+
+    MAX_BODY_BYTES = 1 << 20
+    MAX_HEADER_BYTES = 64 * 1024
+
+    def __init__(
+        self,
+        screening_service: ScreeningUseCasePort,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        max_concurrency: Optional[int] = None
+    ):
+        """
+        Args:
+            screening_service (ScreeningUseCasePort): 핵심 서비스(Inbound Port).
+            host (str): 바인딩할 주소. (기본: 로컬 전용)
+            port (int): 바인딩할 포트. 0이면 임의의 빈 포트.
+            max_concurrency (Optional[int]): 동시에 실행할 스크리닝 요청 수. None이면 CPU 개수.
+        """
+        self.screening_service = screening_service
+        self.host = host
+        self.port = port
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        print(f"[Adapter] HttpScreeningServer 초기화. 주소: http://{self.host}:{self.port}")
+
+    def serve_forever(self):
+        """서버를 시작하고 종료(Ctrl+C)될 때까지 요청을 처리합니다."""
+        try:
+            asyncio.run(self._serve_forever())
+        except KeyboardInterrupt:
+            print("\n[Adapter] HTTP 서버 종료.")
+
+    async def start(self) -> asyncio.Server:
+        """현재 이벤트 루프에서 서버를 시작합니다. (다른 asyncio 코드에 내장할 때 사용)
+
+        Returns:
+            asyncio.Server: 시작된 서버. (port=0이면 실제 포트는 sockets에서 확인)
+        """
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=self.MAX_HEADER_BYTES
+        )
+        host, port = server.sockets[0].getsockname()[:2]
+        print(f"[Adapter] HTTP 서버 대기 중: http://{host}:{port} "
+              f"(동시 실행 {self.max_concurrency})")
+        return server
+
+    async def _serve_forever(self):
+        server = await self.start()
+        async with server:
+            await server.serve_forever()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """연결 하나에서 요청들을 처리합니다. (HTTP/1.1 keep-alive 지원)"""
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, target, headers, body, keep_alive = request
+
+                start = time.perf_counter()
+                status, payload = await self._dispatch(method, target, body)
+                payload["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except _BadRequest as e:
+            self._write_response(writer, HTTPStatus.BAD_REQUEST, {"error": str(e)}, False)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        """요청 하나를 읽습니다. 연결이 정상 종료되면 None을 반환합니다.
+
+        Raises:
+            _BadRequest: 요청 형식이 잘못되었거나 너무 큰 경우.
+        """
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as e:
+            if not e.partial.strip():
+                return None
+            raise _BadRequest("요청 헤더가 불완전합니다.")
+        except asyncio.LimitOverrunError:
+            raise _BadRequest("요청 헤더가 너무 큽니다.")
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ", 2)
+        except ValueError:
+            raise _BadRequest(f"잘못된 요청 줄: {lines[0]!r}")
+
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                key, value = line.split(":", 1)
+                headers[key.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise _BadRequest("Content-Length가 숫자가 아닙니다.")
+        if length < 0 or length > self.MAX_BODY_BYTES:
+            raise _BadRequest(f"본문 크기 제한 초과 (최대 {self.MAX_BODY_BYTES}바이트)")
+        body = await reader.readexactly(length) if length else b""
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        return method.upper(), target, headers, body, keep_alive
+
+    async def _dispatch(self, method: str, target: str, body: bytes) -> Response:
+        """경로/메서드에 맞는 처리기를 호출합니다."""
+        parts = [unquote(part) for part in urlsplit(target).path.split("/") if part]
+
+        try:
+            if parts == ["health"] and method == "GET":
+                return HTTPStatus.OK, {
+                    "status": "ok",
+                    "active_strategies": len(self.screening_service.get_active_strategies()),
+                }
+
+            if parts == ["strategies"] and method == "GET":
+                return HTTPStatus.OK, {"strategies": {
+                    name: _criteria_to_dict(criteria)
+                    for name, criteria in self.screening_service.get_active_strategies().items()
+                }}
+
+            if parts == ["strategies", "run"] and method == "POST":
+                results = await self._run(self.screening_service.run_all_active_strategies)
+                return HTTPStatus.OK, {"results": {
+                    name: _frame_to_dict(result_df) for name, result_df in results.items()
+                }}
+
+            if len(parts) == 3 and parts[0] == "strategies" and parts[2] == "run" and method == "POST":
+                result_df = await self._run(self.screening_service.run_strategy, parts[1])
+                return HTTPStatus.OK, {"strategy": parts[1], "result": _frame_to_dict(result_df)}
+
+            if parts == ["criteria", "run"] and method == "POST":
+                criteria_data = self._parse_json_body(body)
+                criteria_data = criteria_data.get("criteria", criteria_data)
+                criteria = parse_criteria(criteria_data)
+                result_df = await self._run(self.screening_service.run_criteria, criteria)
+                return HTTPStatus.OK, {
+                    "criteria": _criteria_to_dict(criteria), "result": _frame_to_dict(result_df)
+                }
+
+        except KeyError as e:
+            status = HTTPStatus.NOT_FOUND if parts[:1] == ["strategies"] else HTTPStatus.BAD_REQUEST
+            return status, {"error": str(e.args[0] if e.args else e)}
+        except (ValueError, TypeError) as e:
+            return HTTPStatus.BAD_REQUEST, {"error": str(e)}
+        except Exception as e:
+            print(f"🚨 [Adapter] HTTP 요청 처리 중 오류 발생: {method} {target} ({e})")
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)}
+
+        return HTTPStatus.NOT_FOUND, {"error": f"없는 경로: {method} {target}"}
+
+    async def _run(self, func, *args):
+        """스크리닝 호출을 스레드에서 실행합니다. (동시 실행 수 제한)"""
+        async with self._semaphore:
+            return await asyncio.to_thread(func, *args)
+
+    @staticmethod
+    def _parse_json_body(body: bytes) -> Dict:
+        """
+        Raises:
+            ValueError: 본문이 JSON 객체가 아닌 경우.
+        """
+        try:
+            data = json.loads(body or b"{}")
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ValueError(f"JSON 본문 파싱 실패: {e}")
+        if not isinstance(data, dict):
+            raise ValueError("JSON 본문은 객체여야 합니다.")
+        return data
+
+    @staticmethod
+    def _write_response(
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        payload: Dict[str, Any],
+        keep_alive: bool
+    ):
+        body = json.dumps(payload, ensure_ascii=False, allow_nan=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+
+
+class _BadRequest(Exception):
+    """HTTP 요청 형식 오류입니다. (연결을 400 응답 후 종료)"""
+
+
+def _criteria_to_dict(criteria) -> Dict[str, Any]:
+    """Criteria 객체를 JSON 직렬화 가능한 딕셔너리로 변환합니다.
+
+    조합 조건은 parse_criteria가 다시 읽을 수 있는 {"all": [...]} 형태로 씁니다.
+    """
+    if isinstance(criteria, CompositeCriteria):
+        children = [_criteria_to_dict(child) for child in criteria.children]
+        return {"type": criteria.type, criteria.operator: children}
+    return {"type": criteria.type, **dataclasses.asdict(criteria)}
+
+
+def _frame_to_dict(result_df: pd.DataFrame) -> Dict[str, Any]:
+    """결과 DataFrame을 JSON 직렬화 가능한 'split' 형식으로 변환합니다.
+
+    NaN은 null, ±inf(적자 -> 흑자 성장률)는 문자열 "inf"/"-inf"로 표현합니다.
+    """
+    return {
+        "index_name": result_df.index.name,
+        "index": [_json_value(value) for value in result_df.index],
+        "columns": [str(column) for column in result_df.columns],
+        "data": [[_json_value(value) for value in row] for row in result_df.itertuples(index=False)],
+    }
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float):
+        if math.isnan(value):
+            return None
+        if math.isinf(value):
+            return "inf" if value > 0 else "-inf"
+    return value
@@ -0,0 +1,259 @@
+"""ResultPersistencePort(Outbound Port)를 구현한
+컬럼형(columnar) 바이너리 결과 파일 어댑터입니다.
+
+모든 전략의 결과를 하나의 .npz 파일에 긴(long) 형식으로 저장합니다.
+(pyarrow 없이 numpy만 사용하는 Parquet/Feather 대용)
+
+    strategy   metric   ticker    base     target   growth   streak
+    전략_A      영업이익   종목0001   -34.6    134.5    inf      NaN
+    ...
+
+종목별 (지표)(Base)/(Target) 결과(QoQ_Growth, QoQ_Turnaround, target_quarter를 지정한
+YoY_Growth, Growth_Streak)만 저장합니다. 종목 단위가 아닌 요약(QoQ_Growth_Sweep,
+모든 분기 YoY_Growth, 워크포워드 백테스트)과 말단 조건마다 지표가 다른 조합 조건
+(Composite) 결과는 저장하지 않으며, 저장하지 않은 전략은 파일에 이름을 남겨
+읽을 때 '통과 종목 없음'과 구분합니다.
+
+열마다 타입이 고정된 배열(strategy/ticker는 사전 코드 int32, 값은 float64)로
+저장되며, 읽을 때는 필요한 열만 풀어서 읽을 수 있습니다.
+(read_columnar_results 참고)
+"""
+
+import os
+import re
+import tempfile
+from typing import Collection, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from domain.ports.outbound import NullTracer, ResultPersistencePort, TracerPort
+
+
+COLUMNS = ("strategy", "metric", "ticker", "base", "target", "growth", "streak")
+FORMAT_VERSION = 2
+# 읽을 수 있는 파일 형식 버전 (1: streak 열과 미지원 전략 목록 없음)
+READABLE_VERSIONS = (1, 2)
+
+# 조합 조건 결과의 말단 조건별 열 (예: "[1] Pass", "[2] 영업이익(Base)")
+_LEAF_COLUMN_REGEX = re.compile(r"^\[\d+\] ")
+
+
+class ColumnarResultPersistenceAdapter(ResultPersistencePort):
+    """
+    스크리닝 결과를 단일 컬럼형 .npz 파일로 저장하는
+    ResultPersistencePort의 구현체(Adapter)입니다.
+
+    파일 구성 (배열 이름: 내용):
+        strategy_names / strategy_metrics   전략 사전 (통과 종목이 없는 전략 포함)
+        unsupported_names                   결과 유형이 맞지 않아 저장하지 않은 전략
+        ticker_names                        종목 사전
+        strategy / ticker                   행별 사전 코드 (int32)
+        base / target / growth / streak     행별 값 (float64, 해당 열이 없는 전략은 NaN)
+
+    Attributes:
+        unsupported_strategies (Dict[str, str]): 마지막 save_results()에서 저장하지 않은
+            {전략_이름: 사유}.
+    """
+
+    def __init__(
+        self,
+        output_file_path: str,
+        tracer: Optional[TracerPort] = None,
+        compress: bool = False
+    ):
+        """
+        Args:
+            output_file_path (str): 저장할 .npz 파일 경로.
+            tracer (Optional[TracerPort]): 단계 계측용 트레이서. (없으면 계측 안 함)
+            compress (bool): zip(deflate) 압축 여부. (파일은 작아지고 쓰기/읽기는 느려짐)
+        """
+        self.output_file_path = output_file_path
+        self.tracer = tracer or NullTracer()
+        self.compress = compress
+        self.output_dir = os.path.dirname(output_file_path)
+        print(f"[Adapter] ColumnarResultPersistence 초기화. 저장 파일: {self.output_file_path}")
+
+        if self.output_dir and not os.path.exists(self.output_dir):
+            os.makedirs(self.output_dir)
+
+        self.unsupported_strategies: Dict[str, str] = {}
+
+    def save_results(self, results: Dict[str, pd.DataFrame]):
+        """결과 딕셔너리를 긴 형식의 컬럼형 파일 하나로 저장합니다.
+
+        (지표)(Base)/(Target) 열이 없는 결과(예: 임계값 스윕 요약)와 말단 조건마다
+        지표가 다른 조합 조건 결과는 전략당 지표 하나인 형식에 맞지 않으므로
+        일부 열만 잘라 저장하지 않고 건너뛰며, unsupported_strategies와 파일의
+        unsupported_names에 남깁니다.
+        """
+        with self.tracer.span("columnar.save_results"):
+            print(f"[Adapter] {len(results)}개의 결과 컬럼형 파일로 저장 시작...")
+
+            strategy_names: List[str] = []
+            strategy_metrics: List[str] = []
+            parts: Dict[str, List[np.ndarray]] = {
+                "strategy": [], "ticker": [], "base": [], "target": [], "growth": [], "streak": []
+            }
+            unsupported: Dict[str, str] = {}
+
+            for strategy_name, result_df in results.items():
+                if any(_LEAF_COLUMN_REGEX.match(str(column)) for column in result_df.columns):
+                    unsupported[strategy_name] = "조합 조건 결과 (말단 조건별 지표)"
+                    continue
+
+                located = self._locate_columns(result_df)
+                if located is None:
+                    if not result_df.empty:
+                        unsupported[strategy_name] = "종목별 Base/Target 열이 없거나 여러 개"
+                    continue
+
+                metric, base_col, target_col, growth_col, streak_col = located
+                code = len(strategy_names)
+                strategy_names.append(strategy_name)
+                strategy_metrics.append(metric)
+
+                rows = len(result_df)
+                parts["strategy"].append(np.full(rows, code, dtype=np.int32))
+                parts["ticker"].append(result_df.index.to_numpy())
+                parts["base"].append(result_df[base_col].to_numpy(dtype=np.float64))
+                parts["target"].append(result_df[target_col].to_numpy(dtype=np.float64))
+                for part, column in (("growth", growth_col), ("streak", streak_col)):
+                    parts[part].append(
+                        result_df[column].to_numpy(dtype=np.float64) if column
+                        else np.full(rows, np.nan)
+                    )
+
+            self.unsupported_strategies = unsupported
+            if unsupported:
+                print(f"  🚨 결과 유형이 맞지 않아 저장하지 않은 전략 {len(unsupported)}개:")
+                for strategy_name, reason in unsupported.items():
+                    print(f"    - '{strategy_name}' ({reason})")
+
+            tickers = np.concatenate(parts["ticker"]) if parts["ticker"] else np.array([], dtype=object)
+            ticker_codes, ticker_names = pd.factorize(tickers)
+
+            arrays = {
+                "format_version": np.array([FORMAT_VERSION]),
+                "strategy_names": np.array(strategy_names, dtype=str),
+                "strategy_metrics": np.array(strategy_metrics, dtype=str),
+                "unsupported_names": np.array(list(unsupported), dtype=str),
+                "ticker_names": np.asarray(ticker_names.astype(str), dtype=str),
+                "strategy": _concat(parts["strategy"], np.int32),
+                "ticker": ticker_codes.astype(np.int32),
+                "base": _concat(parts["base"], np.float64),
+                "target": _concat(parts["target"], np.float64),
+                "growth": _concat(parts["growth"], np.float64),
+                "streak": _concat(parts["streak"], np.float64),
+            }
+
+            try:
+                self._atomic_write(arrays)
+                print(f"  -> 저장 완료: {self.output_file_path} "
+                      f"({len(strategy_names)}개 전략, {len(ticker_codes)}행)")
+            except Exception as e:
+                print(f"  🚨 저장 실패: {self.output_file_path} ({e})")
+
+    @staticmethod
+    def _locate_columns(
+        result_df: pd.DataFrame
+    ) -> Optional[Tuple[str, str, str, Optional[str], Optional[str]]]:
+        """결과 열 이름에서 (지표, Base 열, Target 열, 성장률 열, 연속 성장 열)을 찾습니다.
+
+        Base/Target 열이 정확히 하나씩 있을 때만 찾은 것으로 봅니다. (여럿이면 None)
+        """
+        columns = [str(column) for column in result_df.columns]
+        base_cols = [c for c in columns if c.endswith("(Base)")]
+        target_cols = [c for c in columns if c.endswith("(Target)")]
+        if len(base_cols) != 1 or len(target_cols) != 1:
+            return None
+        base_col, target_col = base_cols[0], target_cols[0]
+
+        growth_col = "Growth_Rate(%)" if "Growth_Rate(%)" in columns else None
+        streak_col = "Streak" if "Streak" in columns else None
+        return base_col[:-len("(Base)")], base_col, target_col, growth_col, streak_col
+
+    def _atomic_write(self, arrays: Dict[str, np.ndarray]):
+        save = np.savez_compressed if self.compress else np.savez
+        fd, tmp_path = tempfile.mkstemp(dir=self.output_dir or ".", suffix=".npz.tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                save(f, **arrays)
+            os.replace(tmp_path, self.output_file_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def read_columnar_results(
+    path: str,
+    columns: Optional[Collection[str]] = None,
+    strategies: Optional[Collection[str]] = None
+) -> pd.DataFrame:
+    """ColumnarResultPersistenceAdapter가 저장한 파일을 읽습니다.
+
+    .npz의 배열은 접근할 때 하나씩 풀리므로, 요청하지 않은 열은
+    디스크에서 읽지도 압축을 풀지도 않습니다.
+
+    Args:
+        path (str): 결과 .npz 파일 경로.
+        columns (Optional[Collection[str]]): 읽을 열 (COLUMNS 중). None이면 전체.
+        strategies (Optional[Collection[str]]): 이 전략들의 행만 읽습니다. None이면 전체.
+
+    Returns:
+        pd.DataFrame: 긴 형식 결과. strategy/metric/ticker는 category 타입입니다.
+            (버전 1 파일의 streak 열은 NaN)
+
+    Raises:
+        ValueError: 알 수 없는 열이거나, 읽을 수 없는 파일 형식 버전이거나,
+            결과 유형이 맞지 않아 저장되지 않은 전략을 strategies로 요청한 경우.
+    """
+    columns = list(COLUMNS if columns is None else columns)
+    unknown = set(columns) - set(COLUMNS)
+    if unknown:
+        raise ValueError(f"알 수 없는 열: {sorted(unknown)} (가능: {COLUMNS})")
+
+    with np.load(path, allow_pickle=False) as npz:
+        version = int(npz["format_version"][0])
+        if version not in READABLE_VERSIONS:
+            raise ValueError(f"지원하지 않는 결과 파일 버전: {version}")
+
+        if strategies is not None and "unsupported_names" in npz.files:
+            unsaved = sorted(set(strategies) & set(npz["unsupported_names"].tolist()))
+            if unsaved:
+                raise ValueError(f"결과 유형이 맞지 않아 저장되지 않은 전략: {unsaved}")
+
+        needs_strategy = strategies is not None or {"strategy", "metric"} & set(columns)
+        strategy_codes = npz["strategy"] if needs_strategy else None
+
+        rows = slice(None)
+        if strategies is not None:
+            wanted = np.isin(npz["strategy_names"], list(strategies))
+            rows = wanted[strategy_codes]
+
+        data = {}
+        for column in columns:
+            if column == "strategy":
+                data[column] = pd.Categorical.from_codes(
+                    strategy_codes[rows], categories=npz["strategy_names"].astype(object)
+                )
+            elif column == "metric":
+                metric_names, metric_codes = np.unique(npz["strategy_metrics"], return_inverse=True)
+                data[column] = pd.Categorical.from_codes(
+                    metric_codes[strategy_codes[rows]], categories=metric_names.astype(object)
+                )
+            elif column == "ticker":
+                data[column] = pd.Categorical.from_codes(
+                    npz["ticker"][rows], categories=npz["ticker_names"].astype(object)
+                )
+            elif column not in npz.files:
+                # (이전 버전 파일에 없는 열)
+                data[column] = np.full(len(npz["ticker"][rows]), np.nan)
+            else:
+                data[column] = npz[column][rows]
+
+    return pd.DataFrame(data)
+
+
+def _concat(parts: List[np.ndarray], dtype) -> np.ndarray:
+    return np.concatenate(parts).astype(dtype, copy=False) if parts else np.array([], dtype=dtype)
@@ -1,39 +1,235 @@
+import hashlib
+import json
 import os
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 import pandas as pd
-from typing import Dict
-from domain.ports.outbound import ResultPersistencePort
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from domain.ports.outbound import NullTracer, ResultBatch, ResultPersistencePort, TracerPort
 
 class CsvResultPersistenceAdapter(ResultPersistencePort):
     """
     스크리닝 결과를 로컬 CSV 파일로 저장하는
     ResultPersistencePort의 구현체(Adapter)입니다.
+
+    파일들은 스레드 풀에서 동시에 직렬화/저장되며, 임시 파일 + rename으로
+    원자적으로 교체됩니다. 이전 실행과 내용(해시)이 같은 파일은 직렬화하지도
+    다시 쓰지도 않습니다.
     """
-    def __init__(self, output_directory: str):
+
+    # 파일명 -> {"sha256", "size", "mtime_ns"} (마지막으로 쓴 결과의 해시와 파일 stat)
+    _MANIFEST_FILE = ".csv_manifest.json"
+
+    def __init__(
+        self,
+        output_directory: str,
+        tracer: Optional[TracerPort] = None,
+        max_workers: Optional[int] = None
+    ):
         """
         Args:
             output_directory (str): CSV 파일을 저장할 폴더 경로.
+            tracer (Optional[TracerPort]): 단계 계측용 트레이서. (없으면 계측 안 함)
+            max_workers (Optional[int]): 저장 스레드 수. None이면 ThreadPoolExecutor 기본값.
         """
         self.output_dir = output_directory
+        self.tracer = tracer or NullTracer()
+        self.max_workers = max_workers
+        self._print_lock = threading.Lock()
+        self._manifest_lock = threading.Lock()
         print(f"[Adapter] CsvResultPersistence 초기화. 저장 경로: {self.output_dir}")
-        
+
         # (폴더가 없으면 생성)
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
 
     def save_results(self, results: Dict[str, pd.DataFrame]):
-        """결과 딕셔너리를 순회하며 CSV 파일로 저장합니다."""
-        
-        print(f"[Adapter] {len(results)}개의 결과 CSV 파일로 저장 시작...")
-        for strategy_name, result_df in results.items():
-            
-            # 파일명 생성 (예: op_qoq_growth_23q1_q2.csv)
-            filename = f"{strategy_name}.csv"
-            file_path = os.path.join(self.output_dir, filename)
-            
+        """결과 딕셔너리를 CSV 파일들로 저장합니다. (내용이 같은 파일은 건너뜀)"""
+        with self.tracer.span("csv.save_results"):
+            print(f"[Adapter] {len(results)}개의 결과 CSV 파일로 저장 시작...")
+            self._save_many(results.items(), removed=set())
+
+    def update_results(
+        self,
+        results: Dict[str, pd.DataFrame],
+        changed: Set[str],
+        removed: Set[str]
+    ):
+        """바뀐 전략의 CSV만 다시 쓰고, 비활성화된 전략의 CSV는 삭제합니다."""
+        with self.tracer.span("csv.update_results"):
+            print(f"[Adapter] 결과 CSV 갱신 (변경 {len(changed)}개, 삭제 {len(removed)}개)...")
+            self._save_many(
+                ((name, results[name]) for name in changed if name in results), removed
+            )
+
+    def begin_results(self, strategy_names: List[str]) -> ResultBatch:
+        """스트리밍 저장을 시작합니다. (save_result로 받은 결과를 바로 스레드 풀에 넘김)"""
+        print(f"[Adapter] {len(strategy_names)}개의 결과 CSV 파일로 스트리밍 저장 시작...")
+        return _CsvResultBatch(self, removed=set())
+
+    def _save_many(self, items: Iterable[Tuple[str, pd.DataFrame]], removed: Set[str]):
+        """전략 결과들을 스레드 풀에서 저장하고, 삭제 및 manifest 갱신을 처리합니다."""
+        batch = _CsvResultBatch(self, removed)
+        for strategy_name, result_df in items:
+            batch.save_result(strategy_name, result_df)
+        batch.finish()
+
+    def _apply_outcomes(self, outcomes: List[Tuple[str, Optional[Dict], str]], removed: Set[str]):
+        """배치 하나의 저장 결과와 삭제를 manifest에 반영합니다.
+
+        manifest는 반영 직전에 다시 읽으므로, 동시에 끝난 다른 배치가 기록한
+        항목을 덮어쓰지 않습니다.
+        """
+        with self._manifest_lock:
+            manifest = self._read_manifest()
+
+            written = skipped = 0
+            for filename, entry, status in outcomes:
+                if status == "written":
+                    written += 1
+                elif status == "skipped":
+                    skipped += 1
+                if entry is None:
+                    manifest.pop(filename, None)
+                else:
+                    manifest[filename] = entry
+
+            for strategy_name in removed:
+                filename = f"{strategy_name}.csv"
+                file_path = os.path.join(self.output_dir, filename)
+                manifest.pop(filename, None)
+                try:
+                    os.remove(file_path)
+                    print(f"  -> 삭제 완료: {file_path}")
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    print(f"  🚨 삭제 실패: {file_path} ({e})")
+
+            self._write_manifest(manifest)
+        print(f"  -> 저장 {written}개, 변경 없어 건너뜀 {skipped}개")
+
+    def _save_one(
+        self,
+        strategy_name: str,
+        result_df: pd.DataFrame,
+        previous: Optional[Dict]
+    ) -> Tuple[str, Optional[Dict], str]:
+        """전략 하나를 CSV로 직렬화하고, 내용이 바뀐 경우에만 원자적으로 저장합니다.
+
+        Returns:
+            Tuple[str, Optional[Dict], str]: (파일명, manifest 항목, 상태).
+                상태는 "written" / "skipped" / "failed"입니다.
+        """
+        # 파일명 생성 (예: op_qoq_growth_23q1_q2.csv)
+        filename = f"{strategy_name}.csv"
+        file_path = os.path.join(self.output_dir, filename)
+
+        try:
+            # (해시가 같고 파일도 마지막으로 쓴 그대로면 직렬화 없이 건너뜀)
+            sha256 = self._content_hash(result_df)
+            if previous and previous.get("sha256") == sha256 and self._stat_matches(file_path, previous):
+                return filename, previous, "skipped"
+
+            # DataFrame을 CSV로 직렬화 (index=True로 종목명 포함, 엑셀 호환 BOM)
+            content = result_df.to_csv(index=True).encode('utf-8-sig')
+
+            fd, tmp_path = tempfile.mkstemp(dir=self.output_dir, suffix=".csv.tmp")
             try:
-                # DataFrame을 CSV로 저장 (index=True로 종목명 포함)
-                result_df.to_csv(file_path, index=True, encoding='utf-8-sig')
+                with os.fdopen(fd, "wb") as f:
+                    f.write(content)
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+            stat = os.stat(file_path)
+            with self._print_lock:
                 print(f"  -> 저장 완료: {file_path}")
-                
-            except Exception as e:
-                print(f"  🚨 저장 실패: {filename} ({e})")
\ No newline at end of file
+            return filename, {"sha256": sha256, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}, "written"
+
+        except Exception as e:
+            with self._print_lock:
+                print(f"  🚨 저장 실패: {filename} ({e})")
+            return filename, None, "failed"
+
+    @staticmethod
+    def _content_hash(result_df: pd.DataFrame) -> str:
+        """결과 DataFrame 내용(라벨 + 값)의 해시. (CSV 직렬화보다 훨씬 저렴한 벡터 연산)"""
+        digest = hashlib.sha256()
+        digest.update(repr((
+            result_df.index.name, list(map(str, result_df.columns)), list(map(str, result_df.dtypes))
+        )).encode("utf-8"))
+        if len(result_df):
+            digest.update(pd.util.hash_pandas_object(result_df, index=True).to_numpy())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _stat_matches(file_path: str, entry: Dict) -> bool:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        return (stat.st_size, stat.st_mtime_ns) == (entry.get("size"), entry.get("mtime_ns"))
+
+    def _read_manifest(self) -> Dict[str, Dict]:
+        try:
+            with open(os.path.join(self.output_dir, self._MANIFEST_FILE), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    def _write_manifest(self, manifest: Dict[str, Dict]):
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.output_dir, suffix=".json.tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(manifest, f, ensure_ascii=False)
+                os.replace(tmp_path, os.path.join(self.output_dir, self._MANIFEST_FILE))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            # (manifest 저장 실패는 치명적이지 않음: 다음 실행에서 모두 다시 씀)
+            print(f"  🚨 [Adapter] CSV manifest 저장 실패: {e}")
+
+
+class _CsvResultBatch(ResultBatch):
+    """CsvResultPersistenceAdapter의 저장 배치 하나입니다. (스레드 풀과 대기 작업을 가짐)"""
+
+    def __init__(self, adapter: CsvResultPersistenceAdapter, removed: Set[str]):
+        """
+        Args:
+            adapter (CsvResultPersistenceAdapter): 파일을 실제로 쓸 어댑터.
+            removed (Set[str]): 배치를 마칠 때 삭제할 전략 이름들.
+        """
+        self.adapter = adapter
+        self.removed = removed
+        workers = adapter.max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._manifest = adapter._read_manifest()
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        self._futures: List[Future] = []
+        # (대기 중인 저장 작업 수 제한: 작업마다 DataFrame을 붙잡고 있으므로)
+        self._slots = threading.BoundedSemaphore(workers * 2)
+
+    def save_result(self, strategy_name: str, result_df: pd.DataFrame):
+        """결과 하나를 저장 스레드 풀에 넘깁니다. (밀린 저장이 많으면 자리가 날 때까지 대기)"""
+        self._slots.acquire()
+        future = self._pool.submit(
+            self.adapter._save_one, strategy_name, result_df, self._manifest.get(f"{strategy_name}.csv")
+        )
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+
+    def end_results(self):
+        """남은 저장이 끝나길 기다린 뒤 manifest를 갱신합니다."""
+        with self.adapter.tracer.span("csv.end_results"):
+            self.finish()
+
+    def finish(self):
+        self._pool.shutdown(wait=True)
+        outcomes = [future.result() for future in self._futures]
+        self._futures = []
+        self.adapter._apply_outcomes(outcomes, self.removed)
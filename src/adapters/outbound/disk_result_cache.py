@@ -0,0 +1,139 @@
+"""ResultCachePort(Outbound Port)를 구현한 디스크 결과 캐시 어댑터입니다.
+
+결과 DataFrame을 키별 피클 파일로 저장하고, 폴더 전체 크기가 한도를
+넘으면 가장 오래 사용하지 않은(LRU) 결과부터 지웁니다. 사용 순서는 파일
+수정 시각으로 기록하므로 프로세스를 다시 시작해도 유지됩니다.
+"""
+
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import pandas as pd
+
+from domain.ports.outbound import ResultCachePort
+
+
+@dataclass
+class ResultCacheStats:
+    """결과 캐시 사용 통계입니다.
+
+    Attributes:
+        hits (int): 캐시에서 바로 읽어온 결과 수.
+        misses (int): 캐시에 없어 계산해야 했던 결과 수.
+        evictions (int): 크기 한도로 지운 결과 수.
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class DiskResultCache(ResultCachePort):
+    """
+    결과 DataFrame을 폴더에 저장하는 크기 제한 LRU 캐시이자
+    ResultCachePort의 구현체(Adapter)입니다.
+
+    캐시 폴더 구조:
+        <cache_dir>/
+            <키>.pkl   # pandas 피클 (로컬 캐시 전용)
+    """
+
+    _SUFFIX = ".pkl"
+
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * 2**20):
+        """
+        Args:
+            cache_dir (str): 캐시 폴더 경로. 없으면 생성합니다.
+            max_bytes (int): 캐시 폴더 최대 크기(바이트). 넘으면 LRU 순으로 지웁니다.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.stats = ResultCacheStats()
+        self._lock = threading.Lock()
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # 키 -> 파일 크기 (오래 사용하지 않은 순)
+        self._entries: "OrderedDict[str, int]" = self._scan()
+        self._total_bytes = sum(self._entries.values())
+        print(f"[Adapter] DiskResultCache 초기화. 경로: {self.cache_dir} "
+              f"({len(self._entries)}개, {self._total_bytes / 2**20:.1f}/{self.max_bytes / 2**20:.0f}MiB)")
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """저장된 결과를 읽고, 사용 시각을 갱신합니다."""
+        path = self._path(key)
+        with self._lock:
+            if key not in self._entries:
+                self.stats.misses += 1
+                return None
+
+        try:
+            result_df = pd.read_pickle(path)
+            os.utime(path)
+        except Exception as e:
+            print(f"  🚨 [Adapter] 결과 캐시 파일 손상, 무시합니다: {path} ({e})")
+            with self._lock:
+                self._forget(key)
+                self.stats.misses += 1
+            return None
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self.stats.hits += 1
+        return result_df
+
+    def put(self, key: str, result_df: pd.DataFrame):
+        """결과를 저장합니다. (임시 파일 + rename으로 원자적 저장 후 LRU 정리)"""
+        path = self._path(key)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    result_df.to_pickle(f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            size = os.path.getsize(path)
+        except Exception as e:
+            # (캐시 저장 실패는 치명적이지 않음: 다음 실행에서 다시 계산)
+            print(f"  🚨 [Adapter] 결과 캐시 저장 실패: {key} ({e})")
+            return
+
+        with self._lock:
+            self._total_bytes += size - self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._evict()
+
+    def _evict(self):
+        """총 크기가 한도 이하가 될 때까지 가장 오래된 결과를 지웁니다. (lock 보유 상태)"""
+        while self._total_bytes > self.max_bytes and self._entries:
+            key = next(iter(self._entries))
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"  🚨 [Adapter] 결과 캐시 삭제 실패: {key} ({e})")
+                return
+            self._forget(key)
+            self.stats.evictions += 1
+
+    def _forget(self, key: str):
+        self._total_bytes -= self._entries.pop(key, 0)
+
+    def _scan(self) -> "OrderedDict[str, int]":
+        """폴더의 결과 파일들을 사용 시각(수정 시각) 순으로 읽어옵니다."""
+        found = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith(self._SUFFIX):
+                stat = entry.stat()
+                found.append((stat.st_mtime_ns, entry.name[:-len(self._SUFFIX)], stat.st_size))
+        found.sort()
+        return OrderedDict((key, size) for _, key, size in found)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}{self._SUFFIX}")
@@ -2,14 +2,24 @@
 엑셀(Excel) 어댑터입니다.
 """
 
+import time
+from typing import Collection, Dict, List, Optional
+
+import numpy as np
 import pandas as pd
-from domain.ports.outbound import FinancialDataSourcePort
-from domain.model.data_models import FinancialData
+from domain.ports.outbound import FinancialDataSourcePort, NullTracer, TracerPort
+from domain.model.data_models import FinancialData, FinancialPanel
+from domain.model.quarter import INVALID_ORDINAL, parse_quarter_labels
+from adapters.outbound.financial_data_cache import CacheStats, FinancialDataCache
 
 class ExcelFinancialDataSource(FinancialDataSourcePort):
     """
     로컬 엑셀 파일에서 재무 데이터를 로드하는 
     FinancialDataSourcePort의 구현체(Adapter)입니다.
+
+    첫 로드 시 각 시트를 바이너리 캐시(.npz)로 저장하고,
+    워크북이 바뀌지 않았다면 이후 로드는 캐시에서 바로 읽습니다.
+    요청된 지표(시트)와 분기(열)만 파싱/보관합니다.
     """
     
     _SHEET_MAP = {
@@ -18,46 +28,178 @@ class ExcelFinancialDataSource(FinancialDataSourcePort):
         "net_income": "당기순이익",
     }
 
-    def __init__(self, file_path: str):
+    def __init__(
+        self,
+        file_path: str,
+        use_cache: bool = True,
+        cache_dir: Optional[str] = None,
+        tracer: Optional[TracerPort] = None
+    ):
         """
         Args:
             file_path (str): 읽어올 '재무데이터_통합_최종.xlsx' 파일의 경로.
+            use_cache (bool): 바이너리 캐시 사용 여부.
+            cache_dir (Optional[str]): 캐시 폴더 경로. 없으면 워크북 옆에 생성합니다.
+            tracer (Optional[TracerPort]): 단계 계측용 트레이서. (없으면 계측 안 함)
         """
         self.file_path = file_path
+        self.tracer = tracer or NullTracer()
+        self.cache: Optional[FinancialDataCache] = (
+            FinancialDataCache(file_path, cache_dir) if use_cache else None
+        )
         print(f"[Adapter] ExcelDataSource 초기화. 대상 파일: {self.file_path}")
 
-    def load_financial_data(self) -> FinancialData:
-        """엑셀 파일에서 시트 3개를 로드하여 FinancialData 객체로 반환합니다.
+    @property
+    def cache_stats(self) -> Optional[CacheStats]:
+        """캐시 적중/미스/로드 시간 통계. (캐시 미사용 시 None)"""
+        return self.cache.stats if self.cache else None
+
+    def load_financial_data(
+        self,
+        metrics: Optional[Collection[str]] = None,
+        quarters: Optional[Collection[str]] = None
+    ) -> FinancialData:
+        """엑셀 파일에서 필요한 시트만 로드하여 FinancialData 객체로 반환합니다.
+
+        Args:
+            metrics (Optional[Collection[str]]): 로드할 지표(=시트 이름). None이면 3개 모두.
+            quarters (Optional[Collection[str]]): 남길 분기(열). None이면 모든 분기.
 
         Returns:
-            FinancialData: 3개의 DataFrame이 포함된 데이터 객체.
+            FinancialData: 요청한 지표들로 구성된 패널 데이터 객체.
+                (요청되지 않은 지표의 DataFrame 뷰는 빈 DataFrame)
         
         Raises:
             FileNotFoundError: 엑셀 파일을 찾을 수 없는 경우.
             Exception: 시트 로딩 중 오류가 발생한 경우.
         """
-        try:
-
-            all_sheets = pd.read_excel(
-                self.file_path, 
-                sheet_name=None,
-                index_col=0,
-                engine='openpyxl'
-            )
-
-            return FinancialData(
-                sales=all_sheets[self._SHEET_MAP["sales"]],
-                operating_profit=all_sheets[self._SHEET_MAP["operating_profit"]],
-                net_income=all_sheets[self._SHEET_MAP["net_income"]]
-            )
+        with self.tracer.span("excel.load_financial_data"):
+            start = time.perf_counter()
+            try:
+                sheet_names = [
+                    name for name in self._SHEET_MAP.values()
+                    if metrics is None or name in metrics
+                ]
+                sheets = self._load_sheets(sheet_names, quarters)
+
+                # 시트들을 한 번에 (종목 × 분기 × 지표) 패널로 정렬/변환
+                data = FinancialData(panel=FinancialPanel.from_frames(sheets))
         
-        except FileNotFoundError:
-            print(f"🚨 [Adapter] 엑셀 파일 없음: {self.file_path}")
-            raise
-        except KeyError as e:
-            print(f"🚨 [Adapter] 엑셀 시트 이름 오류: {e} 시트를 찾을 수 없습니다.")
-            print(f"  (필요한 시트: {list(self._SHEET_MAP.values())})")
-            raise
-        except Exception as e:
-            print(f"🚨 [Adapter] 엑셀 로드 중 알 수 없는 오류: {e}")
-            raise
\ No newline at end of file
+            except FileNotFoundError:
+                print(f"🚨 [Adapter] 엑셀 파일 없음: {self.file_path}")
+                raise
+            except KeyError as e:
+                print(f"🚨 [Adapter] 엑셀 시트 이름 오류: {e} 시트를 찾을 수 없습니다.")
+                print(f"  (필요한 시트: {list(self._SHEET_MAP.values())})")
+                raise
+            except Exception as e:
+                print(f"🚨 [Adapter] 엑셀 로드 중 알 수 없는 오류: {e}")
+                raise
+
+            elapsed = time.perf_counter() - start
+            if self.cache:
+                self.cache.stats.record_load(elapsed)
+                stats = self.cache.stats
+                print(f"[Adapter] 재무 데이터 로드 완료 ({elapsed:.3f}s, "
+                      f"캐시 적중 {stats.hits} / 미스 {stats.misses})")
+            print(f"[Adapter] 로드한 시트: {sheet_names} "
+                  f"(분기: {'전체' if quarters is None else len(quarters)})")
+            return data
+
+    def _load_sheets(
+        self,
+        sheet_names: List[str],
+        quarters: Optional[Collection[str]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """시트들을 캐시에서 읽고, 없는 시트만 엑셀에서 파싱합니다.
+
+        캐시를 사용하면 다른 분기 조합에도 재사용할 수 있도록 시트 전체를
+        파싱/저장한 뒤 분기를 잘라내고, 캐시를 쓰지 않으면 파싱 단계에서
+        필요한 열만 읽습니다.
+
+        Args:
+            sheet_names (List[str]): 읽어올 시트 이름 목록.
+            quarters (Optional[Collection[str]]): 남길 분기(열). None이면 전체.
+
+        Returns:
+            Dict[str, pd.DataFrame]: {시트_이름: DataFrame} 딕셔너리.
+
+        Raises:
+            KeyError: 워크북에 요청한 시트가 없는 경우.
+        """
+        sheets: Dict[str, pd.DataFrame] = {}
+        if self.cache:
+            for sheet_name in sheet_names:
+                cached = self.cache.load_sheet(sheet_name)
+                if cached is not None:
+                    sheets[sheet_name] = cached
+
+        missing = [name for name in sheet_names if name not in sheets]
+        if missing:
+            # (파싱 전에 지문을 구해야 파싱 도중 바뀐 워크북을 새 버전으로 저장하지 않음)
+            fingerprint = self.cache.fingerprint() if self.cache else None
+            with pd.ExcelFile(self.file_path, engine='openpyxl') as xls:
+                for sheet_name in missing:
+                    if sheet_name not in xls.sheet_names:
+                        raise KeyError(sheet_name)
+
+                for sheet_name in missing:
+                    usecols = None if self.cache else self._select_columns(xls, sheet_name, quarters)
+                    df = self._normalize_sheet(
+                        xls.parse(sheet_name=sheet_name, index_col=0, usecols=usecols)
+                    )
+                    if self.cache:
+                        self.cache.store_sheet(sheet_name, df, fingerprint)
+                    sheets[sheet_name] = df
+
+        if quarters is not None:
+            for sheet_name, df in sheets.items():
+                sheets[sheet_name] = df.loc[:, self._quarter_column_mask(df.columns, quarters)]
+
+        return sheets
+
+    def _select_columns(
+        self,
+        xls: pd.ExcelFile,
+        sheet_name: str,
+        quarters: Optional[Collection[str]]
+    ) -> Optional[List[int]]:
+        """헤더 행만 읽어 필요한 분기 열의 위치(+ 인덱스 열)를 계산합니다.
+
+        Returns:
+            Optional[List[int]]: pd.read_excel의 usecols. None이면 전체 열.
+        """
+        if quarters is None:
+            return None
+
+        header = xls.parse(sheet_name=sheet_name, nrows=0).columns
+        selected = self._quarter_column_mask(header, quarters)
+        return [0] + [position for position in np.flatnonzero(selected).tolist() if position > 0]
+
+    @staticmethod
+    def _quarter_column_mask(columns: pd.Index, quarters: Collection[str]) -> np.ndarray:
+        """요청한 분기에 해당하는 열의 마스크를 계산합니다.
+
+        라벨 표기가 달라도(예: "2023Q1"과 "2023/1Q") 같은 분기면 일치로 보며,
+        분기 라벨이 아닌 열 이름은 문자열이 정확히 같아야 일치합니다.
+
+        Returns:
+            np.ndarray: columns와 같은 길이의 bool 배열.
+        """
+        labels = pd.Index(columns).astype(str)
+        requested = pd.Index(list(quarters)).astype(str)
+        ordinals = parse_quarter_labels(requested)
+        return labels.isin(requested) | np.isin(
+            parse_quarter_labels(labels), ordinals[ordinals != INVALID_ORDINAL]
+        )
+
+    def _normalize_sheet(self, df: pd.DataFrame) -> pd.DataFrame:
+        """캐시 적중/미스와 무관하게 같은 형태가 되도록 시트를 정규화합니다.
+
+        - 인덱스(종목명)와 컬럼(분기)은 문자열
+        - 값은 float (숫자가 아닌 셀은 NaN)
+        """
+        df = df.apply(pd.to_numeric, errors='coerce').astype(float)
+        df.index = df.index.astype(str)
+        df.columns = df.columns.astype(str)
+        return df
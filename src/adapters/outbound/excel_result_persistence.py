@@ -5,53 +5,253 @@ Excel (.xlsx) 파일 저장 어댑터입니다.
 """
 
 import os
+import re
+import tempfile
+import numpy as np
 import pandas as pd
-from typing import Dict
-from domain.ports.outbound import ResultPersistencePort
+from typing import Dict, List, Optional
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from domain.ports.outbound import NullTracer, ResultBatch, ResultPersistencePort, TracerPort
 
 class ExcelResultPersistenceAdapter(ResultPersistencePort):
     """
     스크리닝 결과를 단일 .xlsx 파일의 여러 시트로 저장하는
     ResultPersistencePort의 구현체(Adapter)입니다.
+
+    첫 시트는 전략별 시트 이름과 통과 종목 수를 담은 요약(index) 시트입니다.
     """
-    def __init__(self, output_file_path: str):
+
+    SUMMARY_SHEET = "Summary"
+    # 엑셀 시트 이름 제한: 31자, 일부 특수문자 금지, 대소문자 구분 없이 중복 금지
+    _MAX_SHEET_NAME = 31
+    _INVALID_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+    def __init__(
+        self,
+        output_file_path: str,
+        tracer: Optional[TracerPort] = None,
+        write_only: bool = True
+    ):
         """
         Args:
             output_file_path (str): 저장할 .xlsx 파일의 전체 경로.
+            tracer (Optional[TracerPort]): 단계 계측용 트레이서. (없으면 계측 안 함)
+            write_only (bool): openpyxl write-only 모드로 시트를 한 행씩 스트리밍 저장할지 여부.
+                False면 pd.ExcelWriter로 워크북 전체를 메모리에 만든 뒤 저장합니다.
         """
         self.output_file_path = output_file_path
+        self.tracer = tracer or NullTracer()
+        self.write_only = write_only
         self.output_dir = os.path.dirname(output_file_path)
         print(f"[Adapter] ExcelResultPersistence 초기화. 저장 파일: {self.output_file_path}")
-        
+
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
             print(f"[Adapter] 생성된 출력 폴더: {self.output_dir}")
 
     def save_results(self, results: Dict[str, pd.DataFrame]):
         """결과 딕셔너리를 단일 Excel 파일의 여러 시트로 저장합니다."""
-        
-        print(f"\n[Adapter] {len(results)}개의 결과 Excel 파일로 저장 시작...")
-        
+        with self.tracer.span("excel.save_results"):
+            print(f"\n[Adapter] {len(results)}개의 결과 Excel 파일로 저장 시작...")
+
+            try:
+                sheet_names = self._assign_sheet_names(list(results))
+                if self.write_only:
+                    self._save_streaming(results, sheet_names)
+                else:
+                    self._save_in_memory(results, sheet_names)
+                print(f"  -> 저장 완료: {self.output_file_path}")
+
+            except Exception as e:
+                print(f"  🚨 저장 실패: {self.output_file_path} ({e})")
+
+    def begin_results(self, strategy_names: List[str]) -> ResultBatch:
+        """스트리밍 저장을 시작합니다.
+
+        write-only 모드에서는 결과가 도착하는 대로 시트를 바로 써 내려가고,
+        요약 시트는 end_results()에서 만들어 맨 앞으로 옮깁니다. 시트 이름은
+        도착 순서와 무관하도록 여기서 strategy_names 순서로 미리 정합니다.
+        (write-only 모드가 아니면 결과를 모아 두었다가 save_results()로 저장)
+        """
+        if not self.write_only:
+            return super().begin_results(strategy_names)
+
+        print(f"\n[Adapter] {len(strategy_names)}개의 결과 Excel 파일로 스트리밍 저장 시작...")
+        return _ExcelStreamBatch(self, strategy_names)
+
+    def _save_streaming(self, results: Dict[str, pd.DataFrame], sheet_names: Dict[str, str]):
+        """write-only 워크북에 시트를 하나씩 스트리밍합니다. (임시 파일 + rename)
+
+        write-only 시트는 행을 추가하는 즉시 디스크로 내보내므로, 메모리에는
+        한 번에 한 시트의 행 데이터만 머뭅니다.
+        """
+        workbook = Workbook(write_only=True)
+        self._write_summary(
+            workbook, {name: len(result_df) for name, result_df in results.items()}, sheet_names
+        )
+        for strategy_name, result_df in results.items():
+            self._write_sheet(workbook, sheet_names[strategy_name], result_df)
+        self._save_workbook(workbook)
+
+    def _write_summary(self, workbook: Workbook, pass_counts: Dict[str, int], sheet_names: Dict[str, str]):
+        """요약 시트: 전략 / 시트 링크 / 통과 종목 수"""
+        bold = Font(bold=True)
+        summary = workbook.create_sheet(self.SUMMARY_SHEET)
+        summary.append([self._header_cell(summary, text, bold)
+                        for text in ("Strategy", "Sheet", "Pass_Count")])
+        for strategy_name, pass_count in pass_counts.items():
+            link = WriteOnlyCell(summary, value=sheet_names[strategy_name])
+            link.hyperlink = "#'{}'!A1".format(sheet_names[strategy_name].replace("'", "''"))
+            summary.append([strategy_name, link, pass_count])
+
+    def _write_sheet(self, workbook: Workbook, sheet_name: str, result_df: pd.DataFrame):
+        """전략 시트: 첫 열은 인덱스(종목명), 첫 행은 헤더"""
+        bold = Font(bold=True)
+        worksheet = workbook.create_sheet(sheet_name)
+
+        index_label = "" if result_df.index.name is None else str(result_df.index.name)
+        worksheet.append([self._header_cell(worksheet, text, bold)
+                          for text in [index_label, *map(str, result_df.columns)]])
+
+        columns = [self._cell_values(result_df.index.to_series())]
+        columns += [self._cell_values(result_df.iloc[:, i]) for i in range(result_df.shape[1])]
+        for row in zip(*columns):
+            worksheet.append(row)
+        print(f"  -> '{sheet_name}' 시트 저장 완료.")
+
+    def _save_workbook(self, workbook: Workbook):
+        fd, tmp_path = tempfile.mkstemp(dir=self.output_dir or ".", suffix=".xlsx.tmp")
+        os.close(fd)
+        try:
+            workbook.save(tmp_path)
+            os.replace(tmp_path, self.output_file_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _save_in_memory(self, results: Dict[str, pd.DataFrame], sheet_names: Dict[str, str]):
+        """pd.ExcelWriter로 저장합니다. (워크북 전체를 메모리에 구성)"""
+        # (1) ExcelWriter 객체 생성
+        with pd.ExcelWriter(self.output_file_path, engine='openpyxl') as writer:
+            pd.DataFrame({
+                "Strategy": list(results),
+                "Sheet": [sheet_names[name] for name in results],
+                "Pass_Count": [len(result_df) for result_df in results.values()],
+            }).to_excel(writer, sheet_name=self.SUMMARY_SHEET, index=False)
+
+            for strategy_name, result_df in results.items():
+                sheet_name = sheet_names[strategy_name]
+
+                # (2) 각 DataFrame을 별도 시트에 저장
+                # (index=True: 종목명(인덱스)을 첫 번째 열로 저장)
+                result_df.to_excel(
+                    writer,
+                    sheet_name=sheet_name,
+                    index=True
+                )
+                print(f"  -> '{sheet_name}' 시트 저장 완료.")
+
+    @classmethod
+    def _assign_sheet_names(cls, strategy_names: List[str]) -> Dict[str, str]:
+        """전략 이름마다 엑셀에서 유효하고 서로 겹치지 않는 시트 이름을 정합니다.
+
+        금지 문자는 '_'로 바꾸고 앞 30자만 사용합니다. 잘린 이름이 앞선 전략
+        (또는 요약 시트)과 대소문자 구분 없이 겹치면 "~2", "~3", ... 을 붙이며,
+        결과 순서대로 한 번에 정하므로 같은 입력이면 항상 같은 이름이 됩니다.
+
+        Args:
+            strategy_names (List[str]): 결과 순서대로의 전략 이름 목록.
+
+        Returns:
+            Dict[str, str]: {전략_이름: 시트_이름}.
+        """
+        used = {cls.SUMMARY_SHEET.lower()}
+        assigned = {}
+        for strategy_name in strategy_names:
+            base = cls._INVALID_SHEET_CHARS.sub("_", strategy_name).strip("'") or "sheet"
+            sheet_name = base[:30]
+
+            counter = 1
+            while sheet_name.lower() in used:
+                counter += 1
+                suffix = f"~{counter}"
+                sheet_name = base[:cls._MAX_SHEET_NAME - len(suffix)] + suffix
+
+            used.add(sheet_name.lower())
+            assigned[strategy_name] = sheet_name
+        return assigned
+
+    @staticmethod
+    def _header_cell(worksheet, text: str, font: Font) -> WriteOnlyCell:
+        cell = WriteOnlyCell(worksheet, value=text)
+        cell.font = font
+        return cell
+
+    @staticmethod
+    def _cell_values(series: pd.Series) -> List:
+        """열 하나를 셀 값 목록으로 바꿉니다. (pd.ExcelWriter와 같은 표기)
+
+        NaN은 빈 칸, ±inf(적자 -> 흑자 성장률)는 문자열 "inf"/"-inf"로 씁니다.
+        """
+        values = series.to_numpy()
+        if values.dtype.kind != "f":
+            return [None if pd.isna(v) else v for v in values.tolist()]
+
+        cells = values.astype(object)
+        cells[np.isnan(values)] = None
+        cells[np.isposinf(values)] = "inf"
+        cells[np.isneginf(values)] = "-inf"
+        return cells.tolist()
+
+
+class _ExcelStreamBatch(ResultBatch):
+    """ExcelResultPersistenceAdapter의 write-only 스트리밍 저장 배치 하나입니다.
+
+    배치마다 자신의 write-only 워크북과 시트 이름/통과 종목 수를 가집니다.
+    """
+
+    def __init__(self, adapter: ExcelResultPersistenceAdapter, strategy_names: List[str]):
+        """
+        Args:
+            adapter (ExcelResultPersistenceAdapter): 시트 작성과 파일 저장을 맡을 어댑터.
+            strategy_names (List[str]): 시트 이름과 요약 순서를 정할 전략 이름들.
+        """
+        self.adapter = adapter
+        self._order = list(strategy_names)
+        self._sheet_names = adapter._assign_sheet_names(self._order)
+        self._counts: Dict[str, int] = {}
+        self._workbook = Workbook(write_only=True)
+
+    def save_result(self, strategy_name: str, result_df: pd.DataFrame):
+        """결과 하나를 시트로 바로 씁니다."""
+        if strategy_name not in self._sheet_names:
+            # (시작 때 알리지 않은 전략: 이미 정한 이름들과 겹치지 않게 이어서 정함)
+            self._order.append(strategy_name)
+            self._sheet_names = self.adapter._assign_sheet_names(self._order)
         try:
-            # (1) ExcelWriter 객체 생성
-            with pd.ExcelWriter(self.output_file_path, engine='openpyxl') as writer:
-                
-                for strategy_name, result_df in results.items():
-                    
-                    # (2) 시트 이름 생성 (파일 이름과 달리 31자 제한 고려)
-                    # (간단히 앞 30자만 사용)
-                    sheet_name = strategy_name[:30] 
-                    
-                    # (3) 각 DataFrame을 별도 시트에 저장
-                    # (index=True: 종목명(인덱스)을 첫 번째 열로 저장)
-                    result_df.to_excel(
-                        writer, 
-                        sheet_name=sheet_name, 
-                        index=True
-                    )
-                    print(f"  -> '{sheet_name}' 시트 저장 완료.")
-                    
-            print(f"  -> 저장 완료: {self.output_file_path}")
-            
+            self.adapter._write_sheet(self._workbook, self._sheet_names[strategy_name], result_df)
+            self._counts[strategy_name] = len(result_df)
         except Exception as e:
-            print(f"  🚨 저장 실패: {self.output_file_path} ({e})")
\ No newline at end of file
+            print(f"  🚨 시트 저장 실패: {strategy_name} ({e})")
+
+    def end_results(self):
+        """요약 시트를 붙이고 워크북을 저장합니다."""
+        adapter = self.adapter
+        with adapter.tracer.span("excel.end_results"):
+            workbook, self._workbook = self._workbook, None
+            try:
+                pass_counts = {
+                    name: self._counts[name] for name in self._order if name in self._counts
+                }
+                adapter._write_summary(workbook, pass_counts, self._sheet_names)
+
+                # (시트는 도착 순서로 쓰였으므로 요약 시트 + 전략 순서로 재배열)
+                order = [adapter.SUMMARY_SHEET] + [self._sheet_names[name] for name in pass_counts]
+                for position, sheet_name in enumerate(order):
+                    workbook.move_sheet(sheet_name, offset=position - workbook.sheetnames.index(sheet_name))
+                adapter._save_workbook(workbook)
+                print(f"  -> 저장 완료: {adapter.output_file_path}")
+            except Exception as e:
+                print(f"  🚨 저장 실패: {adapter.output_file_path} ({e})")
@@ -0,0 +1,290 @@
+"""엑셀 재무 데이터 시트를 바이너리 컬럼 포맷(.npz)으로 캐싱하는 모듈입니다.
+
+ExcelFinancialDataSource가 openpyxl 파싱 비용을 피하기 위해 사용합니다.
+캐시는 워크북 옆의 숨김 폴더에 시트별 파일로 저장되며,
+워크북의 지문(크기 + 수정 시각 + 내용 해시)이 바뀌면 자동으로 무효화됩니다.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class CacheStats:
+    """캐시 사용 통계입니다.
+
+    Attributes:
+        hits (int): 캐시에서 바로 읽어온 시트 수.
+        misses (int): 엑셀을 파싱해야 했던 시트 수.
+        invalidations (int): 워크북 변경으로 캐시를 폐기한 횟수.
+        last_load_seconds (float): 마지막 load_financial_data() 소요 시간(초).
+        total_load_seconds (float): 누적 로드 소요 시간(초).
+    """
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    last_load_seconds: float = 0.0
+    total_load_seconds: float = 0.0
+
+    def record_load(self, seconds: float):
+        """한 번의 로드 소요 시간을 기록합니다."""
+        self.last_load_seconds = seconds
+        self.total_load_seconds += seconds
+
+
+@dataclass(frozen=True)
+class WorkbookFingerprint:
+    """워크북 파일의 지문입니다. 크기, 수정 시각, 내용 해시가 모두 같아야 같은 파일로 봅니다.
+
+    Attributes:
+        size (int): 파일 크기(바이트).
+        mtime_ns (int): 수정 시각(나노초).
+        sha256 (str): 파일 내용의 SHA-256 해시.
+        checked_ns (int): 해시 계산을 시작한 시각(나노초). (이전 manifest에는 없으므로 0)
+    """
+    size: int
+    mtime_ns: int
+    sha256: str
+    checked_ns: int = 0
+
+    def same_file(self, other: Optional["WorkbookFingerprint"]) -> bool:
+        """checked_ns를 제외한 세 값이 같은지 확인합니다."""
+        return other is not None and (
+            (self.size, self.mtime_ns, self.sha256) == (other.size, other.mtime_ns, other.sha256)
+        )
+
+
+class FinancialDataCache:
+    """워크북 한 개에 대한 시트별 .npz 캐시입니다.
+
+    캐시 폴더 구조:
+        .<워크북 파일명>.cache/
+            manifest.json   # WorkbookFingerprint
+            매출액.npz       # index / columns / values / index_name
+            ...
+    """
+
+    _MANIFEST_FILE = "manifest.json"
+
+    # 파일 시스템 수정 시각 해상도의 최악값 (FAT: 2초). 이 구간 안의 stat은 믿지 않음
+    MTIME_GRANULARITY_NS = 2 * 10**9
+
+    def __init__(self, workbook_path: str, cache_dir: Optional[str] = None):
+        """
+        Args:
+            workbook_path (str): 원본 엑셀 파일 경로.
+            cache_dir (Optional[str]): 캐시 폴더 경로. 없으면 워크북 옆에 생성합니다.
+        """
+        self.workbook_path = workbook_path
+        if cache_dir is None:
+            directory, filename = os.path.split(os.path.abspath(workbook_path))
+            cache_dir = os.path.join(directory, f".{filename}.cache")
+        self.cache_dir = cache_dir
+        self.stats = CacheStats()
+
+        # (같은 프로세스 안에서 해시를 반복 계산하지 않도록 stat 기준으로 기억)
+        self._verified_stat: Optional[tuple] = None
+        self._fingerprint: Optional[WorkbookFingerprint] = None
+
+    def load_sheet(self, sheet_name: str) -> Optional[pd.DataFrame]:
+        """캐시된 시트를 읽어옵니다.
+
+        Args:
+            sheet_name (str): 시트 이름 (예: "영업이익").
+
+        Returns:
+            Optional[pd.DataFrame]: 캐시 적중 시 DataFrame, 없거나 무효하면 None.
+        """
+        sheet_path = self._sheet_path(sheet_name)
+        if not self._ensure_fresh() or not os.path.exists(sheet_path):
+            self.stats.misses += 1
+            return None
+
+        try:
+            with np.load(sheet_path, allow_pickle=False) as npz:
+                index_name = str(npz["index_name"][0]) or None
+                df = pd.DataFrame(
+                    npz["values"],
+                    index=pd.Index(npz["index"].astype(object), name=index_name),
+                    columns=pd.Index(npz["columns"].astype(object)),
+                )
+        except Exception as e:
+            print(f"  🚨 [Adapter] 캐시 파일 손상, 무시합니다: {sheet_path} ({e})")
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        return df
+
+    def fingerprint(self) -> Optional[WorkbookFingerprint]:
+        """워크북을 파싱하기 전에 호출해, 파싱할 버전의 지문을 구합니다.
+
+        Returns:
+            Optional[WorkbookFingerprint]: 현재 워크북의 지문. 파일 오류가 나면 None.
+        """
+        try:
+            return self._current_fingerprint()
+        except OSError as e:
+            print(f"  🚨 [Adapter] 워크북 지문 계산 실패, 캐시에 저장하지 않습니다: {e}")
+            return None
+
+    def store_sheet(
+        self,
+        sheet_name: str,
+        df: pd.DataFrame,
+        fingerprint: Optional[WorkbookFingerprint]
+    ):
+        """파싱한 시트를 캐시에 저장합니다. (임시 파일 + rename으로 원자적 저장)
+
+        파싱하는 사이 워크북이 바뀌었으면(stat이 fingerprint와 다르면) 이전 버전의
+        데이터가 새 버전의 지문으로 저장되지 않도록 저장하지 않습니다.
+
+        Args:
+            sheet_name (str): 시트 이름.
+            df (pd.DataFrame): 숫자형으로 정규화된 시트 데이터.
+            fingerprint (Optional[WorkbookFingerprint]): 파싱 전에 구한 지문. (fingerprint())
+                None이면 저장하지 않습니다.
+        """
+        if fingerprint is None:
+            return
+
+        try:
+            stat = os.stat(self.workbook_path)
+            if (stat.st_size, stat.st_mtime_ns) != (fingerprint.size, fingerprint.mtime_ns):
+                print(f"  🚨 [Adapter] 파싱 중 워크북 변경 감지, 캐시에 저장하지 않습니다: {sheet_name}")
+                return
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+            manifest = self._read_manifest()
+            if not fingerprint.same_file(manifest):
+                # (다른 워크북 버전의 시트 파일이 섞이지 않도록 먼저 비움)
+                self._clear_sheets()
+                self._atomic_write_text(
+                    self._manifest_path(), json.dumps(asdict(fingerprint))
+                )
+
+            index_name = "" if df.index.name is None else str(df.index.name)
+            self._atomic_write_npz(
+                self._sheet_path(sheet_name),
+                index=df.index.astype(str).to_numpy(dtype=str),
+                columns=df.columns.astype(str).to_numpy(dtype=str),
+                values=np.ascontiguousarray(df.to_numpy(dtype=np.float64)),
+                index_name=np.array([index_name]),
+            )
+        except OSError as e:
+            # (캐시 저장 실패는 치명적이지 않음: 다음 실행에서 다시 파싱)
+            print(f"  🚨 [Adapter] 캐시 저장 실패: {sheet_name} ({e})")
+
+    def _ensure_fresh(self) -> bool:
+        """캐시가 현재 워크북과 일치하는지 확인하고, 다르면 폐기합니다.
+
+        stat(크기, 수정 시각)이 같고 해시를 수정 시각보다 해상도 구간 이상 뒤에
+        계산했다면 해시 계산 없이 유효로 판단합니다. 구간 안에서 계산한 지문은
+        같은 구간 안에 같은 크기로 다시 쓴 파일과 stat으로 구분할 수 없으므로
+        해시를 다시 비교합니다. 내용 해시가 같으면(예: touch, 복사) manifest만 갱신합니다.
+
+        캐시 폴더에 쓸 수 없는 등 파일 오류가 나면(읽기 전용, 디스크 가득 참 등)
+        False를 반환해 캐시 없이 엑셀을 파싱합니다. (store_sheet와 같은 best-effort)
+
+        Returns:
+            bool: 캐시를 사용할 수 있으면 True.
+        """
+        manifest = self._read_manifest()
+        if manifest is None:
+            return False
+
+        try:
+            stat = os.stat(self.workbook_path)
+            if ((stat.st_size, stat.st_mtime_ns) == (manifest.size, manifest.mtime_ns)
+                    and self._stat_trusted(manifest)):
+                return True
+
+            fingerprint = self._current_fingerprint()
+            if fingerprint.sha256 == manifest.sha256:
+                if fingerprint != manifest:
+                    self._atomic_write_text(self._manifest_path(), json.dumps(asdict(fingerprint)))
+                return True
+
+            print(f"[Adapter] 워크북 변경 감지. 캐시를 폐기합니다: {self.cache_dir}")
+            self.stats.invalidations += 1
+            self._clear_sheets()
+            os.remove(self._manifest_path())
+            return False
+        except OSError as e:
+            print(f"  🚨 [Adapter] 캐시 확인 실패, 캐시 없이 읽습니다: {self.cache_dir} ({e})")
+            return False
+
+    @classmethod
+    def _stat_trusted(cls, fingerprint: WorkbookFingerprint) -> bool:
+        """stat 일치만으로 지문의 내용 해시를 믿을 수 있는지 확인합니다. (racily-clean 방지)"""
+        return fingerprint.checked_ns - fingerprint.mtime_ns >= cls.MTIME_GRANULARITY_NS
+
+    def _current_fingerprint(self) -> WorkbookFingerprint:
+        """현재 워크북의 지문을 계산합니다. (stat이 같고 믿을 수 있으면 이전 계산 재사용)"""
+        stat = os.stat(self.workbook_path)
+        stat_key = (stat.st_size, stat.st_mtime_ns)
+        if (self._fingerprint is not None and self._verified_stat == stat_key
+                and self._stat_trusted(self._fingerprint)):
+            return self._fingerprint
+
+        # (읽기 전에 시각을 기록: 읽는 도중의 수정도 해상도 구간 안으로 잡힘)
+        checked_ns = time.time_ns()
+        digest = hashlib.sha256()
+        with open(self.workbook_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+
+        self._verified_stat = stat_key
+        self._fingerprint = WorkbookFingerprint(
+            size=stat.st_size, mtime_ns=stat.st_mtime_ns, sha256=digest.hexdigest(),
+            checked_ns=checked_ns
+        )
+        return self._fingerprint
+
+    def _read_manifest(self) -> Optional[WorkbookFingerprint]:
+        try:
+            with open(self._manifest_path(), "r", encoding="utf-8") as f:
+                return WorkbookFingerprint(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _clear_sheets(self):
+        if not os.path.isdir(self.cache_dir):
+            return
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith(".npz"):
+                os.remove(os.path.join(self.cache_dir, filename))
+
+    def _manifest_path(self) -> str:
+        return os.path.join(self.cache_dir, self._MANIFEST_FILE)
+
+    def _sheet_path(self, sheet_name: str) -> str:
+        return os.path.join(self.cache_dir, f"{sheet_name}.npz")
+
+    def _atomic_write_npz(self, path: str, **arrays: np.ndarray):
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _atomic_write_text(self, path: str, text: str):
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
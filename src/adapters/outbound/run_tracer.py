@@ -0,0 +1,201 @@
+"""TracerPort(Outbound Port)를 구현한 실행 계측 어댑터입니다.
+
+각 구간(span)의 경과 시간(wall), CPU 시간, tracemalloc 기준 최대 메모리
+사용량을 기록하고, 실행 리포트를 JSON으로 저장합니다.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional
+
+from domain.ports.outbound import TracerPort
+
+
+@dataclass
+class SpanRecord:
+    """계측된 구간 하나의 기록입니다.
+
+    Attributes:
+        name (str): 구간 이름.
+        category (str): 구간 분류 (예: "stage", "strategy").
+        parent (Optional[str]): 같은 스레드에서 감싸고 있는 상위 구간 이름.
+        depth (int): 중첩 깊이 (최상위 0).
+        thread (str): 구간이 실행된 스레드 이름.
+        start_offset_seconds (float): 트레이서 생성 시점 기준 구간 시작 시각(초).
+        wall_seconds (float): 경과 시간(초).
+        cpu_seconds (Optional[float]): 프로세스 CPU 시간(초). (외부 기록이면 None)
+        peak_memory_bytes (Optional[int]): 구간 시작 대비 최대 추가 메모리(바이트).
+    """
+    name: str
+    category: str
+    parent: Optional[str]
+    depth: int
+    thread: str
+    start_offset_seconds: float
+    wall_seconds: float
+    cpu_seconds: Optional[float] = None
+    peak_memory_bytes: Optional[int] = None
+
+
+class _OpenSpan:
+    """진행 중인 구간의 내부 상태입니다."""
+
+    __slots__ = ("name", "start_memory", "peak_memory")
+
+    def __init__(self, name: str, start_memory: int):
+        self.name = name
+        self.start_memory = start_memory
+        self.peak_memory = start_memory
+
+
+class RunTracer(TracerPort):
+    """
+    실행 단계별 시간/메모리를 기록하는 TracerPort의 구현체(Adapter)입니다.
+
+    메모리는 tracemalloc의 peak를 구간마다 초기화하는 방식으로 측정하며,
+    중첩 구간의 peak는 상위 구간에도 반영됩니다. tracemalloc은 프로세스
+    전역이므로 스레드 실행 모드에서는 메모리 값이 근사치가 됩니다.
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        """
+        Args:
+            trace_memory (bool): tracemalloc으로 메모리를 측정할지 여부.
+                (측정 중에는 모든 할당 비용이 늘어나 시간 측정도 왜곡되므로 명시적으로 켭니다)
+        """
+        self.trace_memory = trace_memory
+        self.records: List[SpanRecord] = []
+        self.started_at = datetime.now(timezone.utc)
+        self._origin = time.perf_counter()
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        print(f"[Adapter] RunTracer 초기화. 메모리 측정: {self.trace_memory}")
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str = "stage") -> Iterator[None]:
+        """with 블록을 하나의 구간으로 계측합니다."""
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+
+        start_memory = 0
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if parent:
+                parent.peak_memory = max(parent.peak_memory, peak)
+            tracemalloc.reset_peak()
+            start_memory = current
+
+        frame = _OpenSpan(name, start_memory)
+        stack.append(frame)
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            stack.pop()
+
+            peak_bytes = None
+            if self.trace_memory:
+                frame.peak_memory = max(frame.peak_memory, tracemalloc.get_traced_memory()[1])
+                peak_bytes = frame.peak_memory - frame.start_memory
+                if parent:
+                    parent.peak_memory = max(parent.peak_memory, frame.peak_memory)
+
+            self._append(SpanRecord(
+                name=name,
+                category=category,
+                parent=parent.name if parent else None,
+                depth=len(stack),
+                thread=threading.current_thread().name,
+                start_offset_seconds=wall_start - self._origin,
+                wall_seconds=wall,
+                cpu_seconds=cpu,
+                peak_memory_bytes=peak_bytes,
+            ))
+
+    def record(self, name: str, category: str, wall_seconds: float):
+        """외부에서 측정한 구간을 기록합니다. (CPU/메모리 정보 없음)"""
+        stack = self._stack()
+        self._append(SpanRecord(
+            name=name,
+            category=category,
+            parent=stack[-1].name if stack else None,
+            depth=len(stack),
+            thread=threading.current_thread().name,
+            start_offset_seconds=time.perf_counter() - wall_seconds - self._origin,
+            wall_seconds=wall_seconds,
+        ))
+
+    def report(self) -> Dict:
+        """전체 구간 기록과 분류별 합계를 담은 리포트를 만듭니다.
+
+        Returns:
+            Dict: {"started_at", "spans": [...], "totals": {분류: {...}}}.
+        """
+        with self._lock:
+            records = sorted(self.records, key=lambda rec: rec.start_offset_seconds)
+
+        totals: Dict[str, Dict] = {}
+        for rec in records:
+            total = totals.setdefault(rec.category, {"count": 0, "wall_seconds": 0.0})
+            total["count"] += 1
+            total["wall_seconds"] += rec.wall_seconds
+
+        return {
+            "started_at": self.started_at.isoformat(),
+            "trace_memory": self.trace_memory,
+            "spans": [asdict(rec) for rec in records],
+            "totals": totals,
+        }
+
+    def dump_json(self, path: str):
+        """리포트를 JSON 파일로 저장합니다.
+
+        Args:
+            path (str): 저장할 JSON 파일 경로.
+        """
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        print(f"[Adapter] 실행 리포트 저장 완료: {path}")
+
+    def print_summary(self):
+        """단계(stage) 구간과 전략 합계를 콘솔에 출력합니다."""
+        report = self.report()
+        print("\n--- [실행 계측 요약] ---")
+        for span in report["spans"]:
+            if span["category"] != "stage":
+                continue
+            memory = span["peak_memory_bytes"]
+            memory_text = "" if memory is None else f", peak +{memory / 2**20:.1f}MiB"
+            print(f"  {'  ' * span['depth']}{span['name']}: "
+                  f"{span['wall_seconds']:.3f}s (cpu {span['cpu_seconds']:.3f}s{memory_text})")
+
+        strategy_total = report["totals"].get("strategy")
+        if strategy_total:
+            print(f"  전략 {strategy_total['count']}개 합계: "
+                  f"{strategy_total['wall_seconds']:.3f}s")
+
+    def _stack(self) -> List[_OpenSpan]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _append(self, record: SpanRecord):
+        with self._lock:
+            self.records.append(record)
@@ -0,0 +1,148 @@
+"""TOML 전략 파일의 파싱 결과를 인덱스 파일 하나에 캐싱하는 모듈입니다.
+
+TomlStrategyLoader가 시작할 때마다 모든 TOML을 열어 파싱하는 비용을
+피하기 위해 사용합니다. 인덱스는 전략 폴더 안의 숨김 JSON 파일이며,
+파일명마다 (크기, 수정 시각, 내용 해시)와 파싱된 criteria 섹션을 담습니다.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import tomllib
+from typing import Dict, Optional, Tuple
+
+
+# (stat 크기, stat 수정 시각, 내용 SHA-256, criteria 섹션 또는 None, 오류 메시지 또는 None)
+ReadResult = Tuple[int, int, str, Optional[Dict], Optional[str]]
+
+
+class StrategyCompileCache:
+    """전략 폴더 하나에 대한 컴파일(파싱) 결과 인덱스입니다.
+
+    인덱스 파일 구조:
+        {
+            "version": 2,
+            "entries": {
+                "<파일명>.toml": {"size", "mtime_ns", "checked_ns", "sha256", "criteria": {...}},
+                ...
+            }
+        }
+    """
+
+    INDEX_SUFFIX = ".strategy_index.json"
+    # (파서가 같은 파일을 다르게 읽게 되면 올려서 이전 인덱스를 버림. 2: 분기 라벨 정규화)
+    VERSION = 2
+
+    # 파일 시스템 수정 시각 해상도의 최악값 (FAT: 2초). 이 구간 안의 stat은 믿지 않음
+    MTIME_GRANULARITY_NS = 2 * 10**9
+
+    def __init__(self, strategies_path: str, index_path: Optional[str] = None):
+        """
+        Args:
+            strategies_path (str): TOML 전략 폴더 경로.
+            index_path (Optional[str]): 인덱스 파일 경로. 없으면 전략 폴더 옆(상위 폴더)에
+                숨김 파일로 생성합니다. (예: strategies/active -> strategies/.active.strategy_index.json)
+        """
+        if index_path is None:
+            parent, folder = os.path.split(os.path.abspath(strategies_path))
+            index_path = os.path.join(parent, f".{folder}{self.INDEX_SUFFIX}")
+        self.index_path = index_path
+
+    def read_entries(self) -> Dict[str, Dict]:
+        """인덱스 항목들을 읽습니다. (없거나 손상/버전 불일치면 빈 딕셔너리)
+
+        Returns:
+            Dict[str, Dict]: {파일명: 항목} 딕셔너리.
+        """
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(index, dict) or index.get("version") != self.VERSION:
+            return {}
+        entries = index.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def write_entries(self, entries: Dict[str, Dict]):
+        """인덱스를 저장합니다. (임시 파일 + rename으로 원자적 저장)
+
+        JSON으로 표현할 수 없는 값(예: TOML 날짜)이 든 항목은 저장하지 않고,
+        다음 실행에서 다시 파싱합니다.
+
+        Args:
+            entries (Dict[str, Dict]): {파일명: 항목} 딕셔너리.
+        """
+        serializable = {}
+        for filename, entry in entries.items():
+            try:
+                json.dumps(entry)
+            except (TypeError, ValueError):
+                continue
+            serializable[filename] = entry
+
+        directory = os.path.dirname(os.path.abspath(self.index_path))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"version": self.VERSION, "entries": serializable},
+                              f, ensure_ascii=False)
+                os.replace(tmp_path, self.index_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            # (인덱스 저장 실패는 치명적이지 않음: 다음 실행에서 다시 파싱)
+            print(f"  🚨 [Adapter] 전략 인덱스 저장 실패: {self.index_path} ({e})")
+
+    @classmethod
+    def is_fresh(cls, entry: Optional[Dict], stat: os.stat_result) -> bool:
+        """stat(크기, 수정 시각)이 인덱스 항목과 같고, 그 stat을 믿을 수 있는지 확인합니다.
+
+        파일을 읽은 시각(checked_ns)이 수정 시각과 해상도 구간(MTIME_GRANULARITY_NS)
+        안에 있었다면, 읽은 직후 같은 크기로 고쳐도 수정 시각이 같을 수 있습니다.
+        이런 항목은 stat이 같아도 다시 읽어 내용 해시를 비교합니다. (git의 racy-clean 처리)
+        """
+        if entry is None or (
+            (entry.get("size"), entry.get("mtime_ns")) != (stat.st_size, stat.st_mtime_ns)
+        ):
+            return False
+        checked_ns = entry.get("checked_ns")
+        return checked_ns is not None and checked_ns - stat.st_mtime_ns >= cls.MTIME_GRANULARITY_NS
+
+
+def read_strategy_file(file_path: str, known_sha256: Optional[str] = None) -> ReadResult:
+    """TOML 파일을 읽어 해시를 계산하고 criteria 섹션을 파싱합니다.
+
+    프로세스 풀에서도 호출할 수 있도록 모듈 최상위 함수로 둡니다.
+    내용 해시가 known_sha256과 같으면(예: touch, 복사) 파싱을 건너뜁니다.
+
+    Args:
+        file_path (str): TOML 파일 경로.
+        known_sha256 (Optional[str]): 인덱스에 기록된 이전 내용 해시.
+
+    Returns:
+        ReadResult: (크기, 수정 시각, 해시, criteria 섹션, 오류 메시지).
+            해시가 같아 파싱을 건너뛰면 criteria와 오류가 모두 None입니다.
+    """
+    stat = os.stat(file_path)
+    with open(file_path, "rb") as f:
+        raw = f.read()
+    sha256 = hashlib.sha256(raw).hexdigest()
+
+    if sha256 == known_sha256:
+        return stat.st_size, stat.st_mtime_ns, sha256, None, None
+
+    try:
+        config = tomllib.loads(raw.decode("utf-8"))
+    except (UnicodeDecodeError, tomllib.TOMLDecodeError) as e:
+        return stat.st_size, stat.st_mtime_ns, sha256, None, str(e)
+
+    criteria_data = config.get("criteria")
+    if not criteria_data:
+        return stat.st_size, stat.st_mtime_ns, sha256, None, "TOML에 'criteria' 섹션이 없습니다."
+    return stat.st_size, stat.st_mtime_ns, sha256, criteria_data, None
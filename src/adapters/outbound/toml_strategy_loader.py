@@ -4,11 +4,15 @@ TOML 파일 어댑터입니다.
 
 import glob
 import os
-from typing import Dict
-import tomllib
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional
 
-from domain.ports.outbound import StrategyLoaderPort
-from domain.model.criteria import Criteria, QoQCriteria
+from adapters.outbound.strategy_compile_cache import ReadResult, StrategyCompileCache, read_strategy_file
+from domain.ports.outbound import NullTracer, StrategyLoaderPort, TracerPort
+from domain.model.criteria import Criteria
+from domain.model.criteria_parser import parse_criteria
 
 
 class TomlStrategyLoader(StrategyLoaderPort):
@@ -16,44 +20,129 @@ class TomlStrategyLoader(StrategyLoaderPort):
     TOML 파일 시스템으로부터 'active' 전략을 로드하는 
     StrategyLoaderPort의 구현체(Adapter)입니다.
     """
-    def __init__(self, active_strategies_path: str):
+    def __init__(
+        self,
+        active_strategies_path: str,
+        tracer: Optional[TracerPort] = None,
+        use_index: bool = True,
+        index_path: Optional[str] = None,
+        parallel_threshold: int = 1024,
+        max_workers: Optional[int] = None
+    ):
         """
         Args:
             active_strategies_path (str): 'strategies/active' 폴더 경로.
+            tracer (Optional[TracerPort]): 단계 계측용 트레이서. (없으면 계측 안 함)
+            use_index (bool): 파싱 결과 인덱스(StrategyCompileCache) 사용 여부.
+            index_path (Optional[str]): 인덱스 파일 경로. 없으면 전략 폴더 옆에 생성합니다.
+            parallel_threshold (int): 다시 읽어야 할 파일이 이 개수 이상이면
+                프로세스 풀에서 병렬로 파싱합니다. (인덱스가 비어 있는 첫 실행 등)
+            max_workers (Optional[int]): 병렬 파싱 워커 수. None이면 CPU 개수.
         """
         self.active_path = active_strategies_path
+        self.tracer = tracer or NullTracer()
+        self.compile_cache = StrategyCompileCache(active_strategies_path, index_path) if use_index else None
+        self.parallel_threshold = parallel_threshold
+        self.max_workers = max_workers
         print(f"[Adapter] TomlStrategyLoader 초기화. Active 경로: {self.active_path}")
 
     def load_active_strategies(self) -> Dict[str, Criteria]:
         """'active' 폴더에서 TOML을 스캔하여 Criteria 객체 딕셔너리를 생성합니다.
 
+        인덱스를 사용하면 stat(크기, 수정 시각)이 그대로인 파일은 열지 않고
+        인덱스의 criteria 섹션을 사용하며, 새로 생겼거나 바뀐 파일만 다시 읽습니다.
+        (마지막으로 읽을 때 막 수정된 파일은 stat이 같아도 내용 해시로 확인)
+        전략 순서는 파일명 순으로 고정됩니다.
+
         Returns:
             Dict[str, Criteria]: {전략_이름: Criteria_객체} 딕셔너리.
         """
-        strategies = {}
-        search_path = os.path.join(self.active_path, "*.toml")
-        
-        for file_path in glob.glob(search_path):
-            strategy_name = os.path.basename(file_path).replace('.toml', '')
-            
+        with self.tracer.span("toml.load_active_strategies"):
+            search_path = os.path.join(self.active_path, "*.toml")
+            file_paths = sorted(glob.glob(search_path))
+
+            index = self.compile_cache.read_entries() if self.compile_cache else {}
+            entries: Dict[str, Dict] = {}
+            stale_paths = []
+            for file_path in file_paths:
+                filename = os.path.basename(file_path)
+                entry = index.get(filename)
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                if StrategyCompileCache.is_fresh(entry, stat):
+                    entries[filename] = entry
+                else:
+                    stale_paths.append(file_path)
+
+            reparsed, reused = 0, len(file_paths) - len(stale_paths)
+            # (읽기 전에 잰 시각: 실제로 읽은 시각보다 이르므로 racy 판정이 보수적)
+            checked_ns = time.time_ns()
+            for file_path, (size, mtime_ns, sha256, criteria_data, error) in zip(
+                stale_paths, self._read_files(stale_paths, index)
+            ):
+                filename = os.path.basename(file_path)
+                if error is not None:
+                    print(f"🚨 [Adapter] '{filename.replace('.toml', '')}' (Active) 전략 로드 실패: {error}")
+                    continue
+                if criteria_data is None:
+                    # (내용이 같으면 이전 파싱 결과를 그대로 사용)
+                    criteria_data = index[filename].get("criteria")
+                    reused += 1
+                else:
+                    reparsed += 1
+                entries[filename] = {
+                    "size": size, "mtime_ns": mtime_ns, "checked_ns": checked_ns,
+                    "sha256": sha256, "criteria": criteria_data
+                }
+
+            strategies = {}
+            for filename in list(entries):
+                strategy_name = filename.replace('.toml', '')
+                try:
+                    strategies[strategy_name] = self._parse_criteria_config(
+                        {"criteria": entries[filename]["criteria"]}
+                    )
+                except Exception as e:
+                    print(f"🚨 [Adapter] '{strategy_name}' (Active) 전략 로드 실패: {e}")
+                    del entries[filename]
+
+            if self.compile_cache and entries != index:
+                self.compile_cache.write_entries(entries)
+
+            print(f"[Adapter] {len(strategies)}개의 Active 전략 로드 완료. "
+                  f"(파싱 {reparsed}개, 인덱스 재사용 {reused}개)")
+            return strategies
+
+    def _read_files(self, file_paths: List[str], index: Dict[str, Dict]) -> List[ReadResult]:
+        """TOML 파일들을 읽고 파싱합니다. 개수가 많으면 프로세스 풀을 사용합니다."""
+        known = [index.get(os.path.basename(p), {}).get("sha256") for p in file_paths]
+        if len(file_paths) < self.parallel_threshold:
+            return [self._read_file(p, sha) for p, sha in zip(file_paths, known)]
+
+        with self.tracer.span("toml.parallel_parse"):
+            workers = self.max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(file_paths) // (workers * 4))
             try:
-                with open(file_path, "rb") as f:
-                    config = tomllib.load(f)
-                
-                criteria = self._parse_criteria_config(config)
-                strategies[strategy_name] = criteria
-
-            except Exception as e:
-                print(f"🚨 [Adapter] '{strategy_name}' (Active) 전략 로드 실패: {e}")
-                
-        print(f"[Adapter] {len(strategies)}개의 Active 전략 로드 완료.")
-        return strategies
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    return list(pool.map(read_strategy_file, file_paths, known, chunksize=chunksize))
+            except (OSError, BrokenProcessPool) as e:
+                print(f"  🚨 [Adapter] 병렬 파싱 실패, 순차 파싱으로 전환합니다: {e}")
+                return [self._read_file(p, sha) for p, sha in zip(file_paths, known)]
+
+    @staticmethod
+    def _read_file(file_path: str, known_sha256: Optional[str]) -> ReadResult:
+        try:
+            return read_strategy_file(file_path, known_sha256)
+        except OSError as e:
+            return 0, 0, "", None, str(e)
 
     def _parse_criteria_config(self, config: Dict) -> Criteria:
         """TOML config 딕셔너리를 적절한 Criteria 객체로 파싱합니다.
         
         Args:
-            config (Dict): tomllib.load()로 읽어온 딕셔너리.
+            config (Dict): tomllib으로 읽어온 딕셔너리. (최소한 'criteria' 섹션 포함)
 
         Returns:
             Criteria: 파싱된 Criteria 객체 (예: QoQCriteria).
@@ -64,15 +153,4 @@ class TomlStrategyLoader(StrategyLoaderPort):
         criteria_data = config.get('criteria')
         if not criteria_data:
             raise ValueError("TOML에 'criteria' 섹션이 없습니다.")
-            
-        criteria_type = criteria_data.get('type')
-
-        if criteria_type == 'QoQ_Growth':
-            return QoQCriteria(
-                metric=criteria_data['metric'],
-                base_quarter=criteria_data['base_quarter'],
-                target_quarter=criteria_data['target_quarter'],
-                min_growth_pct=criteria_data['min_growth_pct']
-            )
-        
-        raise ValueError(f"알 수 없는 Criteria type ({criteria_type})")
\ No newline at end of file
+        return parse_criteria(criteria_data)
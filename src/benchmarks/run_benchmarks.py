@@ -0,0 +1,225 @@
+"""스크리닝 파이프라인 벤치마크 실행기입니다.
+
+합성 데이터로 각 단계(엑셀 로드, TOML 로드, 성장률 계산, 결과 빌드,
+전체 실행, 결과 저장)를 규모별로 측정하고, 실행 간 비교가 가능하도록
+결과를 JSON으로 저장합니다.
+
+사용 예 (저장소 루트에서):
+    PYTHONPATH=src python -m benchmarks.run_benchmarks --scales 1000,10000 --output bench.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from adapters.outbound.columnar_result_persistence import ColumnarResultPersistenceAdapter
+from adapters.outbound.csv_result_persistence import CsvResultPersistenceAdapter
+from adapters.outbound.excel_data_source import ExcelFinancialDataSource
+from adapters.outbound.excel_result_persistence import ExcelResultPersistenceAdapter
+from adapters.outbound.toml_strategy_loader import TomlStrategyLoader
+from domain.service.screening_service import QuantScreeningService
+
+from benchmarks.synthetic_data import (
+    InMemoryDataSource,
+    InMemoryStrategyLoader,
+    generate_financial_data,
+    generate_strategies,
+    write_strategy_files,
+    write_workbook,
+)
+
+
+BENCHMARKS = (
+    "excel_load",
+    "excel_load_cached",
+    "toml_strategy_loading",
+    "toml_strategy_loading_indexed",
+    "safe_growth_rate",
+    "build_qoq_result_dataframe",
+    "run_all_active_strategies",
+    "csv_persistence",
+    "excel_persistence",
+    "columnar_persistence",
+)
+
+
+def measure(
+    func: Callable[[], object],
+    repeat: int,
+    setup: Optional[Callable[[], None]] = None
+) -> Dict[str, float]:
+    """함수를 repeat번 실행해 소요 시간 통계를 반환합니다. (setup은 측정 제외)
+
+    어댑터들의 print 출력은 측정을 방해하지 않도록 버립니다.
+    """
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            samples.append(time.perf_counter() - start)
+
+    return {
+        "repeat": repeat,
+        "min_s": min(samples),
+        "median_s": statistics.median(samples),
+        "mean_s": statistics.fmean(samples),
+        "max_s": max(samples),
+    }
+
+
+def run_scale(
+    n_tickers: int,
+    n_quarters: int,
+    n_strategies: int,
+    repeat: int,
+    selected: List[str],
+    work_dir: str
+) -> List[Dict]:
+    """한 규모(종목 수)에 대해 선택된 벤치마크를 실행합니다."""
+    data = generate_financial_data(n_tickers, n_quarters)
+    quarters = list(data.panel.quarters)
+    strategies = generate_strategies(quarters, n_strategies)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        service = QuantScreeningService(
+            data_source=InMemoryDataSource(data),
+            strategy_loader=InMemoryStrategyLoader(strategies),
+        )
+
+    base = service.panel.column("영업이익", quarters[-2])
+    target = service.panel.column("영업이익", quarters[-1])
+    rate = service._safe_growth_rate(base, target)
+
+    cases: Dict[str, Dict] = {}
+
+    # (어댑터 초기화 로그는 벤치마크 출력에서 제외)
+    with contextlib.redirect_stdout(io.StringIO()):
+        if {"excel_load", "excel_load_cached"} & set(selected):
+            workbook = os.path.join(work_dir, f"bench_{n_tickers}.xlsx")
+            cache_dir = os.path.join(work_dir, f"bench_{n_tickers}.cache")
+            write_workbook(data, workbook)
+
+            if "excel_load" in selected:
+                source = ExcelFinancialDataSource(workbook, use_cache=False)
+                cases["excel_load"] = {"func": source.load_financial_data}
+            if "excel_load_cached" in selected:
+                cached = ExcelFinancialDataSource(workbook, cache_dir=cache_dir)
+                cached.load_financial_data()  # 캐시 워밍
+                cases["excel_load_cached"] = {"func": cached.load_financial_data}
+
+        if {"toml_strategy_loading", "toml_strategy_loading_indexed"} & set(selected):
+            strategy_dir = os.path.join(work_dir, f"strategies_{n_tickers}")
+            write_strategy_files(strategies, strategy_dir)
+
+            loader = TomlStrategyLoader(strategy_dir, use_index=False)
+            cases["toml_strategy_loading"] = {"func": loader.load_active_strategies}
+
+            indexed = TomlStrategyLoader(strategy_dir)
+            indexed.load_active_strategies()  # 인덱스 워밍
+            cases["toml_strategy_loading_indexed"] = {"func": indexed.load_active_strategies}
+
+        cases["safe_growth_rate"] = {"func": lambda: service._safe_growth_rate(base, target)}
+        cases["build_qoq_result_dataframe"] = {
+            "func": lambda: service._build_qoq_result_dataframe(base, target, rate, 0.0, "영업이익")
+        }
+        cases["run_all_active_strategies"] = {"func": service.run_all_active_strategies}
+
+        if {"csv_persistence", "excel_persistence", "columnar_persistence"} & set(selected):
+            results = service.run_all_active_strategies()
+
+            csv_dir = os.path.join(work_dir, f"csv_{n_tickers}")
+            csv_adapter = CsvResultPersistenceAdapter(csv_dir)
+
+            def reset_csv_dir():
+                shutil.rmtree(csv_dir, ignore_errors=True)
+                os.makedirs(csv_dir)
+
+            cases["csv_persistence"] = {
+                "func": lambda: csv_adapter.save_results(results),
+                "setup": reset_csv_dir,
+            }
+
+            xlsx_adapter = ExcelResultPersistenceAdapter(os.path.join(work_dir, f"results_{n_tickers}.xlsx"))
+            cases["excel_persistence"] = {"func": lambda: xlsx_adapter.save_results(results)}
+
+            columnar_adapter = ColumnarResultPersistenceAdapter(
+                os.path.join(work_dir, f"results_{n_tickers}.npz")
+            )
+            cases["columnar_persistence"] = {"func": lambda: columnar_adapter.save_results(results)}
+
+    records = []
+    for name in selected:
+        case = cases.get(name)
+        if case is None:
+            continue
+        stats = measure(case["func"], repeat, case.get("setup"))
+        records.append({
+            "benchmark": name,
+            "tickers": n_tickers,
+            "quarters": n_quarters,
+            "strategies": n_strategies,
+            **stats,
+        })
+        print(f"  {name:<28} tickers={n_tickers:<7} median={stats['median_s'] * 1000:10.2f}ms")
+    return records
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="퀀트 스크리닝 파이프라인 벤치마크")
+    parser.add_argument("--scales", default="1000,10000,100000",
+                        help="종목 수 목록 (쉼표 구분)")
+    parser.add_argument("--quarters", type=int, default=20, help="분기 수")
+    parser.add_argument("--strategies", type=int, default=50, help="전략 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 측정 횟수")
+    parser.add_argument("--only", default=",".join(BENCHMARKS),
+                        help=f"실행할 벤치마크 (쉼표 구분, 기본: 전체 {BENCHMARKS})")
+    parser.add_argument("--output", default="bench_output.json", help="결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    selected = [name for name in args.only.split(",") if name]
+    unknown = set(selected) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"알 수 없는 벤치마크: {sorted(unknown)}")
+
+    records = []
+    with tempfile.TemporaryDirectory(prefix="quant_bench_") as work_dir:
+        for scale in (int(s) for s in args.scales.split(",") if s):
+            print(f"[Bench] 종목 {scale}개 × 분기 {args.quarters}개")
+            records.extend(run_scale(
+                scale, args.quarters, args.strategies, args.repeat, selected, work_dir
+            ))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "args": vars(args),
+        },
+        "results": records,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"[Bench] 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
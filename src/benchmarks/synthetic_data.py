@@ -0,0 +1,151 @@
+"""벤치마크용 결정적(deterministic) 합성 재무 데이터 생성기입니다.
+
+같은 시드(seed)와 설정이면 항상 같은 FinancialData / 워크북 / 전략 파일을
+만들어, 실행 간 성능 비교가 데이터 차이에 흔들리지 않도록 합니다.
+"""
+
+import os
+from typing import Collection, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from domain.model.criteria import Criteria, QoQCriteria
+from domain.model.data_models import FinancialData, FinancialPanel
+from domain.ports.outbound import FinancialDataSourcePort, StrategyLoaderPort
+
+
+METRICS = ("매출액", "영업이익", "당기순이익")
+
+# 종목명 생성용 음절 (예: "한빛전자", "대성바이오")
+_PREFIXES = ("한빛", "대성", "삼화", "동양", "세진", "우리", "태평", "신라", "현대", "미래",
+             "광명", "서울", "부국", "금강", "한국", "대한", "조선", "청호", "성우", "일진")
+_SUFFIXES = ("전자", "화학", "바이오", "제약", "건설", "중공업", "에너지", "소재", "테크",
+             "반도체", "식품", "물산", "로직스", "시스템", "통신", "금속", "산업", "홀딩스")
+
+
+def make_ticker_names(n_tickers: int) -> List[str]:
+    """중복 없는 한글 종목명 n개를 만듭니다. (예: "한빛전자", "한빛전자2")"""
+    base = [p + s for p in _PREFIXES for s in _SUFFIXES]
+    return [
+        base[i % len(base)] + ("" if i < len(base) else str(i // len(base) + 1))
+        for i in range(n_tickers)
+    ]
+
+
+def make_quarter_labels(n_quarters: int, start_year: int = 2010) -> List[str]:
+    """연속된 분기 라벨 n개를 만듭니다. (예: "2010/1Q", "2010/2Q", ...)"""
+    return [f"{start_year + i // 4}/{i % 4 + 1}Q" for i in range(n_quarters)]
+
+
+def generate_financial_data(
+    n_tickers: int,
+    n_quarters: int = 20,
+    nan_ratio: float = 0.05,
+    negative_ratio: float = 0.15,
+    seed: int = 42,
+    start_year: int = 2010
+) -> FinancialData:
+    """합성 FinancialData를 생성합니다.
+
+    값은 종목별 규모(로그정규)에 분기별 랜덤워크 변동을 곱해 만들고,
+    일부 칸은 음수(적자)나 NaN(미공시)으로 바꿉니다.
+
+    Args:
+        n_tickers (int): 종목 수.
+        n_quarters (int): 분기 수.
+        nan_ratio (float): NaN 비율 (0~1).
+        negative_ratio (float): 음수 값 비율 (0~1).
+        seed (int): 난수 시드.
+        start_year (int): 첫 분기의 연도.
+
+    Returns:
+        FinancialData: (종목 × 분기 × 지표) 패널.
+    """
+    rng = np.random.default_rng(seed)
+    shape = (n_tickers, n_quarters, len(METRICS))
+
+    scale = rng.lognormal(mean=8.0, sigma=1.5, size=(n_tickers, 1, 1))
+    walk = np.cumsum(rng.normal(0.0, 0.15, size=shape), axis=1)
+    values = np.round(scale * np.exp(walk) * (1.0, 0.1, 0.07), 1)
+
+    values[rng.random(shape) < negative_ratio] *= -1
+    values[rng.random(shape) < nan_ratio] = np.nan
+
+    panel = FinancialPanel(
+        values,
+        tickers=make_ticker_names(n_tickers),
+        quarters=make_quarter_labels(n_quarters, start_year),
+        metrics=list(METRICS),
+        ticker_name="종목명",
+    )
+    return FinancialData(panel=panel)
+
+
+def generate_strategies(
+    quarters: List[str],
+    n_strategies: int,
+    seed: int = 42
+) -> Dict[str, QoQCriteria]:
+    """인접 분기 쌍/지표/임계값을 섞은 QoQ 전략들을 생성합니다."""
+    rng = np.random.default_rng(seed)
+    thresholds = (0.0001, 0.1, 0.3, 0.5, 1.0)
+
+    strategies = {}
+    for i in range(n_strategies):
+        q = int(rng.integers(0, len(quarters) - 1))
+        strategies[f"bench_qoq_{i:04d}"] = QoQCriteria(
+            metric=METRICS[int(rng.integers(0, len(METRICS)))],
+            base_quarter=quarters[q],
+            target_quarter=quarters[q + 1],
+            min_growth_pct=thresholds[int(rng.integers(0, len(thresholds)))],
+        )
+    return strategies
+
+
+def write_workbook(financial_data: FinancialData, path: str):
+    """FinancialData를 실제 워크북과 같은 형식(지표별 시트)의 엑셀로 저장합니다."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        for metric in financial_data.panel.metrics:
+            financial_data.panel.frame(metric).to_excel(writer, sheet_name=metric)
+
+
+def write_strategy_files(strategies: Dict[str, QoQCriteria], directory: str):
+    """전략들을 TomlStrategyLoader가 읽는 형식의 TOML 파일로 저장합니다."""
+    os.makedirs(directory, exist_ok=True)
+    for name, criteria in strategies.items():
+        with open(os.path.join(directory, f"{name}.toml"), "w", encoding="utf-8") as f:
+            f.write(
+                f'strategy_name = "{name}"\n\n'
+                f'[criteria]\n'
+                f'type = "{criteria.type}"\n'
+                f'metric = "{criteria.metric}"\n'
+                f'base_quarter = "{criteria.base_quarter}"\n'
+                f'target_quarter = "{criteria.target_quarter}"\n'
+                f'min_growth_pct = {criteria.min_growth_pct}\n'
+            )
+
+
+class InMemoryDataSource(FinancialDataSourcePort):
+    """합성 FinancialData를 그대로 제공하는 데이터 소스입니다."""
+
+    def __init__(self, financial_data: FinancialData):
+        self.financial_data = financial_data
+
+    def load_financial_data(
+        self,
+        metrics: Optional[Collection[str]] = None,
+        quarters: Optional[Collection[str]] = None
+    ) -> FinancialData:
+        return self.financial_data
+
+
+class InMemoryStrategyLoader(StrategyLoaderPort):
+    """미리 만든 전략 딕셔너리를 그대로 제공하는 전략 로더입니다."""
+
+    def __init__(self, strategies: Dict[str, Criteria]):
+        self.strategies = strategies
+
+    def load_active_strategies(self) -> Dict[str, Criteria]:
+        return dict(self.strategies)
@@ -7,6 +7,9 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import FrozenSet, Optional, Tuple
+
+from domain.model.quarter import is_relative_quarter, shift_quarter_ref
 
 
 class Criteria(ABC):
@@ -24,6 +27,35 @@ class Criteria(ABC):
         """
         pass
 
+    def required_metrics(self) -> Optional[FrozenSet[str]]:
+        """이 Criteria를 계산하는 데 필요한 지표(Metric) 이름들을 반환합니다.
+
+        데이터 소스가 필요한 시트만 로드하는 데 사용됩니다.
+
+        Returns:
+            Optional[FrozenSet[str]]: 지표 이름 집합. None이면 '모든 지표'.
+        """
+        return None
+
+    def required_quarters(self) -> Optional[FrozenSet[str]]:
+        """이 Criteria를 계산하는 데 필요한 분기(열) 이름들을 반환합니다.
+
+        Returns:
+            Optional[FrozenSet[str]]: 분기 이름 집합. None이면 '모든 분기'.
+        """
+        return None
+
+
+def quarter_set(*quarter_refs: str) -> Optional[FrozenSet[str]]:
+    """Criteria가 참조하는 분기 집합을 만듭니다. (required_quarters 구현용)
+
+    상대 분기("latest", "latest-N")가 섞여 있으면 실제 분기는 데이터를 봐야
+    알 수 있으므로 None('모든 분기')을 반환합니다.
+    """
+    if any(is_relative_quarter(ref) for ref in quarter_refs):
+        return None
+    return frozenset(quarter_refs)
+
 
 @dataclass(frozen=True)
 class QoQCriteria(Criteria):
@@ -31,15 +63,17 @@ class QoQCriteria(Criteria):
 
     Attributes:
         metric (str): 계산할 지표 (예: "매출액", "영업이익").
-        base_quarter (str): 기준 분기 (예: "2023/1Q").
-        target_quarter (str): 비교 분기 (예: "2023/2Q").
+        base_quarter (str): 기준 분기 (예: "2023/1Q", "latest-1").
+        target_quarter (str): 비교 분기 (예: "2023/2Q", "latest").
         min_growth_pct (float): 최소 성장률 (예: 1.0 -> 100%).
+        top_n (Optional[int]): 성장률 상위 N개 종목만 결과에 포함 (None이면 전체).
     """
 
     metric: str
     base_quarter: str
     target_quarter: str
     min_growth_pct: float
+    top_n: Optional[int] = None
 
     @property
     def type(self) -> str:
@@ -49,7 +83,45 @@ class QoQCriteria(Criteria):
             str: Criteria의 고유 유형.
         """
         return "QoQ_Growth"
-    
+
+    def required_metrics(self) -> FrozenSet[str]:
+        return frozenset({self.metric})
+
+    def required_quarters(self) -> Optional[FrozenSet[str]]:
+        return quarter_set(self.base_quarter, self.target_quarter)
+
+
+@dataclass(frozen=True)
+class QoQSweepCriteria(Criteria):
+    """한 분기 쌍(QoQ)에 대해 여러 최소 성장률을 한 번에 평가하는 전략을 정의합니다.
+
+    성장률 벡터를 한 번만 정렬한 뒤, 각 임계값의 통과 종목 수를
+    이진 탐색으로 구합니다.
+
+    Attributes:
+        metric (str): 계산할 지표 (예: "영업이익").
+        base_quarter (str): 기준 분기 (예: "2023/1Q", "latest-1").
+        target_quarter (str): 비교 분기 (예: "2023/2Q", "latest").
+        thresholds (Tuple[float, ...]): 평가할 최소 성장률 목록 (예: (0.0, 0.5, 1.0)).
+    """
+
+    metric: str
+    base_quarter: str
+    target_quarter: str
+    thresholds: Tuple[float, ...]
+
+    @property
+    def type(self) -> str:
+        """Criteria 유형을 'QoQ_Growth_Sweep'으로 반환합니다."""
+        return "QoQ_Growth_Sweep"
+
+    def required_metrics(self) -> FrozenSet[str]:
+        return frozenset({self.metric})
+
+    def required_quarters(self) -> Optional[FrozenSet[str]]:
+        return quarter_set(self.base_quarter, self.target_quarter)
+
+
 @dataclass(frozen=True)
 class TurnaroundCriteria(Criteria):
     """(적자 -> 흑자) 턴어라운드 전략을 정의합니다.
@@ -65,5 +137,155 @@ class TurnaroundCriteria(Criteria):
 
     @property
     def type(self) -> str:
-        """Criteria 유형을 'Turnaround'로 반환합니다."""
-        return "Turnaround"
\ No newline at end of file
+        """Criteria 유형을 'QoQ_Turnaround'로 반환합니다."""
+        return "QoQ_Turnaround"
+
+    def required_metrics(self) -> FrozenSet[str]:
+        return frozenset({self.metric})
+
+    def required_quarters(self) -> Optional[FrozenSet[str]]:
+        return quarter_set(self.base_quarter, self.target_quarter)
+
+
+# 전년 동기 비교 간격 (분기 수)
+YOY_LAG = 4
+
+
+@dataclass(frozen=True)
+class YoYCriteria(Criteria):
+    """전년 동기(YoY) 대비 성장률 전략을 정의합니다. (예: 2023/2Q vs 2022/2Q)
+
+    계절성이 큰 분기 실적은 직전 분기(QoQ)보다 전년 동기와 비교해야
+    추세를 볼 수 있습니다. 성장률 부호 규칙은 QoQ 성장률과 같습니다.
+
+    Attributes:
+        metric (str): 계산할 지표 (예: "영업이익").
+        target_quarter (Optional[str]): 비교 분기 (예: "2023/2Q", "latest").
+            None이면 모든 분기를 한 번에 평가해 분기별 통과 현황을 냅니다.
+        min_growth_pct (float): 최소 성장률 (예: 0.2 -> 20%).
+        top_n (Optional[int]): 성장률 상위 N개 종목만 결과에 포함 (비교 분기 지정 시).
+    """
+
+    metric: str
+    target_quarter: Optional[str]
+    min_growth_pct: float
+    top_n: Optional[int] = None
+
+    @property
+    def type(self) -> str:
+        """Criteria 유형을 'YoY_Growth'로 반환합니다."""
+        return "YoY_Growth"
+
+    @property
+    def base_quarter(self) -> Optional[str]:
+        """기준 분기 = 비교 분기의 전년 동기. (예: "2023/2Q" -> "2022/2Q")"""
+        if self.target_quarter is None:
+            return None
+        return shift_quarter_ref(self.target_quarter, -YOY_LAG)
+
+    def required_metrics(self) -> FrozenSet[str]:
+        return frozenset({self.metric})
+
+    def required_quarters(self) -> Optional[FrozenSet[str]]:
+        if self.target_quarter is None:
+            return None
+        return quarter_set(self.base_quarter, self.target_quarter)
+
+
+@dataclass(frozen=True)
+class GrowthStreakCriteria(Criteria):
+    """비교 분기까지 N분기 연속 성장(직전 분기 대비)한 종목을 찾는 전략을 정의합니다.
+
+    연속 성장 기간은 이력 전체에 걸쳐 있을 수 있으므로 모든 분기를 사용합니다.
+
+    Attributes:
+        metric (str): 계산할 지표 (예: "영업이익").
+        target_quarter (str): 연속 성장이 끝나는 분기 (예: "2023/2Q", "latest").
+        min_streak (int): 최소 연속 성장 분기 수 (예: 3).
+        min_growth_pct (Optional[float]): 한 분기를 '성장'으로 볼 최소 성장률.
+            None이면 성장률 > 0 (흑자전환 포함), 값이 있으면 성장률 >= 값.
+    """
+
+    metric: str
+    target_quarter: str
+    min_streak: int
+    min_growth_pct: Optional[float] = None
+
+    @property
+    def type(self) -> str:
+        """Criteria 유형을 'Growth_Streak'으로 반환합니다."""
+        return "Growth_Streak"
+
+    def required_metrics(self) -> FrozenSet[str]:
+        return frozenset({self.metric})
+
+
+# 조합 조건 연산자: all(AND) / any(OR) / not(NOT)
+COMPOSITE_OPERATORS = ("all", "any", "not")
+
+
+@dataclass(frozen=True)
+class CompositeCriteria(Criteria):
+    """하위 조건들을 AND/OR/NOT으로 조합한 전략을 정의합니다.
+
+    하위 조건은 종목별 통과 여부(불리언 마스크)를 내는 조건이거나 다른 조합
+    조건이며, 서비스는 조합을 마스크 간 비트 연산으로 평가합니다.
+
+    Attributes:
+        operator (str): "all" (모두 통과), "any" (하나 이상 통과), "not" (통과하지 않음).
+        children (Tuple[Criteria, ...]): 하위 조건들. ("not"은 정확히 1개)
+    """
+
+    operator: str
+    children: Tuple[Criteria, ...]
+
+    @property
+    def type(self) -> str:
+        """Criteria 유형을 'Composite'로 반환합니다."""
+        return "Composite"
+
+    def leaves(self) -> Tuple[Criteria, ...]:
+        """조합 트리의 말단 조건들을 깊이 우선(정의) 순서로 반환합니다."""
+        leaves = []
+        for child in self.children:
+            if isinstance(child, CompositeCriteria):
+                leaves.extend(child.leaves())
+            else:
+                leaves.append(child)
+        return tuple(leaves)
+
+    def required_metrics(self) -> Optional[FrozenSet[str]]:
+        metrics = [child.required_metrics() for child in self.children]
+        if any(required is None for required in metrics):
+            return None
+        return frozenset().union(*metrics)
+
+    def required_quarters(self) -> Optional[FrozenSet[str]]:
+        quarters = [child.required_quarters() for child in self.children]
+        if any(required is None for required in quarters):
+            return None
+        return frozenset().union(*quarters)
+
+
+@dataclass(frozen=True)
+class QoQTemplate:
+    """분기를 고정하지 않은 QoQ 전략 템플릿입니다. (워크포워드 백테스트용)
+
+    모든 인접 분기 쌍(직전 분기 -> 해당 분기)에 같은 조건을 적용합니다.
+
+    Attributes:
+        metric (str): 계산할 지표 (예: "영업이익").
+        min_growth_pct (float): 최소 성장률 (예: 1.0 -> 100%).
+    """
+
+    metric: str
+    min_growth_pct: float
+
+    def for_quarters(self, base_quarter: str, target_quarter: str) -> QoQCriteria:
+        """특정 분기 쌍에 고정된 QoQCriteria를 만듭니다."""
+        return QoQCriteria(
+            metric=self.metric,
+            base_quarter=base_quarter,
+            target_quarter=target_quarter,
+            min_growth_pct=self.min_growth_pct,
+        )
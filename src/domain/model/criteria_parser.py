@@ -0,0 +1,275 @@
+"""설정 딕셔너리(TOML의 [criteria] 섹션, JSON 본문 등)를 Criteria 객체로
+변환하는 도메인 모델 파서입니다.
+
+TomlStrategyLoader와 HTTP 어댑터가 같은 규칙으로 전략을 해석하도록
+파싱 로직을 한 곳에 모아 둡니다.
+"""
+
+import math
+from typing import Dict, Optional, Tuple
+
+from domain.model.criteria import (
+    COMPOSITE_OPERATORS, YOY_LAG, CompositeCriteria, Criteria, GrowthStreakCriteria, QoQCriteria,
+    QoQSweepCriteria, TurnaroundCriteria, YoYCriteria
+)
+from domain.model.quarter import LATEST, Quarter, latest_offset, shift_quarter_ref
+
+
+def parse_criteria(criteria_data: Dict) -> Criteria:
+    """criteria 섹션 딕셔너리를 적절한 Criteria 객체로 파싱합니다.
+
+    Args:
+        criteria_data (Dict): 'type'과 전략별 항목을 담은 딕셔너리.
+
+    Returns:
+        Criteria: 파싱된 Criteria 객체 (예: QoQCriteria).
+
+    Raises:
+        ValueError: 알 수 없는 Criteria type이거나 항목 값이 잘못된 경우.
+        KeyError: 필수 항목이 없는 경우.
+    """
+    if not isinstance(criteria_data, dict):
+        raise ValueError(f"criteria는 테이블(딕셔너리)이어야 합니다: {criteria_data!r}")
+
+    criteria_type = criteria_data.get('type')
+
+    if criteria_type == 'Composite' or any(op in criteria_data for op in COMPOSITE_OPERATORS):
+        return _parse_composite(criteria_data)
+
+    if criteria_type == 'QoQ_Growth':
+        base_quarter, target_quarter = _parse_quarter_pair(criteria_data)
+        return QoQCriteria(
+            metric=criteria_data['metric'],
+            base_quarter=base_quarter,
+            target_quarter=target_quarter,
+            min_growth_pct=criteria_data['min_growth_pct'],
+            top_n=_parse_top_n(criteria_data)
+        )
+
+    if criteria_type == 'QoQ_Turnaround':
+        base_quarter, target_quarter = _parse_quarter_pair(criteria_data)
+        return TurnaroundCriteria(
+            metric=criteria_data['metric'],
+            base_quarter=base_quarter,
+            target_quarter=target_quarter
+        )
+
+    if criteria_type == 'QoQ_Growth_Sweep':
+        base_quarter, target_quarter = _parse_quarter_pair(criteria_data)
+        return QoQSweepCriteria(
+            metric=criteria_data['metric'],
+            base_quarter=base_quarter,
+            target_quarter=target_quarter,
+            thresholds=_parse_thresholds(criteria_data)
+        )
+
+    if criteria_type == 'YoY_Growth':
+        return _parse_yoy(criteria_data)
+
+    if criteria_type == 'Growth_Streak':
+        return _parse_growth_streak(criteria_data)
+
+    raise ValueError(f"알 수 없는 Criteria type ({criteria_type})")
+
+
+# 조합 조건의 말단으로 쓸 수 있는 type (종목별 통과 여부를 내는 조건)
+_COMPOSITE_LEAF_TYPES = frozenset({'QoQ_Growth', 'QoQ_Turnaround', 'YoY_Growth', 'Growth_Streak'})
+
+
+def _parse_composite(criteria_data: Dict) -> CompositeCriteria:
+    """조합 조건(all / any / not)을 읽습니다. 하위 조건은 재귀적으로 읽습니다.
+
+    예: 매출액 20% 이상 성장 AND (영업이익 턴어라운드 OR 영업이익 3분기 연속 성장)
+
+        [[criteria.all]]
+        type = "QoQ_Growth"
+        metric = "매출액"
+        base_quarter = "2023/1Q"
+        target_quarter = "2023/2Q"
+        min_growth_pct = 0.2
+
+        [[criteria.all]]
+        [[criteria.all.any]]
+        type = "QoQ_Turnaround"
+        ...
+        [[criteria.all.any]]
+        type = "Growth_Streak"
+        ...
+
+    "not"은 하위 조건 하나를 테이블로 씁니다. (예: [criteria.not])
+
+    Raises:
+        ValueError: 연산자가 없거나 둘 이상이거나, 하위 조건이 비었거나,
+            종목별 통과 여부를 내지 않는 조건(예: QoQ_Growth_Sweep)을 조합한 경우.
+    """
+    operators = [op for op in COMPOSITE_OPERATORS if op in criteria_data]
+    if len(operators) != 1:
+        raise ValueError(f"조합 조건에는 {'/'.join(COMPOSITE_OPERATORS)} 중 하나만 써야 합니다: {operators}")
+    if criteria_data.get('type', 'Composite') != 'Composite':
+        raise ValueError(f"조합 조건에는 type을 쓸 수 없습니다: {criteria_data['type']}")
+
+    operator = operators[0]
+    children = criteria_data[operator]
+    if isinstance(children, dict):
+        children = [children]
+    if not isinstance(children, list) or not children:
+        raise ValueError(f"'{operator}'에는 하위 조건이 하나 이상 있어야 합니다.")
+    if operator == 'not' and len(children) != 1:
+        raise ValueError(f"'not'에는 하위 조건이 정확히 하나 있어야 합니다: {len(children)}개")
+
+    return CompositeCriteria(
+        operator=operator,
+        children=tuple(_parse_composite_child(child) for child in children)
+    )
+
+
+def _parse_composite_child(criteria_data: Dict) -> Criteria:
+    """조합 조건의 하위 조건 하나를 읽습니다."""
+    criteria = parse_criteria(criteria_data)
+    if isinstance(criteria, CompositeCriteria):
+        return criteria
+    if criteria.type not in _COMPOSITE_LEAF_TYPES:
+        raise ValueError(f"조합 조건에 쓸 수 없는 type: {criteria.type}")
+    if isinstance(criteria, YoYCriteria) and criteria.target_quarter is None:
+        raise ValueError("조합 조건의 YoY_Growth에는 target_quarter가 필요합니다.")
+    return criteria
+
+
+def _parse_yoy(criteria_data: Dict) -> YoYCriteria:
+    """YoY_Growth 전략을 읽습니다. (target_quarter를 생략하면 모든 분기)
+
+    Raises:
+        ValueError: 분기 형식이 잘못되었거나, 모든 분기 평가에 top_n을 준 경우.
+    """
+    target_quarter = criteria_data.get('target_quarter')
+    top_n = _parse_top_n(criteria_data)
+
+    if target_quarter is None:
+        if top_n is not None:
+            raise ValueError("top_n은 target_quarter를 지정한 YoY_Growth에서만 쓸 수 있습니다.")
+    else:
+        target_quarter = _parse_quarter_ref(target_quarter, 'target_quarter')
+        # (전년 동기를 계산할 수 없는 분기 라벨이면 여기서 ValueError)
+        shift_quarter_ref(target_quarter, -YOY_LAG)
+
+    return YoYCriteria(
+        metric=criteria_data['metric'],
+        target_quarter=target_quarter,
+        min_growth_pct=criteria_data['min_growth_pct'],
+        top_n=top_n
+    )
+
+
+def _parse_growth_streak(criteria_data: Dict) -> GrowthStreakCriteria:
+    """Growth_Streak 전략을 읽습니다.
+
+    예:
+        metric = "영업이익"
+        target_quarter = "2023/2Q"
+        min_streak = 3              # 3분기 연속 QoQ 성장
+        min_growth_pct = 0.1        # (선택) 분기마다 10% 이상 성장해야 '성장'
+
+    Raises:
+        ValueError: min_streak이 양의 정수가 아니거나 분기 형식이 잘못된 경우.
+        KeyError: 필수 항목이 없는 경우.
+    """
+    min_streak = criteria_data['min_streak']
+    if isinstance(min_streak, bool) or not isinstance(min_streak, int) or min_streak <= 0:
+        raise ValueError(f"min_streak은 양의 정수여야 합니다: {min_streak}")
+
+    min_growth_pct = criteria_data.get('min_growth_pct')
+    return GrowthStreakCriteria(
+        metric=criteria_data['metric'],
+        target_quarter=_parse_quarter_ref(criteria_data['target_quarter'], 'target_quarter'),
+        min_streak=min_streak,
+        min_growth_pct=None if min_growth_pct is None else float(min_growth_pct)
+    )
+
+
+def _parse_quarter_pair(criteria_data: Dict) -> Tuple[str, str]:
+    """기준/비교 분기를 읽습니다.
+
+    분기는 라벨("2023/2Q") 또는 데이터의 최신 분기 기준 상대 참조("latest",
+    "latest-1")로 쓰며, 기준 분기는 비교 분기로부터의 분기 수(음의 정수)로도
+    쓸 수 있습니다.
+
+    예:
+        target_quarter = "2023/2Q"
+        base_quarter = -4           # 전년 동기 -> "2022/2Q"
+        target_quarter = "latest"
+        base_quarter = -1           # 직전 분기 -> "latest-1"
+
+    Raises:
+        ValueError: 분기 값의 형식이 잘못된 경우.
+        KeyError: 필수 항목이 없는 경우.
+    """
+    target_quarter = _parse_quarter_ref(criteria_data['target_quarter'], 'target_quarter')
+    base_quarter = criteria_data['base_quarter']
+
+    if isinstance(base_quarter, int) and not isinstance(base_quarter, bool):
+        if base_quarter >= 0:
+            raise ValueError(f"base_quarter 오프셋은 음의 정수여야 합니다: {base_quarter}")
+        return shift_quarter_ref(target_quarter, base_quarter), target_quarter
+
+    return _parse_quarter_ref(base_quarter, 'base_quarter'), target_quarter
+
+
+def _parse_quarter_ref(value, field: str) -> str:
+    """분기 라벨 또는 상대 참조 하나를 읽습니다.
+
+    상대 참조는 "latest-N" 형태로, 분기 라벨은 워크북 형식(예: "2023Q1" -> "2023/1Q")으로
+    정규화합니다. 분기 형식이 아닌 라벨은 그대로 둡니다. (패널 열 이름과 정확히 비교)
+
+    Raises:
+        ValueError: 문자열이 아닌 경우.
+    """
+    if not isinstance(value, str):
+        raise ValueError(f"{field}는 분기 문자열이어야 합니다: {value!r}")
+    back = latest_offset(value)
+    if back is not None:
+        return shift_quarter_ref(LATEST, -back)
+    try:
+        return Quarter.parse(value).label
+    except ValueError:
+        return value
+
+
+def _parse_top_n(criteria_data: Dict) -> Optional[int]:
+    """선택 항목 top_n(상위 N개만 결과에 포함)을 읽습니다.
+
+    Raises:
+        ValueError: top_n이 양의 정수가 아닌 경우.
+    """
+    top_n = criteria_data.get('top_n')
+    if top_n is None:
+        return None
+    if isinstance(top_n, bool) or not isinstance(top_n, int) or top_n <= 0:
+        raise ValueError(f"top_n은 양의 정수여야 합니다: {top_n}")
+    return top_n
+
+
+def _parse_thresholds(criteria_data: Dict) -> Tuple[float, ...]:
+    """스윕 임계값을 목록(thresholds) 또는 범위(threshold_range)에서 읽습니다.
+
+    예:
+        thresholds = [0.0, 0.5, 1.0]
+        threshold_range = { start = 0.0, stop = 2.0, step = 0.25 }  # stop 포함
+
+    Raises:
+        ValueError: 둘 다 없거나 범위 설정이 잘못된 경우.
+    """
+    if 'thresholds' in criteria_data:
+        thresholds = tuple(float(t) for t in criteria_data['thresholds'])
+    elif 'threshold_range' in criteria_data:
+        spec = criteria_data['threshold_range']
+        start, stop, step = float(spec['start']), float(spec['stop']), float(spec['step'])
+        if step <= 0 or stop < start:
+            raise ValueError(f"잘못된 threshold_range: {spec}")
+        count = math.floor((stop - start) / step + 1e-9) + 1
+        thresholds = tuple(round(start + i * step, 10) for i in range(count))
+    else:
+        raise ValueError("QoQ_Growth_Sweep에는 'thresholds' 또는 'threshold_range'가 필요합니다.")
+
+    if not thresholds:
+        raise ValueError("임계값 목록이 비어 있습니다.")
+    return thresholds
@@ -4,19 +4,263 @@ FinancialDataSourcePort가 외부에서 데이터를 읽어와
 이 객체에 담아 도메인 서비스(Service)로 전달합니다.
 """
 
-import pandas as pd
 from dataclasses import dataclass
+from typing import Dict, Hashable, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from domain.model.quarter import INVALID_ORDINAL, Quarter, parse_quarter_labels
+
+
+class FinancialPanel:
+    """종목 × 분기 × 지표 3차원 float 배열로 표현한 재무 데이터 패널입니다.
+
+    배열은 Fortran(열 우선) 순서로 저장되어, 한 지표의 한 분기 열
+    (``values[:, q, m]``)이 메모리상 연속된 1차원 배열이 됩니다.
+    스크리닝 커널은 이 열 슬라이스(ndarray)를 그대로 사용하며,
+    라벨(종목명/분기명)은 정수 코드 조회 테이블로만 다룹니다.
+
+    분기 라벨은 Quarter ordinal(연도 * 4 + 분기 - 1)로도 보관하므로, 분기가
+    빠짐없이 이어진 패널에서는 분기 -> 열 위치가 정수 뺄셈 한 번이고
+    분기 범위는 연속된 열 슬라이스(quarter_range)가 됩니다.
+
+    Attributes:
+        values (np.ndarray): (종목, 분기, 지표) float64 배열. (읽기 전용)
+        tickers (pd.Index): 종목명 라벨 (정수 코드 -> 라벨).
+        quarters (pd.Index): 분기 라벨 (정수 코드 -> 라벨).
+        metrics (pd.Index): 지표 라벨 (정수 코드 -> 라벨).
+        quarter_ordinals (np.ndarray): 분기별 Quarter ordinal. (분기 라벨이 아니면 -1)
+    """
+
+    __slots__ = (
+        "values", "tickers", "quarters", "metrics", "quarter_ordinals",
+        "_ticker_codes", "_quarter_codes", "_metric_codes",
+        "_first_ordinal", "_ordinal_codes",
+    )
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        tickers: Sequence[Hashable],
+        quarters: Sequence[Hashable],
+        metrics: Sequence[str],
+        ticker_name: Optional[str] = None
+    ):
+        """
+        Args:
+            values (np.ndarray): (종목, 분기, 지표) 모양의 배열.
+            tickers (Sequence[Hashable]): 종목명 라벨.
+            quarters (Sequence[Hashable]): 분기 라벨.
+            metrics (Sequence[str]): 지표 이름 (예: "영업이익").
+            ticker_name (Optional[str]): 종목 인덱스 이름 (예: "종목명").
+
+        Raises:
+            ValueError: 배열 모양과 라벨 개수가 맞지 않는 경우.
+        """
+        values = np.asfortranarray(values, dtype=np.float64)
+        expected = (len(tickers), len(quarters), len(metrics))
+        if values.shape != expected:
+            raise ValueError(f"패널 모양 불일치: {values.shape} != {expected}")
+        values.flags.writeable = False
+
+        self.values = values
+        self.tickers = pd.Index(tickers, name=ticker_name)
+        self.quarters = pd.Index(quarters)
+        self.metrics = pd.Index(metrics)
+
+        self._ticker_codes: Dict[Hashable, int] = {t: i for i, t in enumerate(self.tickers)}
+        self._quarter_codes: Dict[Hashable, int] = {q: i for i, q in enumerate(self.quarters)}
+        self._metric_codes: Dict[str, int] = {m: i for i, m in enumerate(self.metrics)}
+
+        ordinals = parse_quarter_labels(self.quarters)
+        ordinals.flags.writeable = False
+        self.quarter_ordinals = ordinals
+        # 분기가 오름차순으로 빠짐없이 이어지면 위치 = ordinal - 첫 ordinal
+        contiguous = (
+            len(ordinals) > 0 and (ordinals != INVALID_ORDINAL).all()
+            and (np.diff(ordinals) == 1).all()
+        )
+        self._first_ordinal: Optional[int] = int(ordinals[0]) if contiguous else None
+        self._ordinal_codes: Dict[int, int] = (
+            {} if contiguous
+            else {int(o): i for i, o in enumerate(ordinals) if o != INVALID_ORDINAL}
+        )
+
+    @classmethod
+    def from_frames(cls, frames: Mapping[str, pd.DataFrame]) -> "FinancialPanel":
+        """지표별 DataFrame들을 하나의 정렬된 패널로 합칩니다.
+
+        종목/분기 라벨은 처음 등장한 순서대로 합집합을 취하고,
+        특정 지표에 없는 (종목, 분기) 칸은 NaN으로 채웁니다.
+        분기 열은 시간 순(Quarter ordinal 오름차순)으로 정렬합니다.
+        (분기 라벨이 아닌 열이 섞여 있으면 등장 순서를 유지)
+
+        Args:
+            frames (Mapping[str, pd.DataFrame]): {지표_이름: DataFrame(행: 종목, 열: 분기)}.
+
+        Returns:
+            FinancialPanel: 정렬된 패널.
+        """
+        frames = {metric: df for metric, df in frames.items() if not df.empty}
+        tickers = pd.Index([])
+        quarters = pd.Index([])
+        ticker_name = None
+        for df in frames.values():
+            tickers = tickers.append(df.index).unique()
+            quarters = quarters.append(df.columns).unique()
+            ticker_name = ticker_name or df.index.name
+
+        ordinals = parse_quarter_labels(quarters)
+        if (ordinals != INVALID_ORDINAL).all():
+            quarters = quarters[np.argsort(ordinals, kind="stable")]
+
+        values = np.full(
+            (len(tickers), len(quarters), len(frames)), np.nan, dtype=np.float64, order="F"
+        )
+        for m, df in enumerate(frames.values()):
+            aligned = df.reindex(index=tickers, columns=quarters)
+            values[:, :, m] = aligned.to_numpy(dtype=np.float64)
+
+        return cls(values, tickers, quarters, list(frames.keys()), ticker_name)
+
+    def with_metrics(self, extra: Mapping[str, np.ndarray]) -> "FinancialPanel":
+        """(종목, 분기) 배열들을 지표로 덧붙인 새 패널을 만듭니다. (파생 지표용)
+
+        같은 이름의 지표가 이미 있으면 새 값으로 바꿉니다.
+
+        Args:
+            extra (Mapping[str, np.ndarray]): {지표_이름: (종목, 분기) 배열}.
+
+        Returns:
+            FinancialPanel: 새 패널. (기존 패널은 그대로)
+        """
+        metrics = list(self.metrics) + [m for m in extra if m not in self._metric_codes]
+        values = np.empty((len(self.tickers), len(self.quarters), len(metrics)), order="F")
+        values[:, :, :len(self.metrics)] = self.values
+        for metric, metric_values in extra.items():
+            values[:, :, metrics.index(metric)] = metric_values
+
+        return FinancialPanel(values, self.tickers, self.quarters, metrics, self.tickers.name)
+
+    def has_metric(self, metric: str) -> bool:
+        """패널에 해당 지표가 로드되어 있는지 확인합니다."""
+        return metric in self._metric_codes
+
+    def ticker_code(self, ticker: Hashable) -> int:
+        """종목 라벨의 정수 코드를 반환합니다. (없으면 KeyError)"""
+        return self._ticker_codes[ticker]
+
+    def quarter_code(self, quarter: Union[Hashable, Quarter]) -> int:
+        """분기의 정수 코드(열 위치)를 반환합니다. (없으면 KeyError)
+
+        패널 라벨과 정확히 같은 라벨이 아니어도 같은 분기를 가리키는 라벨
+        (예: "2023Q1")이나 Quarter 객체면 ordinal로 찾습니다.
+        """
+        if not isinstance(quarter, Quarter):
+            code = self._quarter_codes.get(quarter)
+            if code is not None:
+                return code
+            try:
+                quarter = Quarter.parse(quarter)
+            except ValueError:
+                raise KeyError(quarter) from None
+
+        if self._first_ordinal is not None:
+            code = quarter.ordinal - self._first_ordinal
+            if 0 <= code < len(self.quarters):
+                return code
+            raise KeyError(quarter.label)
+        try:
+            return self._ordinal_codes[quarter.ordinal]
+        except KeyError:
+            raise KeyError(quarter.label) from None
+
+    def quarter_range(
+        self, first: Union[Hashable, Quarter], last: Union[Hashable, Quarter]
+    ) -> slice:
+        """first ~ last 분기(양 끝 포함)의 열 슬라이스를 반환합니다.
+
+        Raises:
+            KeyError: 분기가 없거나, 그 사이 분기가 빠져 있어 연속된 열이 아닌 경우.
+        """
+        start, stop = self.quarter_code(first), self.quarter_code(last)
+        ordinals = self.quarter_ordinals[start:stop + 1]
+        if stop < start or ordinals[0] == INVALID_ORDINAL or (np.diff(ordinals) != 1).any():
+            raise KeyError(f"연속된 분기 범위가 아님: {first} ~ {last}")
+        return slice(start, stop + 1)
+
+    @property
+    def latest_quarter(self) -> Optional[Quarter]:
+        """패널에서 가장 최근 분기. (분기 라벨인 열이 없으면 None)"""
+        valid = self.quarter_ordinals[self.quarter_ordinals != INVALID_ORDINAL]
+        return Quarter(int(valid.max())) if len(valid) else None
+
+    def metric_code(self, metric: str) -> int:
+        """지표 이름의 정수 코드를 반환합니다. (없으면 KeyError)"""
+        return self._metric_codes[metric]
+
+    def metric_values(self, metric: str) -> np.ndarray:
+        """한 지표의 (종목, 분기) 2차원 배열 뷰를 반환합니다. (복사 없음)"""
+        return self.values[:, :, self._metric_codes[metric]]
+
+    def column(self, metric: str, quarter: Union[Hashable, Quarter]) -> np.ndarray:
+        """한 지표, 한 분기의 종목별 값(연속된 1차원 뷰)을 반환합니다."""
+        return self.values[:, self.quarter_code(quarter), self._metric_codes[metric]]
+
+    def frame(self, metric: str) -> pd.DataFrame:
+        """한 지표를 DataFrame(행: 종목, 열: 분기) 뷰로 반환합니다. (복사 없음)"""
+        return pd.DataFrame(
+            self.metric_values(metric),
+            index=self.tickers,
+            columns=self.quarters,
+            copy=False,
+        )
 
 
 @dataclass(frozen=True)
 class FinancialData:
     """모든 재무제표 데이터를 담는 데이터 전송 객체(DTO)입니다.
 
+    데이터는 하나의 FinancialPanel에 저장되며, 지표별 DataFrame 속성은
+    하위 호환을 위해 패널의 복사 없는 뷰로 제공됩니다.
+    (로드되지 않은 지표는 빈 DataFrame)
+
     Attributes:
+        panel (FinancialPanel): 종목 × 분기 × 지표 패널.
         sales (pd.DataFrame): 매출액 (행: 종목, 열: 분기).
         operating_profit (pd.DataFrame): 영업이익 (행: 종목, 열: 분기).
         net_income (pd.DataFrame): 당기순이익 (행: 종목, 열: 분기).
     """
-    sales: pd.DataFrame
-    operating_profit: pd.DataFrame
-    net_income: pd.DataFrame
\ No newline at end of file
+    panel: FinancialPanel
+
+    @classmethod
+    def from_frames(
+        cls,
+        sales: pd.DataFrame,
+        operating_profit: pd.DataFrame,
+        net_income: pd.DataFrame
+    ) -> "FinancialData":
+        """지표별 DataFrame 3개로 FinancialData를 생성합니다."""
+        return cls(panel=FinancialPanel.from_frames({
+            "매출액": sales,
+            "영업이익": operating_profit,
+            "당기순이익": net_income,
+        }))
+
+    @property
+    def sales(self) -> pd.DataFrame:
+        return self._frame("매출액")
+
+    @property
+    def operating_profit(self) -> pd.DataFrame:
+        return self._frame("영업이익")
+
+    @property
+    def net_income(self) -> pd.DataFrame:
+        return self._frame("당기순이익")
+
+    def _frame(self, metric: str) -> pd.DataFrame:
+        if not self.panel.has_metric(metric):
+            return pd.DataFrame()
+        return self.panel.frame(metric)
@@ -0,0 +1,178 @@
+"""분기(Quarter)를 정수 하나로 표현하는 도메인 모델입니다.
+
+분기 라벨("2023/1Q")을 ``연도 * 4 + (분기 - 1)`` 정수(ordinal)로 바꾸면
+"직전 분기", "전년 동기" 같은 상대 분기는 정수 덧셈/뺄셈 한 번이 되고,
+정렬과 범위 비교도 정수 비교가 됩니다.
+
+전략에서는 절대 분기 라벨 외에 데이터의 최신 분기 기준 상대 분기
+("latest", "latest-4")도 쓸 수 있으며, 실제 분기는 실행 시점의 패널로
+정해집니다. (resolve_quarter_ref 참고)
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# 분기 라벨로 인식하는 형식: "2023/1Q" (워크북 형식), "2023-1Q", "2023Q1", "2023 Q1" 등
+_LABEL_PATTERN = r"^\s*(\d{4})\s*[/.\-]?\s*(?:([1-4])\s*[Qq]|[Qq]\s*([1-4]))\s*$"
+_LABEL_REGEX = re.compile(_LABEL_PATTERN)
+
+# 상대 분기: "latest" (최신 분기), "latest-N" (최신 분기에서 N분기 전)
+LATEST = "latest"
+_RELATIVE_REGEX = re.compile(r"^\s*latest\s*(?:-\s*(\d+))?\s*$", re.IGNORECASE)
+
+# parse_quarter_labels에서 분기 라벨이 아닌 값의 ordinal
+INVALID_ORDINAL = -1
+
+
+@dataclass(frozen=True, order=True)
+class Quarter:
+    """연도와 분기를 정수 하나(ordinal = 연도 * 4 + 분기 - 1)로 담는 값 객체입니다.
+
+    Attributes:
+        ordinal (int): 정수 인코딩. (예: 2023/1Q -> 8092)
+    """
+
+    ordinal: int
+
+    @classmethod
+    def of(cls, year: int, quarter: int) -> "Quarter":
+        """연도와 분기(1~4)로 Quarter를 만듭니다.
+
+        Raises:
+            ValueError: 분기가 1~4가 아닌 경우.
+        """
+        if not 1 <= quarter <= 4:
+            raise ValueError(f"분기는 1~4여야 합니다: {quarter}")
+        return cls(year * 4 + quarter - 1)
+
+    @classmethod
+    def parse(cls, label: str) -> "Quarter":
+        """분기 라벨(예: "2023/1Q")을 Quarter로 변환합니다.
+
+        Raises:
+            ValueError: 분기 라벨 형식이 아닌 경우.
+        """
+        match = _LABEL_REGEX.match(str(label))
+        if match is None:
+            raise ValueError(f"분기 형식이 아닙니다: {label!r} (예: '2023/1Q')")
+        year, q1, q2 = match.groups()
+        return cls.of(int(year), int(q1 or q2))
+
+    @property
+    def year(self) -> int:
+        return self.ordinal // 4
+
+    @property
+    def quarter(self) -> int:
+        return self.ordinal % 4 + 1
+
+    @property
+    def label(self) -> str:
+        """워크북 형식의 라벨. (예: "2023/1Q")"""
+        return f"{self.year}/{self.quarter}Q"
+
+    def __add__(self, offset: int) -> "Quarter":
+        if isinstance(offset, bool) or not isinstance(offset, (int, np.integer)):
+            return NotImplemented
+        return Quarter(self.ordinal + int(offset))
+
+    def __sub__(self, other):
+        """Quarter - int: offset분기 전의 Quarter / Quarter - Quarter: 두 분기 사이 분기 수"""
+        if isinstance(other, Quarter):
+            return self.ordinal - other.ordinal
+        if isinstance(other, bool) or not isinstance(other, (int, np.integer)):
+            return NotImplemented
+        return Quarter(self.ordinal - int(other))
+
+    def __str__(self) -> str:
+        return self.label
+
+
+def parse_quarter_labels(labels: Iterable) -> np.ndarray:
+    """분기 라벨 목록을 한 번의 벡터화된 정규식 추출로 ordinal 배열로 변환합니다.
+
+    Args:
+        labels (Iterable): 분기 라벨들. (예: 워크북 열 머리글)
+
+    Returns:
+        np.ndarray: int64 ordinal 배열. 분기 라벨이 아닌 값은 INVALID_ORDINAL(-1).
+    """
+    labels = pd.Index(labels).astype(str)
+    if len(labels) == 0:
+        return np.empty(0, dtype=np.int64)
+
+    parts = labels.str.extract(_LABEL_PATTERN)
+    year = pd.to_numeric(parts[0], errors="coerce").to_numpy(dtype=np.float64)
+    quarter = pd.to_numeric(parts[1].fillna(parts[2]), errors="coerce").to_numpy(dtype=np.float64)
+
+    ordinals = year * 4 + quarter - 1
+    return np.where(np.isnan(ordinals), INVALID_ORDINAL, ordinals).astype(np.int64)
+
+
+def format_quarter_ordinals(ordinals: Iterable[int]) -> List[str]:
+    """ordinal들을 워크북 형식의 라벨 목록으로 변환합니다. (예: 8092 -> "2023/1Q")"""
+    return [f"{o // 4}/{o % 4 + 1}Q" for o in np.asarray(ordinals, dtype=np.int64).tolist()]
+
+
+def latest_offset(quarter_ref: str) -> Optional[int]:
+    """상대 분기 참조("latest", "latest-N")의 N을 반환합니다.
+
+    Returns:
+        Optional[int]: "latest"는 0, "latest-N"은 N. 절대 분기 라벨이면 None.
+    """
+    if not isinstance(quarter_ref, str):
+        return None
+    match = _RELATIVE_REGEX.match(quarter_ref)
+    if match is None:
+        return None
+    return int(match.group(1) or 0)
+
+
+def is_relative_quarter(quarter_ref: str) -> bool:
+    """데이터의 최신 분기에 따라 정해지는 상대 분기 참조인지 확인합니다."""
+    return latest_offset(quarter_ref) is not None
+
+
+def shift_quarter_ref(quarter_ref: str, offset: int) -> str:
+    """분기 참조를 offset분기만큼 옮긴 참조를 만듭니다. (음수: 과거)
+
+    절대 라벨은 절대 라벨로("2023/2Q", -4 -> "2022/2Q"),
+    상대 참조는 상대 참조로("latest-1", -4 -> "latest-5") 옮깁니다.
+
+    Raises:
+        ValueError: 라벨이 분기 형식이 아니거나, 상대 참조가 최신 분기를 넘어가는 경우.
+    """
+    back = latest_offset(quarter_ref)
+    if back is None:
+        return (Quarter.parse(quarter_ref) + offset).label
+
+    back -= offset
+    if back < 0:
+        raise ValueError(f"최신 분기 이후는 참조할 수 없습니다: {quarter_ref!r} {offset:+d}")
+    return LATEST if back == 0 else f"{LATEST}-{back}"
+
+
+def resolve_quarter_ref(quarter_ref: str, latest: Optional[Quarter]) -> str:
+    """상대 분기 참조를 실제 분기 라벨로 바꿉니다. (절대 라벨은 그대로)
+
+    Args:
+        quarter_ref (str): 분기 라벨 또는 "latest", "latest-N".
+        latest (Optional[Quarter]): 데이터의 최신 분기.
+
+    Returns:
+        str: 분기 라벨.
+
+    Raises:
+        KeyError: 상대 참조인데 데이터에서 최신 분기를 알 수 없는 경우.
+    """
+    back = latest_offset(quarter_ref)
+    if back is None:
+        return quarter_ref
+    if latest is None:
+        raise KeyError(f"분기(열) 없음: {quarter_ref} (데이터에서 최신 분기를 알 수 없음)")
+    return (latest - back).label
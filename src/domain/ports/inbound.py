@@ -5,9 +5,11 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, Iterator, List, Set, Tuple
 import pandas as pd
 
+from domain.model.criteria import Criteria, QoQTemplate
+
 
 class ScreeningUseCasePort(ABC):
     """
@@ -28,4 +30,97 @@ class ScreeningUseCasePort(ABC):
                 DataFrame은 종목명을 인덱스로, 근거 데이터(실적, 성장률)를
                 컬럼으로 가집니다.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def iter_active_strategies(self) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        활성화된 모든 전략을 실행하고, 전략이 끝나는 대로 결과를 내보냅니다.
+
+        run_all_active_strategies()와 결과는 같지만 전체 결과를 모아 두지 않으므로,
+        호출자는 첫 결과부터 바로 저장/출력할 수 있습니다.
+
+        Yields:
+            Tuple[str, pd.DataFrame]: (전략_이름, 결과 DataFrame). (완료 순서)
+        """
+        pass
+
+    @abstractmethod
+    def reload_strategies(self) -> Tuple[Set[str], Set[str]]:
+        """
+        활성 전략을 다시 로드합니다. (실행 중 전략 파일이 바뀐 경우)
+
+        Returns:
+            Tuple[Set[str], Set[str]]:
+                (새로 생겼거나 내용이 바뀐 전략 이름들, 사라진 전략 이름들).
+        """
+        pass
+
+    @abstractmethod
+    def reload_financial_data(self):
+        """
+        재무 데이터를 다시 로드합니다. (실행 중 데이터 파일이 바뀐 경우)
+        """
+        pass
+
+    @abstractmethod
+    def get_active_strategies(self) -> Dict[str, Criteria]:
+        """
+        로드된 활성 전략 목록을 반환합니다.
+
+        Returns:
+            Dict[str, Criteria]: {전략_이름: Criteria_객체} 딕셔너리. (복사본)
+        """
+        pass
+
+    @abstractmethod
+    def run_strategy(self, strategy_name: str) -> pd.DataFrame:
+        """
+        활성 전략 하나를 이름으로 실행합니다.
+
+        Args:
+            strategy_name (str): 실행할 전략 이름.
+
+        Returns:
+            pd.DataFrame: 통과된 종목 및 근거 데이터.
+
+        Raises:
+            KeyError: 해당 이름의 활성 전략이 없는 경우.
+        """
+        pass
+
+    @abstractmethod
+    def run_criteria(self, criteria: Criteria, name: str = "adhoc") -> pd.DataFrame:
+        """
+        로드된 전략과 무관한 임의의(ad-hoc) Criteria를 실행합니다.
+
+        필요한 지표/분기가 메모리에 없으면 데이터를 보충 로드합니다.
+
+        Args:
+            criteria (Criteria): 실행할 Criteria 객체.
+            name (str): 로그/계측용 이름.
+
+        Returns:
+            pd.DataFrame: 통과된 종목 및 근거 데이터.
+
+        Raises:
+            ValueError: 지원하지 않는 type이거나 지표가 없는 경우.
+            KeyError: 분기(열)가 없는 경우.
+        """
+        pass
+
+    @abstractmethod
+    def run_qoq_backtest(self, templates: Dict[str, QoQTemplate]) -> Dict[str, pd.DataFrame]:
+        """
+        QoQ 템플릿을 모든 인접 분기 쌍에 굴려(walk-forward) 적용합니다.
+
+        Args:
+            templates (Dict[str, QoQTemplate]): {템플릿_이름: QoQTemplate}.
+
+        Returns:
+            Dict[str, pd.DataFrame]:
+                {템플릿_이름: [분기별 결과 DataFrame]} 딕셔너리.
+                DataFrame은 비교 분기를 인덱스로, 기준 분기/통과 종목 수/
+                통과 종목 목록을 컬럼으로 가집니다.
+        """
+        pass
@@ -4,8 +4,9 @@
 이 포트를 구현(implement)하여 실제 데이터를 제공합니다.
 """
 
+import contextlib
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Collection, ContextManager, Dict, List, Optional, Set
 from domain.model.criteria import Criteria
 from domain.model.data_models import FinancialData
 import pandas as pd
@@ -15,13 +16,24 @@ class FinancialDataSourcePort(ABC):
     """외부에서 원본 재무 데이터를 로드하기 위한 포트입니다."""
 
     @abstractmethod
-    def load_financial_data(self) -> FinancialData:
+    def load_financial_data(
+        self,
+        metrics: Optional[Collection[str]] = None,
+        quarters: Optional[Collection[str]] = None
+    ) -> FinancialData:
         """
-        데이터 소스(예: 엑셀)에서 모든 재무제표를 로드하여
+        데이터 소스(예: 엑셀)에서 재무제표를 로드하여
         FinancialData 객체로 반환합니다.
+
+        Args:
+            metrics (Optional[Collection[str]]):
+                로드할 지표 이름 (예: {"영업이익"}). None이면 모든 지표.
+                요청되지 않은 지표는 패널에 포함되지 않습니다.
+            quarters (Optional[Collection[str]]):
+                로드할 분기(열) 이름 (예: {"2023/1Q", "2023/2Q"}). None이면 모든 분기.
         
         Returns:
-            FinancialData: 매출액, 영업이익, 당기순이익 DataFrame을 포함한 객체.
+            FinancialData: (종목 × 분기 × 지표) 패널을 담은 객체.
         """
         pass
 
@@ -54,4 +66,168 @@ class ResultPersistencePort(ABC):
             results (Dict[str, pd.DataFrame]): 
                 {전략_이름: 결과 DataFrame} 딕셔너리.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def update_results(
+        self,
+        results: Dict[str, pd.DataFrame],
+        changed: Set[str],
+        removed: Set[str]
+    ):
+        """
+        일부 전략만 바뀐 결과를 반영합니다. (감시 모드 등 증분 실행용)
+
+        기본 구현은 전체 결과를 다시 저장합니다. 전략별로 출력이 나뉘는
+        어댑터는 바뀐 출력만 다시 쓰도록 재정의할 수 있습니다.
+
+        Args:
+            results (Dict[str, pd.DataFrame]): 현재 전체 결과 딕셔너리.
+            changed (Set[str]): 결과가 새로 계산된 전략 이름들.
+            removed (Set[str]): 더 이상 활성 상태가 아닌 전략 이름들.
+        """
+        self.save_results(results)
+
+    def begin_results(self, strategy_names: List[str]) -> "ResultBatch":
+        """
+        결과를 하나씩 받는 스트리밍 저장을 시작합니다.
+
+        저장 상태는 반환된 배치(ResultBatch)가 가지므로, 여러 배치를 동시에
+        열어도 서로 섞이지 않습니다. 기본 구현은 결과를 모아 두었다가
+        end_results()에서 save_results()로 한 번에 저장합니다. 결과를 하나씩
+        내보낼 수 있는 어댑터는 재정의해 결과를 받는 즉시 저장하는 배치를 반환합니다.
+
+        Args:
+            strategy_names (List[str]): 저장될 전략 이름들. (결과가 도착하는 순서와
+                무관한 출력 순서/이름 결정에 사용)
+
+        Returns:
+            ResultBatch: save_result() / end_results()를 호출할 스트리밍 저장 배치.
+        """
+        return BufferedResultBatch(self, strategy_names)
+
+
+class ResultBatch(ABC):
+    """
+    ResultPersistencePort.begin_results()가 시작한 스트리밍 저장 한 번입니다.
+
+    배치별 상태(받은 결과, 열린 파일 등)는 이 객체가 가집니다.
+    """
+
+    @abstractmethod
+    def save_result(self, strategy_name: str, result_df: pd.DataFrame):
+        """
+        전략 하나의 결과를 저장합니다. (도착 순서대로 호출)
+
+        Args:
+            strategy_name (str): 전략 이름.
+            result_df (pd.DataFrame): 결과 DataFrame.
+        """
+        pass
+
+    @abstractmethod
+    def end_results(self):
+        """
+        스트리밍 저장을 마칩니다. (한 배치에 한 번만 호출)
+        """
+        pass
+
+
+class BufferedResultBatch(ResultBatch):
+    """
+    결과를 모아 두었다가 end_results()에서 save_results()로 한 번에 저장하는
+    기본 ResultBatch 구현입니다.
+    """
+
+    def __init__(self, persistence: ResultPersistencePort, strategy_names: List[str]):
+        """
+        Args:
+            persistence (ResultPersistencePort): 최종 저장을 맡을 포트.
+            strategy_names (List[str]): 저장 순서를 정할 전략 이름들.
+        """
+        self.persistence = persistence
+        self.strategy_names = list(strategy_names)
+        self.results: Dict[str, pd.DataFrame] = {}
+
+    def save_result(self, strategy_name: str, result_df: pd.DataFrame):
+        self.results[strategy_name] = result_df
+
+    def end_results(self):
+        """받은 결과를 begin_results()의 순서대로 저장합니다."""
+        results, self.results = self.results, {}
+        order = [name for name in self.strategy_names if name in results]
+        order += [name for name in results if name not in set(order)]
+        self.persistence.save_results({name: results[name] for name in order})
+
+
+class ResultCachePort(ABC):
+    """
+    전략 실행 결과를 실행(run) 사이에 재사용하기 위한
+    아웃바운드 포트입니다. (예: 디스크 캐시)
+
+    키는 도메인 서비스가 (데이터 지문, Criteria 해시, 엔진 버전)으로 만든
+    문자열이며, 캐시는 키의 의미를 해석하지 않습니다.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        저장된 결과를 읽습니다.
+
+        Args:
+            key (str): 결과 키.
+
+        Returns:
+            Optional[pd.DataFrame]: 적중 시 결과 DataFrame, 없으면 None.
+        """
+        pass
+
+    @abstractmethod
+    def put(self, key: str, result_df: pd.DataFrame):
+        """
+        결과를 저장합니다. (저장 실패는 예외 없이 무시해도 됩니다)
+
+        Args:
+            key (str): 결과 키.
+            result_df (pd.DataFrame): 저장할 결과 DataFrame.
+        """
+        pass
+
+
+class TracerPort(ABC):
+    """
+    파이프라인 단계(로드, 계산, 저장)와 전략별 실행을 계측하기 위한
+    아웃바운드 포트입니다. (시간, CPU 시간, 메모리 등)
+    """
+
+    @abstractmethod
+    def span(self, name: str, category: str = "stage") -> ContextManager[None]:
+        """
+        with 블록 하나를 계측 구간(span)으로 기록합니다.
+
+        Args:
+            name (str): 구간 이름 (예: "excel.load_financial_data", 전략 이름).
+            category (str): 구간 분류 (예: "stage", "strategy").
+        """
+        pass
+
+    @abstractmethod
+    def record(self, name: str, category: str, wall_seconds: float):
+        """
+        다른 곳(예: 워커 프로세스)에서 이미 측정한 구간을 기록합니다.
+
+        Args:
+            name (str): 구간 이름.
+            category (str): 구간 분류.
+            wall_seconds (float): 측정된 경과 시간(초).
+        """
+        pass
+
+
+class NullTracer(TracerPort):
+    """아무것도 기록하지 않는 기본 TracerPort 구현입니다. (계측 비활성화)"""
+
+    def span(self, name: str, category: str = "stage") -> ContextManager[None]:
+        return contextlib.nullcontext()
+
+    def record(self, name: str, category: str, wall_seconds: float):
+        pass
@@ -0,0 +1,149 @@
+"""원본 지표에서 파생 지표(예: TTM)를 계산하는 보조 모듈입니다.
+
+파생 지표는 이름 규칙으로 요청합니다.
+
+    "영업이익_TTM"  ->  영업이익의 최근 4분기(Trailing Twelve Months) 합계
+
+데이터를 로드할 때 원본 지표와 함께 한 번만 계산해 패널에 지표로 덧붙이므로,
+모든 전략과 커널에서 일반 지표 이름처럼 쓸 수 있습니다.
+"""
+
+from typing import Collection, Optional, Set, Tuple
+
+import numpy as np
+
+from domain.model.data_models import FinancialPanel
+from domain.model.quarter import INVALID_ORDINAL, Quarter
+
+
+TTM_SUFFIX = "_TTM"
+TTM_WINDOW = 4
+
+
+def source_metric(metric: str) -> Optional[str]:
+    """파생 지표의 원본 지표 이름을 반환합니다. (파생 지표가 아니면 None)"""
+    if metric.endswith(TTM_SUFFIX) and len(metric) > len(TTM_SUFFIX):
+        return metric[:-len(TTM_SUFFIX)]
+    return None
+
+
+def split_metrics(
+    metrics: Optional[Collection[str]]
+) -> Tuple[Optional[Set[str]], Set[str]]:
+    """요청 지표를 (데이터 소스에서 읽을 원본 지표, 계산할 파생 지표)로 나눕니다.
+
+    Args:
+        metrics (Optional[Collection[str]]): 요청 지표 이름들. None이면 '모든 지표'.
+
+    Returns:
+        Tuple[Optional[Set[str]], Set[str]]: (원본 지표 집합 또는 None, 파생 지표 집합).
+    """
+    if metrics is None:
+        return None, set()
+
+    sources, derived = set(), set()
+    for metric in metrics:
+        source = source_metric(metric)
+        if source is None:
+            sources.add(metric)
+        else:
+            sources.add(source)
+            derived.add(metric)
+    return sources, derived
+
+
+def expand_quarters(quarters: Collection[str], history: int) -> Set[str]:
+    """분기마다 직전 history개 분기 라벨을 더합니다. (TTM 창을 채우기 위한 보충 로드용)
+
+    분기 라벨 형식이 아닌 값은 그대로 둡니다.
+    """
+    expanded = set(quarters)
+    for label in quarters:
+        try:
+            quarter = Quarter.parse(label)
+        except ValueError:
+            continue
+        expanded.update((quarter - back).label for back in range(1, history + 1))
+    return expanded
+
+
+def trailing_sum(values: np.ndarray, ordinals: np.ndarray, window: int = TTM_WINDOW) -> np.ndarray:
+    """(종목, 분기) 배열의 분기 축 이동 합계(최근 window개 분기)를 계산합니다.
+
+    누적합으로 O(종목 × 분기)에 계산하되, 전체 누적합의 차(cumsum[j] - cumsum[j-w])
+    대신 분기 축을 window 크기 블록으로 나눈 블록 내 앞/뒤 누적합을 씁니다.
+
+        합(j-w+1 .. j) = 뒤누적(j-w+1) + 앞누적(j)     (창이 블록 경계를 걸칠 때)
+                       = 앞누적(j)                     (창이 블록과 정확히 겹칠 때)
+
+    더하는 값이 항상 창 안의 w개뿐이라, 큰 누적값끼리 빼면서 생기는 상쇄 오차
+    (예: 실제 합 0이 1e-9가 되어 흑자로 판정)가 없습니다.
+
+    NaN 전파: 창 안에 NaN이 하나라도 있거나(정수 누적합으로 개수 계산), 창의
+    분기가 달력상 연속이 아니면(빠진 분기) 결과는 NaN입니다.
+
+    Args:
+        values (np.ndarray): (종목, 분기) 값 배열. (분기는 시간 순)
+        ordinals (np.ndarray): 분기별 Quarter ordinal. (분기 라벨이 아니면 -1)
+        window (int): 합계할 분기 수.
+
+    Returns:
+        np.ndarray: (종목, 분기) 이동 합계. 처음 window-1개 분기는 NaN.
+    """
+    n_tickers, n_quarters = values.shape
+    result = np.full((n_tickers, n_quarters), np.nan)
+    if n_quarters < window:
+        return result
+
+    missing = np.isnan(values)
+    filled = np.where(missing, 0.0, values)
+
+    # (1) 블록 내 앞/뒤 누적합 (분기 축을 window의 배수로 0-패딩)
+    padded_len = -(-n_quarters // window) * window
+    blocks = np.zeros((n_tickers, padded_len))
+    blocks[:, :n_quarters] = filled
+    blocks = blocks.reshape(n_tickers, -1, window)
+    prefix = np.cumsum(blocks, axis=2).reshape(n_tickers, padded_len)
+    suffix = np.cumsum(blocks[:, :, ::-1], axis=2)[:, :, ::-1].reshape(n_tickers, padded_len)
+
+    # 창 (starts[k] .. ends[k]), k = 0 .. n_quarters - window
+    ends = slice(window - 1, n_quarters)
+    starts = slice(0, n_quarters - window + 1)
+    aligned = np.arange(n_quarters - window + 1) % window == 0
+    sums = prefix[:, ends] + np.where(aligned, 0.0, suffix[:, starts])
+
+    # (2) 창 안의 NaN 개수 (정수 누적합의 차)
+    nan_counts = np.zeros((n_tickers, n_quarters + 1), dtype=np.int32)
+    np.cumsum(missing, axis=1, out=nan_counts[:, 1:])
+    has_nan = nan_counts[:, window:] != nan_counts[:, :n_quarters - window + 1]
+
+    # (3) 창의 분기가 달력상 연속인지
+    contiguous = (
+        (ordinals[starts] != INVALID_ORDINAL)
+        & (ordinals[ends] - ordinals[starts] == window - 1)
+    )
+
+    result[:, ends] = np.where(has_nan | ~contiguous, np.nan, sums)
+    return result
+
+
+def add_derived_metrics(panel: FinancialPanel, metrics: Collection[str]) -> FinancialPanel:
+    """파생 지표들을 계산해 덧붙인 패널을 반환합니다.
+
+    원본 지표가 패널에 없는 파생 지표는 건너뜁니다. (해당 전략은 실행 시
+    'Metric 없음'으로 처리)
+
+    Args:
+        panel (FinancialPanel): 원본 지표 패널.
+        metrics (Collection[str]): 파생 지표 이름들. (예: {"영업이익_TTM"})
+
+    Returns:
+        FinancialPanel: 파생 지표가 추가된 패널. (추가할 것이 없으면 원래 패널)
+    """
+    extra = {}
+    for metric in sorted(metrics):
+        source = source_metric(metric)
+        if source is not None and panel.has_metric(source):
+            extra[metric] = trailing_sum(panel.metric_values(source), panel.quarter_ordinals)
+
+    return panel.with_metrics(extra) if extra else panel
@@ -0,0 +1,194 @@
+"""전략들을 프로세스 풀에서 병렬 실행하기 위한 보조 모듈입니다.
+
+재무 패널은 작업(task)마다 피클링하지 않고, 공유 메모리(SharedMemory)에
+한 번만 복사한 뒤 각 워커가 읽기 전용으로 붙어서(attach) 사용합니다.
+워커마다 패널을 감싼 QuantScreeningService를 하나씩 만들어 두고,
+작업으로는 (전략_이름, Criteria)만 전달합니다.
+"""
+
+import contextlib
+import itertools
+import os
+import time
+from concurrent.futures import Executor, FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Callable, Collection, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from domain.model.criteria import Criteria
+from domain.model.data_models import FinancialData, FinancialPanel
+from domain.ports.outbound import FinancialDataSourcePort, StrategyLoaderPort
+
+
+# (shm 이름, 배열 모양, 종목 라벨, 분기 라벨, 지표 라벨, 종목 인덱스 이름)
+PanelSpec = Tuple[str, Tuple[int, int, int], List[Hashable], List[Hashable], List[str], Optional[str]]
+
+# 워커 프로세스 전역 상태 (initializer에서 한 번 설정)
+_WORKER_SHM: Optional[shared_memory.SharedMemory] = None
+_WORKER_SERVICE = None
+
+
+class _InMemoryDataSource(FinancialDataSourcePort):
+    """이미 메모리에 있는 FinancialData를 그대로 돌려주는 워커용 데이터 소스입니다."""
+
+    def __init__(self, financial_data: FinancialData):
+        self.financial_data = financial_data
+
+    def load_financial_data(
+        self,
+        metrics: Optional[Collection[str]] = None,
+        quarters: Optional[Collection[str]] = None
+    ) -> FinancialData:
+        return self.financial_data
+
+
+class _EmptyStrategyLoader(StrategyLoaderPort):
+    """워커용 전략 로더입니다. (전략은 작업 단위로 전달되므로 비어 있음)"""
+
+    def load_active_strategies(self) -> Dict[str, Criteria]:
+        return {}
+
+
+def run_in_process_pool(
+    panel: FinancialPanel,
+    strategies: Dict[str, Criteria],
+    max_workers: Optional[int] = None
+) -> Dict[str, Tuple[pd.DataFrame, float]]:
+    """전략들을 프로세스 풀에서 실행합니다.
+
+    Args:
+        panel (FinancialPanel): 공유할 재무 패널.
+        strategies (Dict[str, Criteria]): {전략_이름: Criteria_객체}.
+        max_workers (Optional[int]): 워커 수. None이면 CPU 개수.
+
+    Returns:
+        Dict[str, Tuple[pd.DataFrame, float]]:
+            {전략_이름: (결과 DataFrame, 실행 시간(초))}. (완료 순서와 무관)
+    """
+    workers = max_workers or os.cpu_count() or 1
+    tasks = list(strategies.items())
+    chunksize = max(1, len(tasks) // (workers * 4))
+
+    with _shared_panel_pool(panel, workers) as pool:
+        outputs = pool.map(_run_strategy, tasks, chunksize=chunksize)
+        return {name: (result_df, seconds) for name, result_df, seconds in outputs}
+
+
+def iter_in_process_pool(
+    panel: FinancialPanel,
+    strategies: Dict[str, Criteria],
+    max_workers: Optional[int] = None
+) -> Iterator[Tuple[str, pd.DataFrame, float]]:
+    """전략들을 프로세스 풀에서 실행하고, 끝나는 순서대로 결과를 내보냅니다.
+
+    작업은 작은 묶음(batch)으로 나눠 워커 수의 2배까지만 동시에 제출하므로,
+    소비자가 결과를 처리하는 동안 끝난 결과가 무한정 쌓이지 않습니다.
+
+    Args:
+        panel (FinancialPanel): 공유할 재무 패널.
+        strategies (Dict[str, Criteria]): {전략_이름: Criteria_객체}.
+        max_workers (Optional[int]): 워커 수. None이면 CPU 개수.
+
+    Yields:
+        Tuple[str, pd.DataFrame, float]: (전략_이름, 결과 DataFrame, 실행 시간(초)).
+    """
+    workers = max_workers or os.cpu_count() or 1
+    tasks = list(strategies.items())
+    batch_size = max(1, len(tasks) // (workers * 8))
+    batches = [tasks[i:i + batch_size] for i in range(0, len(tasks), batch_size)]
+
+    with _shared_panel_pool(panel, workers) as pool:
+        for outputs in iter_completed(pool, _run_strategy_batch, batches, workers * 2):
+            yield from outputs
+
+
+def iter_completed(
+    pool: Executor,
+    func: Callable,
+    tasks: Iterable,
+    max_pending: int
+) -> Iterator:
+    """작업을 최대 max_pending개까지만 제출해 두고, 끝나는 순서대로 결과를 내보냅니다.
+
+    Args:
+        pool (Executor): 스레드/프로세스 풀.
+        func (Callable): 작업 하나를 처리할 함수. (func(task))
+        tasks (Iterable): 작업 목록.
+        max_pending (int): 동시에 제출해 둘 최대 작업 수.
+
+    Yields:
+        func(task)의 반환값. (완료 순서)
+    """
+    remaining = iter(tasks)
+    pending: set[Future] = {
+        pool.submit(func, task) for task in itertools.islice(remaining, max(1, max_pending))
+    }
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            task = next(remaining, None)
+            if task is not None:
+                pending.add(pool.submit(func, task))
+            yield future.result()
+
+
+@contextlib.contextmanager
+def _shared_panel_pool(panel: FinancialPanel, workers: int) -> Iterator[ProcessPoolExecutor]:
+    """패널을 공유 메모리에 올리고, 그 패널에 붙은 워커들의 프로세스 풀을 엽니다."""
+    shm = shared_memory.SharedMemory(create=True, size=max(panel.values.nbytes, 1))
+    try:
+        _copy_to_shared_memory(panel, shm)
+        spec: PanelSpec = (
+            shm.name,
+            panel.values.shape,
+            list(panel.tickers),
+            list(panel.quarters),
+            list(panel.metrics),
+            panel.tickers.name,
+        )
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(spec,)
+        ) as pool:
+            yield pool
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _copy_to_shared_memory(panel: FinancialPanel, shm: shared_memory.SharedMemory):
+    """패널 배열을 공유 메모리로 복사합니다. (함수 종료 시 버퍼 참조 해제)"""
+    shared = np.ndarray(panel.values.shape, dtype=np.float64, buffer=shm.buf, order="F")
+    shared[...] = panel.values
+
+
+def _init_worker(spec: PanelSpec):
+    """워커 시작 시 공유 메모리 패널에 붙고, 워커 전용 서비스를 만듭니다."""
+    global _WORKER_SHM, _WORKER_SERVICE
+    from domain.service.screening_service import QuantScreeningService
+
+    shm_name, shape, tickers, quarters, metrics, ticker_name = spec
+    _WORKER_SHM = shared_memory.SharedMemory(name=shm_name, track=False)
+    values = np.ndarray(shape, dtype=np.float64, buffer=_WORKER_SHM.buf, order="F")
+    panel = FinancialPanel(values, tickers, quarters, metrics, ticker_name)
+
+    _WORKER_SERVICE = QuantScreeningService(
+        data_source=_InMemoryDataSource(FinancialData(panel=panel)),
+        strategy_loader=_EmptyStrategyLoader(),
+    )
+
+
+def _run_strategy(task: Tuple[str, Criteria]) -> Tuple[str, pd.DataFrame, float]:
+    """워커에서 전략 하나를 실행합니다."""
+    name, criteria = task
+    start = time.perf_counter()
+    result_df = _WORKER_SERVICE._execute_strategy(name, criteria)
+    return name, result_df, time.perf_counter() - start
+
+
+def _run_strategy_batch(
+    tasks: List[Tuple[str, Criteria]]
+) -> List[Tuple[str, pd.DataFrame, float]]:
+    """워커에서 전략 묶음을 실행합니다. (작업 전달 비용을 묶음 단위로 분산)"""
+    return [_run_strategy(task) for task in tasks]
@@ -4,17 +4,45 @@
 모든 계산과 필터링을 오케스트레이션합니다.
 """
 
-from typing import Dict, List, Callable, Optional
+import contextlib
+import copy
+import dataclasses
+import hashlib
+import heapq
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Callable, Optional, Set, Tuple
 import pandas as pd
 import numpy as np
 
 # 1. 포트 임포트 (의존성)
 from domain.ports.inbound import ScreeningUseCasePort
-from domain.ports.outbound import FinancialDataSourcePort, StrategyLoaderPort
+from domain.ports.outbound import (
+    FinancialDataSourcePort, NullTracer, ResultCachePort, StrategyLoaderPort, TracerPort
+)
 
 # 2. 모델 임포트 (데이터 구조)
-from domain.model.criteria import Criteria, QoQCriteria
-from domain.model.data_models import FinancialData
+from domain.model.criteria import (
+    YOY_LAG, CompositeCriteria, Criteria, GrowthStreakCriteria, QoQCriteria, QoQSweepCriteria,
+    QoQTemplate, TurnaroundCriteria, YoYCriteria
+)
+from domain.model.data_models import FinancialData, FinancialPanel
+from domain.model.quarter import resolve_quarter_ref
+
+# 3. 병렬 실행 / 파생 지표 보조 모듈
+from domain.service import derived_metrics, parallel_executor
+
+
+# 결과 캐시 키에 포함되는 계산 엔진 버전. 커널의 결과(값/컬럼/정렬)가 바뀌면 올립니다.
+ENGINE_VERSION = "2"
+
+# 조합 조건 말단의 (종목별 통과 마스크, {근거 열 이름: 종목별 값})
+LeafMask = Tuple[np.ndarray, Dict[str, np.ndarray]]
+
+# 실행에 실패한 전략의 빈 결과에 붙는 표식 (DataFrame.attrs 키). 결과 캐시에 저장하지 않음
+FAILED_RESULT_ATTR = "execution_failed"
 
 
 class QuantScreeningService(ScreeningUseCasePort):
@@ -23,44 +51,698 @@ class QuantScreeningService(ScreeningUseCasePort):
     핵심 비즈니스 로직을 담당하는 도메인 서비스입니다.
     """
 
+    EXECUTION_MODES = ("sequential", "thread", "process")
+
+    # 실행 요약에 개별 실행 시간을 출력할 (가장 느린) 전략 수
+    SLOWEST_STRATEGIES_SHOWN = 5
+
     def __init__(
         self,
         data_source: FinancialDataSourcePort,
-        strategy_loader: StrategyLoaderPort
+        strategy_loader: StrategyLoaderPort,
+        execution_mode: str = "sequential",
+        max_workers: Optional[int] = None,
+        tracer: Optional[TracerPort] = None,
+        result_cache: Optional[ResultCachePort] = None
     ):
         """서비스를 초기화하고 의존성을 주입합니다.
 
         Args:
             data_source (FinancialDataSourcePort): 재무 데이터를 로드할 Outbound Port.
             strategy_loader (StrategyLoaderPort): 전략을 로드할 Outbound Port.
+            execution_mode (str): 전략 실행 방식.
+                - "sequential": 한 전략씩 순서대로 실행 (기본값)
+                - "thread": 스레드 풀에서 실행 (패널/성장률 메모를 그대로 공유)
+                - "process": 프로세스 풀에서 실행 (패널은 공유 메모리로 한 번만 전달)
+            max_workers (Optional[int]): 풀 크기. None이면 CPU 개수.
+            tracer (Optional[TracerPort]): 단계/전략별 계측용 트레이서. (없으면 계측 안 함)
+            result_cache (Optional[ResultCachePort]): 실행 간 결과 캐시. (없으면 매번 계산)
+
+        Raises:
+            ValueError: 알 수 없는 execution_mode인 경우.
         """
+        if execution_mode not in self.EXECUTION_MODES:
+            raise ValueError(f"알 수 없는 실행 모드 ({execution_mode})")
+
         self.data_source = data_source
         self.strategy_loader = strategy_loader
+        self.execution_mode = execution_mode
+        self.max_workers = max_workers
+        self.tracer = tracer or NullTracer()
+        self.result_cache = result_cache
 
-        self.financial_data: FinancialData = self.data_source.load_financial_data()
-        self.active_strategies: Dict[str, Criteria] = self.strategy_loader.load_active_strategies()
+        # 마지막 실행의 전략별 실행 시간(초)
+        self.strategy_timings: Dict[str, float] = {}
 
-        self._metric_map: Dict[str, pd.DataFrame] = {
-            "영업이익": self.financial_data.operating_profit,
-            "매출액": self.financial_data.sales,
-            "당기순이익": self.financial_data.net_income,
-        }
+        # 실행(run) 단위 성장률 메모: (metric, base_quarter, target_quarter) -> 성장률 벡터
+        self._growth_cache: Dict[Tuple[str, str, str], np.ndarray] = {}
+        self._growth_cache_lock = threading.Lock()
+
+        # 실행(run) 단위 조합 조건 말단 메모: 말단 Criteria -> (통과 마스크, 근거 열)
+        self._mask_cache: Dict[Criteria, LeafMask] = {}
+
+        # (지표, 분기 간격)별 (종목 × 분기 쌍) 성장률 행렬. 데이터가 바뀌지 않는 한 유지
+        self._growth_matrix_cache: Dict[Tuple[str, int], np.ndarray] = {}
+
+        # (지표, 성장 기준)별 (종목 × 분기) 연속 성장 분기 수 행렬. 데이터가 바뀌지 않는 한 유지
+        self._streak_matrix_cache: Dict[Tuple[str, Optional[float]], np.ndarray] = {}
+
+        # 데이터 보충 로드(재로드)를 직렬화 (동시 요청을 받는 인바운드 어댑터용)
+        self._data_lock = threading.Lock()
+
+        # 패널/데이터 종속 캐시 교체와 실행용 사본(_execution_view) 생성을 서로 원자적으로 만듦
+        self._panel_lock = threading.Lock()
+
+        # 지금까지 요청된 파생 지표 (예: "영업이익_TTM"). 로드할 때마다 다시 계산해 패널에 덧붙임
+        self._derived_metrics: Set[str] = set()
+
+        with self.tracer.span("service.init"):
+            # 전략을 먼저 로드해야 어떤 지표/분기가 필요한지 알 수 있음
+            self.active_strategies: Dict[str, Criteria] = (
+                self.strategy_loader.load_active_strategies()
+            )
+
+            self._loaded_metrics, self._loaded_quarters = (
+                self._collect_data_requirements(self.active_strategies)
+            )
+            self._set_financial_data(self._load_financial_data(
+                metrics=self._loaded_metrics, quarters=self._loaded_quarters
+            ))
         
+        self._bind_kernels()
+
+    def _bind_kernels(self):
+        """type별 실행기/마스크 커널을 이 인스턴스의 메서드로 묶습니다. (실행용 사본도 다시 묶음)"""
         self._execution_map: Dict[str, Callable[[Criteria], pd.DataFrame]] = { # <--- 타입 힌트 수정
             "QoQ_Growth": self._execute_qoq_growth,
+            "QoQ_Growth_Sweep": self._execute_qoq_sweep,
+            "QoQ_Turnaround": self._execute_qoq_turnaround,
+            "YoY_Growth": self._execute_yoy_growth,
+            "Growth_Streak": self._execute_growth_streak,
+            "Composite": self._execute_composite,
+        }
+
+        # 조합 조건(Composite)의 말단으로 쓸 수 있는 type별 마스크 커널
+        self._mask_map: Dict[str, Callable[[Criteria], LeafMask]] = {
+            "QoQ_Growth": self._qoq_growth_mask,
+            "QoQ_Turnaround": self._turnaround_mask,
+            "YoY_Growth": self._yoy_growth_mask,
+            "Growth_Streak": self._growth_streak_mask,
         }
 
+    def _load_financial_data(
+        self, metrics: Optional[Set[str]], quarters: Optional[Set[str]]
+    ) -> FinancialData:
+        """데이터 소스에서 원본 지표를 읽고, 파생 지표(TTM 등)를 계산해 덧붙입니다.
+
+        파생 지표는 원본 지표로 바꿔 로드하며, TTM 창을 채우도록 요청 분기마다
+        직전 3개 분기를 함께 로드합니다.
+
+        Args:
+            metrics (Optional[Set[str]]): 필요한 지표 이름들. (파생 지표 포함, None이면 전체)
+            quarters (Optional[Set[str]]): 필요한 분기 이름들. None이면 전체.
+
+        Returns:
+            FinancialData: 파생 지표까지 포함한 패널의 FinancialData.
+        """
+        source_metrics, derived = derived_metrics.split_metrics(metrics)
+        self._derived_metrics |= derived
+
+        if self._derived_metrics:
+            if source_metrics is not None:
+                source_metrics |= {
+                    derived_metrics.source_metric(metric) for metric in self._derived_metrics
+                }
+            if quarters is not None:
+                quarters = derived_metrics.expand_quarters(quarters, derived_metrics.TTM_WINDOW - 1)
+
+        financial_data = self.data_source.load_financial_data(
+            metrics=source_metrics, quarters=quarters
+        )
+        if not self._derived_metrics:
+            return financial_data
+
+        with self.tracer.span("service.derived_metrics"):
+            return FinancialData(panel=derived_metrics.add_derived_metrics(
+                financial_data.panel, self._derived_metrics
+            ))
+
+    def _set_financial_data(self, financial_data: FinancialData):
+        """재무 데이터를 교체하고, 데이터에 종속된 캐시를 새로 시작합니다.
+
+        캐시는 비우지 않고 새 딕셔너리로 바꾸므로, 이전 패널로 진행 중인 실행
+        (_execution_view의 사본)은 끝까지 이전 패널과 그 캐시를 씁니다.
+        """
+        with self._panel_lock:
+            self.financial_data: FinancialData = financial_data
+
+            # 모든 커널은 이 패널의 ndarray 슬라이스 위에서 동작
+            self.panel: FinancialPanel = financial_data.panel
+            self._panel_label_digest: Optional[bytes] = None
+            self._column_digests: Dict[Tuple[str, str], bytes] = {}
+
+            self._growth_cache = {}
+            self._mask_cache = {}
+            self._growth_matrix_cache = {}
+            self._streak_matrix_cache = {}
+
+    def _execution_view(self, new_run: bool = False) -> "QuantScreeningService":
+        """현재 패널과 데이터 종속 캐시에 고정된 실행용 사본을 만듭니다.
+
+        사본은 원본과 같은 캐시 딕셔너리를 쓰므로 계산 결과는 원본에도 남고,
+        데이터가 교체되면 원본만 새 패널과 새 캐시로 바뀝니다. 실행은 락 없이
+        사본 위에서 진행되므로, 결과를 받는 도중 데이터를 다시 로드해도 됩니다.
+        (새 데이터는 다음 실행부터 반영)
+
+        Args:
+            new_run (bool): True면 실행(run) 단위 메모(성장률 벡터, 말단 마스크)를 새로 시작.
+
+        Returns:
+            QuantScreeningService: 실행용 사본.
+        """
+        with self._panel_lock:
+            if new_run:
+                self._growth_cache = {}
+                self._mask_cache = {}
+            view = copy.copy(self)
+        view._bind_kernels()
+        return view
+
+    def _ensure_full_history(self, metrics: Set[str]):
+        """지표들의 전체 분기 이력이 패널에 있도록 필요 시 데이터를 다시 로드합니다.
+
+        전략 기준으로 분기/지표를 잘라 로드한 경우에만 다시 로드하며,
+        기존 전략이 쓰던 지표도 함께 로드하므로 기존 전략 실행에는 영향이 없습니다.
+
+        Args:
+            metrics (Set[str]): 전체 이력이 필요한 지표 이름들.
+        """
+        self._ensure_loaded(metrics, None)
+
+    def _ensure_loaded(self, metrics: Optional[Set[str]], quarters: Optional[Set[str]]):
+        """요청한 지표/분기가 패널에 있도록 필요 시 데이터를 다시 로드합니다.
+
+        이미 로드한 지표/분기에 합쳐서 로드하므로(None은 '전체') 기존 전략 실행에는
+        영향이 없습니다. 여러 스레드에서 동시에 호출해도 한 번만 다시 로드합니다.
+        진행 중인 실행은 교체 전의 패널로 끝까지 진행됩니다. (_execution_view)
+
+        Args:
+            metrics (Optional[Set[str]]): 필요한 지표 이름들. None이면 모든 지표.
+            quarters (Optional[Set[str]]): 필요한 분기 이름들. None이면 모든 분기.
+        """
+        with self._data_lock:
+            new_metrics = (
+                None if metrics is None or self._loaded_metrics is None
+                else self._loaded_metrics | metrics
+            )
+            new_quarters = (
+                None if quarters is None or self._loaded_quarters is None
+                else self._loaded_quarters | quarters
+            )
+            if new_metrics == self._loaded_metrics and new_quarters == self._loaded_quarters:
+                return
+
+            self._set_financial_data(self._load_financial_data(
+                metrics=new_metrics, quarters=new_quarters
+            ))
+            self._loaded_metrics, self._loaded_quarters = new_metrics, new_quarters
+
+    def _collect_data_requirements(
+        self, strategies: Dict[str, Criteria]
+    ) -> Tuple[Optional[Set[str]], Optional[Set[str]]]:
+        """전략들이 참조하는 지표/분기의 합집합을 계산합니다.
+
+        Args:
+            strategies (Dict[str, Criteria]): 로드된 전략 딕셔너리.
+
+        Returns:
+            Tuple[Optional[Set[str]], Optional[Set[str]]]:
+                (지표 집합, 분기 집합). 하나라도 '전체'(None)를 요구하면 None.
+        """
+        metrics: Optional[Set[str]] = set()
+        quarters: Optional[Set[str]] = set()
+
+        for criteria in strategies.values():
+            required_metrics = criteria.required_metrics()
+            required_quarters = criteria.required_quarters()
+
+            if metrics is not None:
+                metrics = None if required_metrics is None else metrics | required_metrics
+            if quarters is not None:
+                quarters = None if required_quarters is None else quarters | required_quarters
+
+        return metrics, quarters
+
     def run_all_active_strategies(self) -> Dict[str, pd.DataFrame]: # <--- 반환 타입 수정
         """로드된 모든 활성 전략을 실행합니다.
         
         Returns:
             Dict[str, pd.DataFrame]: {전략_이름: [결과 DataFrame]} 딕셔너리.
         """
+        # 같은 (지표, 분기 쌍)을 쓰는 전략끼리 성장률 벡터를 공유
+        view = self._execution_view(new_run=True)
+
+        start = time.perf_counter()
+        with self.tracer.span("service.run_all_active_strategies"):
+            outputs = view._run_strategies(self.active_strategies)
+        elapsed = time.perf_counter() - start
+
+        # 완료 순서와 무관하게 항상 전략 로드 순서로 정렬
         results = {}
-        for strategy_name, criteria in self.active_strategies.items():
-            results[strategy_name] = self._execute_strategy(strategy_name, criteria)
+        self.strategy_timings = {}
+        for strategy_name in self.active_strategies:
+            results[strategy_name], self.strategy_timings[strategy_name] = outputs[strategy_name]
+
+        print(f"[Service] {len(results)}개 전략 실행 완료 "
+              f"({self.execution_mode}, {elapsed:.3f}s)")
+        self._print_slowest_strategies()
         return results
 
+    def iter_active_strategies(self) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """로드된 모든 활성 전략을 실행하고, 전략이 끝나는 대로 결과를 내보냅니다.
+
+        run_all_active_strategies()와 같은 결과를 내지만 전체 결과를 모아 두지
+        않으므로, 호출자는 첫 결과를 바로 받아 저장/출력을 계산과 겹칠 수 있고
+        결과 DataFrame을 한꺼번에 메모리에 들고 있을 필요가 없습니다.
+        병렬 모드에서는 완료 순서대로, 순차 모드에서는 로드 순서대로 내보내며,
+        동시에 진행 중인 작업 수는 풀 크기의 2배로 제한합니다.
+
+        반복은 시작 시점의 데이터로 끝까지 진행되며 락을 잡고 있지 않으므로, 반복 중에
+        데이터를 다시 로드하는 메서드(reload_*, run_criteria 등)를 불러도 됩니다.
+
+        Yields:
+            Tuple[str, pd.DataFrame]: (전략_이름, 결과 DataFrame).
+        """
+        view = self._execution_view(new_run=True)
+
+        self.strategy_timings = {}
+        start = time.perf_counter()
+        for strategy_name, result_df, seconds in view._iter_strategies(
+            dict(self.active_strategies), streaming=True
+        ):
+            self.strategy_timings[strategy_name] = seconds
+            yield strategy_name, result_df
+
+        print(f"[Service] {len(self.strategy_timings)}개 전략 스트리밍 실행 완료 "
+              f"({self.execution_mode}, {time.perf_counter() - start:.3f}s)")
+        self._print_slowest_strategies()
+
+    def _print_slowest_strategies(self):
+        """가장 느린 전략 몇 개의 실행 시간만 출력합니다. (전체는 strategy_timings / 트레이서)"""
+        slowest = heapq.nlargest(
+            self.SLOWEST_STRATEGIES_SHOWN, self.strategy_timings.items(), key=lambda item: item[1]
+        )
+        for strategy_name, seconds in slowest:
+            print(f"  -> [{strategy_name}] {seconds * 1000:.1f}ms")
+
+    def reload_strategies(self) -> Tuple[Set[str], Set[str]]:
+        """전략 로더에서 활성 전략을 다시 읽고, 기존 전략과의 차이를 반환합니다.
+
+        내용(Criteria 값)이 같은 전략은 바뀌지 않은 것으로 보며, 새로 필요한
+        지표/분기가 있으면 데이터를 보충 로드합니다.
+
+        Returns:
+            Tuple[Set[str], Set[str]]: (새로 생겼거나 바뀐 전략 이름들, 사라진 전략 이름들).
+        """
+        with self.tracer.span("service.reload_strategies"):
+            strategies = self.strategy_loader.load_active_strategies()
+
+            changed = {
+                name for name, criteria in strategies.items()
+                if self.active_strategies.get(name) != criteria
+            }
+            removed = set(self.active_strategies) - set(strategies)
+
+            if changed:
+                self._ensure_loaded(*self._collect_data_requirements(
+                    {name: strategies[name] for name in changed}
+                ))
+            self.active_strategies = strategies
+            return changed, removed
+
+    def reload_financial_data(self):
+        """현재 로드 범위(지표/분기) 그대로 재무 데이터를 다시 로드합니다.
+
+        데이터 파일이 바뀐 경우에 호출하며, 데이터에 종속된 캐시도 함께 비웁니다.
+        """
+        with self.tracer.span("service.reload_financial_data"), self._data_lock:
+            self._set_financial_data(self._load_financial_data(
+                metrics=self._loaded_metrics, quarters=self._loaded_quarters
+            ))
+
+    def get_active_strategies(self) -> Dict[str, Criteria]:
+        """로드된 활성 전략 목록을 반환합니다. (복사본)"""
+        return dict(self.active_strategies)
+
+    def run_strategy(self, strategy_name: str) -> pd.DataFrame:
+        """활성 전략 하나를 이름으로 실행합니다.
+
+        성장률 메모는 비우지 않으므로, 같은 분기 쌍을 반복 조회하면
+        이전 실행의 성장률 벡터를 그대로 재사용합니다.
+
+        Args:
+            strategy_name (str): 실행할 전략 이름.
+
+        Returns:
+            pd.DataFrame: 통과된 종목 및 근거 데이터.
+
+        Raises:
+            KeyError: 해당 이름의 활성 전략이 없는 경우.
+        """
+        criteria = self.active_strategies.get(strategy_name)
+        if criteria is None:
+            raise KeyError(f"활성 전략 없음: '{strategy_name}'")
+
+        view = self._execution_view()
+        result_df, _ = view._run_strategies({strategy_name: criteria})[strategy_name]
+        return result_df
+
+    def run_criteria(self, criteria: Criteria, name: str = "adhoc") -> pd.DataFrame:
+        """임의의(ad-hoc) Criteria를 실행합니다.
+
+        로드된 전략 실행(_execute_strategy)과 달리 오류를 빈 결과로 삼키지 않고
+        그대로 올려 보내, 호출자가 잘못된 요청을 구분할 수 있게 합니다.
+
+        Args:
+            criteria (Criteria): 실행할 Criteria 객체.
+            name (str): 계측용 이름.
+
+        Returns:
+            pd.DataFrame: 통과된 종목 및 근거 데이터.
+
+        Raises:
+            ValueError: 지원하지 않는 type이거나 지표가 없는 경우.
+            KeyError: 분기(열)가 없는 경우.
+        """
+        if criteria.type not in self._execution_map:
+            raise ValueError(f"알 수 없는 type ({criteria.type})")
+
+        required_metrics = criteria.required_metrics()
+        required_quarters = criteria.required_quarters()
+        self._ensure_loaded(
+            None if required_metrics is None else set(required_metrics),
+            None if required_quarters is None else set(required_quarters),
+        )
+
+        view = self._execution_view()
+        with self.tracer.span(name, "strategy"):
+            return view._execution_map[criteria.type](view._resolve_quarter_refs(criteria))
+
+    def run_qoq_backtest(self, templates: Dict[str, QoQTemplate]) -> Dict[str, pd.DataFrame]:
+        """QoQ 템플릿들을 모든 인접 분기 쌍에 대해 한 번에 평가합니다. (워크포워드)
+
+        분기 쌍마다 단일 전략 실행기를 반복 호출하지 않고, 지표별 성장률
+        행렬(_get_growth_matrix)을 템플릿끼리 공유하여 템플릿당 한 번의
+        행렬 비교(matrix >= 임계값)로 모든 분기의 통과 여부를 구합니다.
+
+        Args:
+            templates (Dict[str, QoQTemplate]): {템플릿_이름: QoQTemplate}.
+
+        Returns:
+            Dict[str, pd.DataFrame]: {템플릿_이름: 분기별 결과 DataFrame}.
+                (인덱스: Target_Quarter)
+                - Base_Quarter: 기준(직전) 분기
+                - Pass_Count: 통과 종목 수
+                - Universe: 성장률 계산이 가능한 종목 수
+                - Tickers: 통과 종목 (성장률 높은 순, 쉼표 구분)
+                분기가 연속되지 않은 패널(빠진 분기)에서는 빈 DataFrame.
+        """
+        with self.tracer.span("service.run_qoq_backtest"):
+            self._ensure_full_history({template.metric for template in templates.values()})
+
+            view = self._execution_view()
+
+            results = {}
+            for name, template in templates.items():
+                try:
+                    # (인접 열이 인접 분기여야 열 쌍이 곧 QoQ가 됨)
+                    view._require_contiguous_quarters()
+                    matrix = view._get_growth_matrix(template.metric)
+                except (ValueError, KeyError) as e:
+                    print(f"  🚨 실행 오류: [{name}] {e}")
+                    results[name] = pd.DataFrame()
+                    continue
+
+                results[name] = view._summarize_growth_matrix(matrix, template.min_growth_pct, lag=1)
+            return results
+
+    def _summarize_growth_matrix(
+        self, matrix: np.ndarray, min_growth: float, lag: int
+    ) -> pd.DataFrame:
+        """성장률 행렬(_get_growth_matrix)의 분기 쌍별 통과 현황을 한 번에 구합니다.
+
+        Args:
+            matrix (np.ndarray): (종목 × 분기 쌍) 성장률 행렬.
+            min_growth (float): 최소 통과 성장률.
+            lag (int): 행렬의 분기 간격. (열 j = 분기 j -> j+lag)
+
+        Returns:
+            pd.DataFrame: 분기별 결과 (인덱스: Target_Quarter).
+                - Base_Quarter: 기준 분기
+                - Pass_Count: 통과 종목 수
+                - Universe: 성장률 계산이 가능한 종목 수
+                - Tickers: 통과 종목 (성장률 높은 순, 쉼표 구분)
+        """
+        quarters = self.panel.quarters
+        tickers = self.panel.tickers.to_numpy()
+
+        passed = matrix >= min_growth
+        counts = passed.sum(axis=0)
+
+        # 통과 칸을 (분기 쌍, 성장률 내림차순)으로 한 번에 정렬한 뒤 분기별로 분할
+        cols, rows = np.nonzero(passed.T)
+        order = np.lexsort((-matrix[rows, cols], cols))
+        groups = np.split(rows[order], np.cumsum(counts)[:-1]) if len(counts) else []
+
+        return pd.DataFrame(
+            {
+                "Base_Quarter": quarters[:matrix.shape[1]],
+                "Pass_Count": counts,
+                "Universe": (~np.isnan(matrix)).sum(axis=0),
+                "Tickers": [", ".join(tickers[group]) for group in groups],
+            },
+            index=pd.Index(quarters[lag:lag + matrix.shape[1]], name="Target_Quarter"),
+        )
+
+    def _run_strategies(
+        self, strategies: Dict[str, Criteria]
+    ) -> Dict[str, Tuple[pd.DataFrame, float]]:
+        """결과 캐시를 확인한 뒤, 캐시에 없는 전략만 실행합니다.
+
+        Args:
+            strategies (Dict[str, Criteria]): {전략_이름: Criteria_객체}.
+
+        Returns:
+            Dict[str, Tuple[pd.DataFrame, float]]:
+                {전략_이름: (결과 DataFrame, 실행 시간(초))}. (순서 보장 없음)
+        """
+        if self.result_cache is None:
+            return self._run_uncached(strategies)
+
+        return {
+            name: (result_df, seconds)
+            for name, result_df, seconds in self._iter_strategies(strategies, streaming=False)
+        }
+
+    def _iter_strategies(
+        self, strategies: Dict[str, Criteria], streaming: bool
+    ) -> Iterator[Tuple[str, pd.DataFrame, float]]:
+        """캐시에 있는 결과를 먼저 내보낸 뒤, 나머지 전략을 실행하며 내보냅니다.
+
+        Args:
+            strategies (Dict[str, Criteria]): {전략_이름: Criteria_객체}.
+            streaming (bool): True면 실행 결과를 완료되는 대로(_iter_uncached),
+                False면 전체 실행이 끝난 뒤(_run_uncached) 내보냅니다.
+
+        Yields:
+            Tuple[str, pd.DataFrame, float]: (전략_이름, 결과 DataFrame, 실행 시간(초)).
+        """
+        if self.result_cache is None:
+            pending, keys = strategies, {}
+        else:
+            pending, keys = {}, {}
+            # (스트리밍이면 소비자가 결과를 처리하는 시간이 구간에 섞이므로 계측하지 않음)
+            lookup_span = (
+                contextlib.nullcontext() if streaming
+                else self.tracer.span("service.result_cache_lookup")
+            )
+            with lookup_span:
+                for name, criteria in strategies.items():
+                    start = time.perf_counter()
+                    keys[name] = self._result_cache_key(criteria)
+                    cached = self.result_cache.get(keys[name])
+                    if cached is None:
+                        pending[name] = criteria
+                    else:
+                        yield name, self._decode_cached_result(cached), time.perf_counter() - start
+
+        if not pending:
+            computed = iter(())
+        elif streaming:
+            computed = self._iter_uncached(pending)
+        else:
+            computed = (
+                (name, result_df, seconds)
+                for name, (result_df, seconds) in self._run_uncached(pending).items()
+            )
+
+        failed = 0
+        for name, result_df, seconds in computed:
+            if self.result_cache is not None:
+                # (일시적인 실패가 '통과 종목 없음'으로 굳지 않도록 실패한 결과는 저장하지 않음)
+                if result_df.attrs.get(FAILED_RESULT_ATTR):
+                    failed += 1
+                else:
+                    self.result_cache.put(keys[name], self._encode_cached_result(result_df))
+            yield name, result_df, seconds
+
+        if self.result_cache is not None and strategies:
+            print(f"[Service] 결과 캐시 적중 {len(strategies) - len(pending)} / 계산 {len(pending)}"
+                  + (f" (실패 {failed}개는 저장 안 함)" if failed else ""))
+
+    def _result_cache_key(self, criteria: Criteria) -> str:
+        """결과 캐시 키: (엔진 버전, Criteria, 전략이 읽는 데이터 지문)의 SHA-256.
+
+        데이터 지문은 패널 전체가 아니라 Criteria가 참조하는 (지표, 분기) 열과
+        종목 라벨만 해시하므로, 로드 범위(지표/분기)가 달라져도 같은 데이터를
+        읽는 전략은 같은 키를 가집니다.
+        """
+        panel = self.panel
+        if self._panel_label_digest is None:
+            labels = "\x1f".join(map(str, panel.tickers))
+            self._panel_label_digest = hashlib.sha256(
+                f"{panel.tickers.name}\x1e{labels}".encode("utf-8")
+            ).digest()
+
+        digest = hashlib.sha256()
+        digest.update(f"{ENGINE_VERSION}\x1e{criteria.type}\x1e{criteria!r}\x1e".encode("utf-8"))
+        digest.update(self._panel_label_digest)
+
+        metrics = criteria.required_metrics()
+        quarters = criteria.required_quarters()
+        for metric in sorted(panel.metrics if metrics is None else metrics):
+            for quarter in sorted(map(str, panel.quarters) if quarters is None else quarters):
+                digest.update(f"\x1e{metric}\x1f{quarter}\x1f".encode("utf-8"))
+                digest.update(self._column_digest(metric, quarter))
+        return digest.hexdigest()
+
+    def _column_digest(self, metric: str, quarter: str) -> bytes:
+        """(지표, 분기) 열의 해시. (패널이 바뀌지 않는 한 전략끼리 공유)"""
+        key = (metric, quarter)
+        column_digest = self._column_digests.get(key)
+        if column_digest is None:
+            try:
+                column_digest = hashlib.sha256(self.panel.column(metric, quarter)).digest()
+            except KeyError:
+                column_digest = b"\x00missing"
+            self._column_digests[key] = column_digest
+        return column_digest
+
+    def _encode_cached_result(self, result_df: pd.DataFrame) -> pd.DataFrame:
+        """종목 라벨 인덱스를 패널 내 위치(정수)로 바꿔 저장 크기/읽기 비용을 줄입니다.
+
+        키에 종목 라벨 지문이 들어 있으므로, 같은 키로 읽을 때는 항상 같은
+        라벨 순서의 패널 위에서 위치를 되돌립니다.
+        """
+        tickers = self.panel.tickers
+        if result_df.empty or result_df.index.name != tickers.name:
+            return result_df
+
+        codes = tickers.get_indexer(result_df.index)
+        if (codes < 0).any():
+            return result_df
+
+        encoded = result_df.set_axis(pd.Index(codes.astype(np.int32), name=tickers.name))
+        encoded.attrs["ticker_codes"] = True
+        return encoded
+
+    def _decode_cached_result(self, result_df: pd.DataFrame) -> pd.DataFrame:
+        if not result_df.attrs.pop("ticker_codes", False):
+            return result_df
+        return result_df.set_axis(self.panel.tickers[result_df.index.to_numpy()])
+
+    def _run_uncached(
+        self, strategies: Dict[str, Criteria]
+    ) -> Dict[str, Tuple[pd.DataFrame, float]]:
+        """설정된 실행 모드로 전략들을 실행합니다.
+
+        Args:
+            strategies (Dict[str, Criteria]): {전략_이름: Criteria_객체}.
+
+        Returns:
+            Dict[str, Tuple[pd.DataFrame, float]]:
+                {전략_이름: (결과 DataFrame, 실행 시간(초))}. (순서 보장 없음)
+        """
+        if self.execution_mode == "process" and len(strategies) > 1:
+            outputs = parallel_executor.run_in_process_pool(
+                self.panel, strategies, self.max_workers
+            )
+            # (워커 프로세스에서 측정한 시간을 계측 기록으로 옮김)
+            for name, (_, seconds) in outputs.items():
+                self.tracer.record(name, "strategy", seconds)
+            return outputs
+
+        if self.execution_mode == "thread" and len(strategies) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = {
+                    name: pool.submit(self._execute_timed, name, criteria)
+                    for name, criteria in strategies.items()
+                }
+                return {name: future.result() for name, future in futures.items()}
+
+        return {
+            name: self._execute_timed(name, criteria)
+            for name, criteria in strategies.items()
+        }
+
+    def _iter_uncached(
+        self, strategies: Dict[str, Criteria]
+    ) -> Iterator[Tuple[str, pd.DataFrame, float]]:
+        """설정된 실행 모드로 전략들을 실행하며, 끝나는 대로 결과를 내보냅니다.
+
+        병렬 모드에서는 풀 크기의 2배까지만 작업을 제출해 두므로, 소비자가
+        느리면 계산도 그만큼 기다립니다. (끝난 결과가 무한정 쌓이지 않음)
+
+        Args:
+            strategies (Dict[str, Criteria]): {전략_이름: Criteria_객체}.
+
+        Yields:
+            Tuple[str, pd.DataFrame, float]: (전략_이름, 결과 DataFrame, 실행 시간(초)).
+        """
+        if self.execution_mode == "process" and len(strategies) > 1:
+            for name, result_df, seconds in parallel_executor.iter_in_process_pool(
+                self.panel, strategies, self.max_workers
+            ):
+                # (워커 프로세스에서 측정한 시간을 계측 기록으로 옮김)
+                self.tracer.record(name, "strategy", seconds)
+                yield name, result_df, seconds
+            return
+
+        if self.execution_mode == "thread" and len(strategies) > 1:
+            # (ThreadPoolExecutor 기본 풀 크기와 같은 규칙)
+            workers = self.max_workers or min(32, (os.cpu_count() or 1) + 4)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                yield from parallel_executor.iter_completed(
+                    pool, self._execute_named, strategies.items(), workers * 2
+                )
+            return
+
+        for name, criteria in strategies.items():
+            yield self._execute_named((name, criteria))
+
+    def _execute_named(self, task: Tuple[str, Criteria]) -> Tuple[str, pd.DataFrame, float]:
+        """(전략_이름, Criteria) 작업 하나를 실행합니다. (완료 순서로 받는 풀 작업용)"""
+        name, criteria = task
+        result_df, seconds = self._execute_timed(name, criteria)
+        return name, result_df, seconds
+
+    def _execute_timed(self, name: str, criteria: Criteria) -> Tuple[pd.DataFrame, float]:
+        """전략 하나를 실행하고 실행 시간(초)을 함께 반환합니다."""
+        start = time.perf_counter()
+        with self.tracer.span(name, "strategy"):
+            result_df = self._execute_strategy(name, criteria)
+        return result_df, time.perf_counter() - start
+
     def _execute_strategy(self, name: str, criteria: Criteria) -> pd.DataFrame: # <--- 반환 타입 수정
         """디스패치 맵을 사용해 단일 전략을 실행합니다.
 
@@ -69,19 +751,50 @@ class QuantScreeningService(ScreeningUseCasePort):
             criteria (Criteria): 실행할 Criteria 객체.
 
         Returns:
-            pd.DataFrame: 통과된 종목 및 근거 데이터.
+            pd.DataFrame: 통과된 종목 및 근거 데이터. 실행에 실패하면 빈 DataFrame이며,
+                attrs[FAILED_RESULT_ATTR]가 True입니다. ('통과 종목 없음'과 구분)
         """
         executor = self._execution_map.get(criteria.type)
 
         if not executor:
             print(f"  🚨 로직 없음: [{name}] 알 수 없는 type ({criteria.type})")
-            return pd.DataFrame() # <--- 빈 DataFrame 반환
+            return self._failed_result() # <--- 빈 DataFrame 반환
         
         try:
-            return executor(criteria)
+            return executor(self._resolve_quarter_refs(criteria))
         except Exception as e:
             print(f"  🚨 실행 오류: [{name}] {e}")
-            return pd.DataFrame() # <--- 빈 DataFrame 반환
+            return self._failed_result() # <--- 빈 DataFrame 반환
+
+    @staticmethod
+    def _failed_result() -> pd.DataFrame:
+        """실행 실패 표식이 붙은 빈 결과를 만듭니다. (프로세스 워커에서 돌아와도 유지됨)"""
+        result_df = pd.DataFrame()
+        result_df.attrs[FAILED_RESULT_ATTR] = True
+        return result_df
+
+    def _resolve_quarter_refs(self, criteria: Criteria) -> Criteria:
+        """Criteria의 상대 분기("latest", "latest-N")를 현재 패널의 분기 라벨로 바꿉니다.
+
+        상대 분기를 쓰는 Criteria는 required_quarters()가 None이므로, 그렇지 않은
+        Criteria는 그대로 반환합니다.
+
+        Raises:
+            KeyError: 패널에서 최신 분기를 알 수 없는 경우.
+        """
+        if criteria.required_quarters() is not None or not dataclasses.is_dataclass(criteria):
+            return criteria
+        if isinstance(criteria, CompositeCriteria):
+            return dataclasses.replace(criteria, children=tuple(
+                self._resolve_quarter_refs(child) for child in criteria.children
+            ))
+
+        latest = self.panel.latest_quarter
+        return dataclasses.replace(criteria, **{
+            field.name: resolve_quarter_ref(getattr(criteria, field.name), latest)
+            for field in dataclasses.fields(criteria)
+            if field.name.endswith("_quarter")
+        })
 
     def _execute_qoq_growth(self, criteria: QoQCriteria) -> pd.DataFrame: # <--- 반환 타입 수정
         """QoQCriteria 로직을 오케스트레이션합니다.
@@ -93,16 +806,17 @@ class QuantScreeningService(ScreeningUseCasePort):
             pd.DataFrame: 통과된 종목 및 근거 데이터.
         
         Raises:
-            ValueError: criteria.metric이 self._metric_map에 없는 경우.
+            ValueError: criteria.metric이 패널에 없는 경우.
         """
-        df = self._get_metric_dataframe(criteria.metric)
-        if df is None:
+        if not self.panel.has_metric(criteria.metric):
             raise ValueError(f"Metric 없음: '{criteria.metric}'")
 
-        base_values = self._get_quarterly_data(df, criteria.base_quarter)
-        target_values = self._get_quarterly_data(df, criteria.target_quarter)
+        base_values = self._get_quarterly_data(criteria.metric, criteria.base_quarter)
+        target_values = self._get_quarterly_data(criteria.metric, criteria.target_quarter)
 
-        growth_rate = self._safe_growth_rate(base_values, target_values)
+        growth_rate = self._get_growth_rate(
+            criteria.metric, criteria.base_quarter, criteria.target_quarter
+        )
 
         # _filter... 함수 대신 새로운 결과 빌더 함수 호출
         return self._build_qoq_result_dataframe(
@@ -110,86 +824,553 @@ class QuantScreeningService(ScreeningUseCasePort):
             target=target_values,
             rate=growth_rate,
             min_growth=criteria.min_growth_pct,
-            metric_name=criteria.metric
+            metric_name=criteria.metric,
+            top_n=criteria.top_n
+        )
+
+    def _execute_qoq_sweep(self, criteria: QoQSweepCriteria) -> pd.DataFrame:
+        """QoQSweepCriteria 로직: 여러 임계값의 통과 종목 수를 한 번에 계산합니다.
+
+        성장률을 한 번만 내림차순 정렬하면, 임계값 t의 통과 종목은 항상
+        정렬 결과의 앞부분(prefix)이 됩니다. 각 t의 prefix 길이는
+        오름차순 배열에 대한 이진 탐색(np.searchsorted)으로 구합니다.
+
+        Args:
+            criteria (QoQSweepCriteria): 실행할 QoQSweepCriteria 객체.
+
+        Returns:
+            pd.DataFrame: 임계값별 요약 (인덱스: Min_Growth(%)).
+                - Pass_Count: 통과 종목 수 (= 성장률 순위 앞에서부터의 개수)
+                - Cutoff_Growth_Rate(%): 통과 종목 중 최저 성장률
+                - Cutoff_Ticker: 통과 종목 중 최저 성장률 종목 (순위 구간의 끝)
+                - Tickers: 통과 종목 (성장률 높은 순, 쉼표 구분 = 순위의 앞 Pass_Count개)
+
+        Raises:
+            ValueError: criteria.metric이 패널에 없는 경우.
+        """
+        if not self.panel.has_metric(criteria.metric):
+            raise ValueError(f"Metric 없음: '{criteria.metric}'")
+
+        rate = self._get_growth_rate(
+            criteria.metric, criteria.base_quarter, criteria.target_quarter
+        )
+
+        valid = np.flatnonzero(~np.isnan(rate))
+        ranking = valid[np.argsort(-rate[valid], kind="stable")]  # 내림차순 순위
+        ascending = rate[ranking][::-1]
+
+        thresholds = np.asarray(criteria.thresholds, dtype=np.float64)
+        counts = len(ascending) - np.searchsorted(ascending, thresholds, side="left")
+
+        # 각 임계값 구간의 마지막(최저 성장률) 종목
+        has_pass = counts > 0
+        cutoff = ranking[counts[has_pass] - 1]
+        cutoff_rate = np.full(len(thresholds), np.nan)
+        cutoff_rate[has_pass] = np.round(rate[cutoff] * 100, 2)
+        cutoff_ticker = np.full(len(thresholds), "", dtype=object)
+        cutoff_ticker[has_pass] = self.panel.tickers.to_numpy()[cutoff]
+
+        # 통과 종목 목록: 순위 전체를 한 번만 이어 붙이고, 임계값마다 앞부분(prefix)을 자름
+        ranked_names = [str(name) for name in self.panel.tickers.to_numpy()[ranking]]
+        joined = ", ".join(ranked_names)
+        ends = np.cumsum([len(name) + 2 for name in ranked_names]) - 2
+        tickers = [joined[:ends[count - 1]] if count else "" for count in counts.tolist()]
+
+        return pd.DataFrame(
+            {
+                "Pass_Count": counts,
+                "Cutoff_Growth_Rate(%)": cutoff_rate,
+                "Cutoff_Ticker": cutoff_ticker,
+                "Tickers": tickers,
+            },
+            index=pd.Index(np.round(thresholds * 100, 4), name="Min_Growth(%)"),
+        )
+
+    def _execute_qoq_turnaround(self, criteria: TurnaroundCriteria) -> pd.DataFrame:
+        """TurnaroundCriteria 로직: 기준 분기 적자(<= 0) -> 비교 분기 흑자(> 0).
+
+        성장률 나눗셈 없이, QoQ 성장률 전략과 같은 분기 열 뷰 두 개에
+        대한 비교 연산만으로 통과 마스크를 만듭니다. (NaN은 자동 탈락)
+
+        Args:
+            criteria (TurnaroundCriteria): 실행할 TurnaroundCriteria 객체.
+
+        Returns:
+            pd.DataFrame: 통과된 종목 및 근거 데이터 (패널 종목 순서).
+
+        Raises:
+            ValueError: criteria.metric이 패널에 없는 경우.
+        """
+        if not self.panel.has_metric(criteria.metric):
+            raise ValueError(f"Metric 없음: '{criteria.metric}'")
+
+        base_values = self._get_quarterly_data(criteria.metric, criteria.base_quarter)
+        target_values = self._get_quarterly_data(criteria.metric, criteria.target_quarter)
+
+        passed = np.flatnonzero((base_values <= 0) & (target_values > 0))
+
+        return pd.DataFrame(
+            {
+                f"{criteria.metric}(Base)": base_values[passed],
+                f"{criteria.metric}(Target)": target_values[passed],
+            },
+            index=self.panel.tickers[passed],
+        )
+
+    def _execute_yoy_growth(self, criteria: YoYCriteria) -> pd.DataFrame:
+        """YoYCriteria 로직: 전년 동기(4분기 전) 대비 성장률.
+
+        비교 분기를 지정하면 QoQ 성장률 전략과 같은 결과 형식(근거 데이터)을,
+        생략하면 전체 이력을 4열 이동(shift)한 배열 연산 한 번으로 계산한
+        YoY 성장률 행렬에서 분기별 통과 현황(run_qoq_backtest와 같은 형식)을 냅니다.
+
+        Args:
+            criteria (YoYCriteria): 실행할 YoYCriteria 객체.
+
+        Returns:
+            pd.DataFrame: 통과된 종목 및 근거 데이터, 또는 분기별 통과 현황.
+
+        Raises:
+            ValueError: criteria.metric이 패널에 없는 경우.
+            KeyError: 분기(열)가 없거나, 전체 이력 평가 시 분기가 연속되지 않은 경우.
+        """
+        if not self.panel.has_metric(criteria.metric):
+            raise ValueError(f"Metric 없음: '{criteria.metric}'")
+
+        if criteria.target_quarter is None:
+            # (열 위치의 4칸 차이가 곧 1년이 되려면 빠진 분기가 없어야 함)
+            self._require_contiguous_quarters()
+            matrix = self._get_growth_matrix(criteria.metric, lag=YOY_LAG)
+            return self._summarize_growth_matrix(matrix, criteria.min_growth_pct, lag=YOY_LAG)
+
+        base_quarter = criteria.base_quarter
+        return self._build_qoq_result_dataframe(
+            base=self._get_quarterly_data(criteria.metric, base_quarter),
+            target=self._get_quarterly_data(criteria.metric, criteria.target_quarter),
+            rate=self._get_growth_rate(criteria.metric, base_quarter, criteria.target_quarter),
+            min_growth=criteria.min_growth_pct,
+            metric_name=criteria.metric,
+            top_n=criteria.top_n
         )
 
-    def _get_metric_dataframe(self, metric: str) -> Optional[pd.DataFrame]:
-        """매핑을 통해 Metric에 해당하는 DataFrame을 반환합니다.
+    def _execute_growth_streak(self, criteria: GrowthStreakCriteria) -> pd.DataFrame:
+        """GrowthStreakCriteria 로직: 비교 분기까지 N분기 이상 연속 QoQ 성장.
+
+        (지표, 성장 기준)별로 한 번 계산해 둔 연속 성장 분기 수 행렬에서
+        비교 분기 열 하나를 조회하므로, 연속 분기 수(N)나 비교 분기만 다른
+        전략들은 행렬을 공유하고 조회만 합니다.
 
         Args:
-            metric (str): 찾고자 하는 재무 지표 이름 (예: "영업이익").
+            criteria (GrowthStreakCriteria): 실행할 GrowthStreakCriteria 객체.
 
         Returns:
-            Optional[pd.DataFrame]: 해당 지표의 DataFrame 또는 None.
+            pd.DataFrame: 통과된 종목 및 근거 데이터 (연속 분기 수 내림차순).
+                - (지표)(Base): 연속 성장 N분기가 시작되기 직전 분기 값
+                - (지표)(Target): 비교 분기 값
+                - Streak: 비교 분기까지의 실제 연속 성장 분기 수 (N 이상)
+
+        Raises:
+            ValueError: criteria.metric이 패널에 없는 경우.
+            KeyError: 비교 분기(열)가 없거나, 분기가 연속되지 않은 경우.
         """
-        return self._metric_map.get(metric)
+        mask, evidence = self._growth_streak_mask(criteria)
+        passed = np.flatnonzero(mask)
+        order = passed[np.argsort(-evidence["Streak"][passed], kind="stable")]
+        return pd.DataFrame(
+            {column: values[order] for column, values in evidence.items()},
+            index=self.panel.tickers[order],
+        )
 
-    def _get_quarterly_data(self, df: pd.DataFrame, quarter: str) -> pd.Series:
-        """DataFrame에서 특정 분기(열)의 데이터를 추출합니다.
+    def _execute_composite(self, criteria: CompositeCriteria) -> pd.DataFrame:
+        """CompositeCriteria 로직: 말단 조건 마스크들의 비트 연산(AND / OR / NOT).
+
+        말단 조건마다 전체 종목의 통과 마스크와 근거 열을 한 번 계산해 실행(run)
+        단위로 캐시하므로(_get_leaf_mask), 같은 말단 조건을 쓰는 조합 전략들은
+        마스크를 공유하고 각자 비트 연산만 수행합니다.
 
         Args:
-            df (pd.DataFrame): 원본 데이터프레임.
+            criteria (CompositeCriteria): 실행할 CompositeCriteria 객체.
+
+        Returns:
+            pd.DataFrame: 통과된 종목 (패널 종목 순서). 말단 조건마다(정의 순서 n = 1, 2, ...)
+                - [n] Pass: 말단 조건 통과 여부 (any/not 조합에서는 False일 수 있음)
+                - [n] (근거 열): 말단 조건의 근거 데이터 (예: "[1] 매출액(Base)")
+
+        Raises:
+            ValueError: 말단 조건의 지표가 패널에 없거나 마스크를 낼 수 없는 type인 경우.
+            KeyError: 말단 조건의 분기(열)가 없는 경우.
+        """
+        passed = np.flatnonzero(self._evaluate_mask(criteria))
+
+        columns = {}
+        for number, leaf in enumerate(criteria.leaves(), start=1):
+            mask, evidence = self._get_leaf_mask(leaf)
+            columns[f"[{number}] Pass"] = mask[passed]
+            for column, values in evidence.items():
+                columns[f"[{number}] {column}"] = values[passed]
+
+        return pd.DataFrame(columns, index=self.panel.tickers[passed])
+
+    def _evaluate_mask(self, criteria: Criteria) -> np.ndarray:
+        """조합 트리를 말단 마스크의 비트 연산으로 평가합니다."""
+        if not isinstance(criteria, CompositeCriteria):
+            return self._get_leaf_mask(criteria)[0]
+
+        masks = [self._evaluate_mask(child) for child in criteria.children]
+        if criteria.operator == "all":
+            return np.logical_and.reduce(masks)
+        if criteria.operator == "any":
+            return np.logical_or.reduce(masks)
+        if criteria.operator == "not":
+            return ~masks[0]
+        raise ValueError(f"알 수 없는 조합 연산자 ({criteria.operator})")
+
+    def _get_leaf_mask(self, criteria: Criteria) -> LeafMask:
+        """말단 조건의 (통과 마스크, 근거 열)을 실행 단위로 메모이제이션합니다.
+
+        Raises:
+            ValueError: 마스크 커널이 없는 type이거나 지표가 패널에 없는 경우.
+        """
+        leaf_mask = self._mask_cache.get(criteria)
+        if leaf_mask is None:
+            kernel = self._mask_map.get(criteria.type)
+            if kernel is None:
+                raise ValueError(f"조합 조건에 쓸 수 없는 type ({criteria.type})")
+
+            # (계산은 락 밖에서: 스레드 경합 시 중복 계산될 수 있으나 결과는 동일)
+            mask, evidence = kernel(criteria)
+            mask.flags.writeable = False
+            with self._growth_cache_lock:
+                leaf_mask = self._mask_cache.setdefault(criteria, (mask, evidence))
+        return leaf_mask
+
+    def _qoq_growth_mask(self, criteria: QoQCriteria) -> LeafMask:
+        return self._growth_mask(
+            criteria.metric, criteria.base_quarter, criteria.target_quarter,
+            criteria.min_growth_pct, criteria.top_n
+        )
+
+    def _yoy_growth_mask(self, criteria: YoYCriteria) -> LeafMask:
+        if criteria.target_quarter is None:
+            raise ValueError("조합 조건의 YoY_Growth에는 target_quarter가 필요합니다.")
+        return self._growth_mask(
+            criteria.metric, criteria.base_quarter, criteria.target_quarter,
+            criteria.min_growth_pct, criteria.top_n
+        )
+
+    def _growth_mask(
+        self,
+        metric: str,
+        base_quarter: str,
+        target_quarter: str,
+        min_growth: float,
+        top_n: Optional[int]
+    ) -> LeafMask:
+        """성장률 조건의 마스크. (통과/상위 N 규칙은 _build_qoq_result_dataframe과 같음)"""
+        if not self.panel.has_metric(metric):
+            raise ValueError(f"Metric 없음: '{metric}'")
+
+        rate = self._get_growth_rate(metric, base_quarter, target_quarter)
+        passed = np.flatnonzero(rate >= min_growth)
+        if top_n is not None:
+            passed = self._rank_descending(rate, passed, top_n)
+
+        mask = np.zeros(len(rate), dtype=bool)
+        mask[passed] = True
+        return mask, {
+            f"{metric}(Base)": self._get_quarterly_data(metric, base_quarter),
+            f"{metric}(Target)": self._get_quarterly_data(metric, target_quarter),
+            "Growth_Rate(%)": np.round(rate * 100, 2),
+        }
+
+    def _turnaround_mask(self, criteria: TurnaroundCriteria) -> LeafMask:
+        """턴어라운드 조건의 마스크. (규칙은 _execute_qoq_turnaround와 같음)"""
+        if not self.panel.has_metric(criteria.metric):
+            raise ValueError(f"Metric 없음: '{criteria.metric}'")
+
+        base_values = self._get_quarterly_data(criteria.metric, criteria.base_quarter)
+        target_values = self._get_quarterly_data(criteria.metric, criteria.target_quarter)
+        return (base_values <= 0) & (target_values > 0), {
+            f"{criteria.metric}(Base)": base_values,
+            f"{criteria.metric}(Target)": target_values,
+        }
+
+    def _growth_streak_mask(self, criteria: GrowthStreakCriteria) -> LeafMask:
+        """연속 성장 조건의 마스크와 근거 열. (연속 성장 분기 수 행렬의 열 조회)
+
+        Raises:
+            ValueError: criteria.metric이 패널에 없는 경우.
+            KeyError: 비교 분기(열)가 없거나, 분기가 연속되지 않은 경우.
+        """
+        if not self.panel.has_metric(criteria.metric):
+            raise ValueError(f"Metric 없음: '{criteria.metric}'")
+
+        # (인접한 열이 곧 인접한 분기여야 연속 성장으로 셀 수 있음)
+        self._require_contiguous_quarters()
+        try:
+            target_code = self.panel.quarter_code(criteria.target_quarter)
+        except KeyError:
+            raise KeyError(f"분기(열) 없음: {criteria.target_quarter}") from None
+
+        streak = self._get_streak_matrix(criteria.metric, criteria.min_growth_pct)[:, target_code]
+        values = self.panel.metric_values(criteria.metric)
+
+        # 기준 분기: 연속 성장 N분기가 시작되기 직전 분기 (패널보다 앞서면 NaN)
+        base_code = target_code - criteria.min_streak
+        base_values = values[:, base_code] if base_code >= 0 else np.full(len(streak), np.nan)
+        return streak >= criteria.min_streak, {
+            f"{criteria.metric}(Base)": base_values,
+            f"{criteria.metric}(Target)": values[:, target_code],
+            "Streak": streak,
+        }
+
+    def _require_contiguous_quarters(self):
+        """패널 분기에 빠진 분기가 없는지 확인합니다. (열 위치 차이 = 분기 차이)
+
+        Raises:
+            KeyError: 처음과 마지막 분기 사이에 빠진 분기가 있는 경우.
+        """
+        quarters = self.panel.quarters
+        if len(quarters):
+            self.panel.quarter_range(quarters[0], quarters[-1])
+
+    def _get_growth_rate(self, metric: str, base_quarter: str, target_quarter: str) -> np.ndarray:
+        """(지표, 기준 분기, 비교 분기)의 성장률 벡터를 실행 단위로 메모이제이션합니다.
+
+        같은 분기 쌍을 쓰는 전략들은 나눗셈을 한 번만 수행하고,
+        각자 자신의 임계값만 적용합니다.
+
+        Args:
+            metric (str): 재무 지표 이름.
+            base_quarter (str): 기준 분기.
+            target_quarter (str): 비교 분기.
+
+        Returns:
+            np.ndarray: 성장률 벡터. (공유되므로 읽기 전용)
+        """
+        key = (metric, base_quarter, target_quarter)
+        growth_rate = self._growth_cache.get(key)
+        if growth_rate is None:
+            growth_rate = self._lookup_growth_matrix(metric, base_quarter, target_quarter)
+        if growth_rate is None:
+            # (계산은 락 밖에서: 스레드 경합 시 중복 계산될 수 있으나 결과는 동일)
+            growth_rate = self._safe_growth_rate(
+                self._get_quarterly_data(metric, base_quarter),
+                self._get_quarterly_data(metric, target_quarter),
+            )
+            growth_rate.flags.writeable = False
+            with self._growth_cache_lock:
+                growth_rate = self._growth_cache.setdefault(key, growth_rate)
+        return growth_rate
+
+    def precompute_growth_matrix(self, metric: str) -> pd.DataFrame:
+        """지표의 모든 인접 분기 쌍에 대한 성장률 행렬을 미리 계산해 캐시합니다.
+
+        이후 인접 분기 쌍을 쓰는 QoQ 전략은 나눗셈 없이 행렬의 열 하나를
+        조회한 뒤 임계값 마스크만 적용합니다.
+
+        Args:
+            metric (str): 재무 지표 이름 (예: "영업이익").
+
+        Returns:
+            pd.DataFrame: 성장률 행렬 뷰 (행: 종목, 열: "기준분기->비교분기").
+
+        Raises:
+            ValueError: metric이 패널에 없는 경우.
+            KeyError: 분기가 연속되지 않은 경우. (인접 열이 인접 분기가 아님)
+        """
+        view = self._execution_view()
+        view._require_contiguous_quarters()
+        matrix = view._get_growth_matrix(metric)
+        quarters = view.panel.quarters
+        columns = [f"{base}->{target}" for base, target in zip(quarters[:-1], quarters[1:])]
+        return pd.DataFrame(matrix, index=view.panel.tickers, columns=columns, copy=False)
+
+    def _get_growth_matrix(self, metric: str, lag: int = 1) -> np.ndarray:
+        """(종목 × 분기 쌍) 성장률 행렬을 한 번의 벡터 연산으로 계산/캐시합니다.
+
+        열 j는 분기 j -> j+lag 의 성장률이며 (lag=1: 인접 분기, lag=4: 전년 동기),
+        분기 축을 lag칸 이동한 두 배열 뷰에 _safe_growth_rate를 한 번 적용합니다.
+
+        Raises:
+            ValueError: metric이 패널에 없는 경우.
+        """
+        key = (metric, lag)
+        matrix = self._growth_matrix_cache.get(key)
+        if matrix is None:
+            if not self.panel.has_metric(metric):
+                raise ValueError(f"Metric 없음: '{metric}'")
+
+            values = self.panel.metric_values(metric)
+            matrix = np.asfortranarray(self._safe_growth_rate(values[:, :-lag], values[:, lag:]))
+            matrix.flags.writeable = False
+            with self._growth_cache_lock:
+                matrix = self._growth_matrix_cache.setdefault(key, matrix)
+        return matrix
+
+    def _get_streak_matrix(self, metric: str, min_growth: Optional[float] = None) -> np.ndarray:
+        """(종목 × 분기) 연속 성장 분기 수 행렬을 한 번의 run-length 패스로 계산/캐시합니다.
+
+        streak[i, j]는 분기 j에서 끝나는 연속 QoQ 성장 분기 수입니다. 인접 분기
+        성장률 행렬(_get_growth_matrix)의 성장 여부 행렬에서, 각 열 위치 k에 대해
+        '마지막으로 성장하지 않은 위치'를 누적 최댓값(np.maximum.accumulate)으로
+        구하면 연속 길이는 k - (그 위치)가 됩니다.
+
+            성장 여부    T  T  F  T  T  T
+            리셋 위치    0  0  3  3  3  3     (성장하지 않은 위치의 누적 최댓값)
+            연속 길이    1  2  0  1  2  3
+
+        Args:
+            metric (str): 재무 지표 이름.
+            min_growth (Optional[float]): 성장으로 볼 최소 성장률.
+                None이면 성장률 > 0, 값이 있으면 성장률 >= 값. (NaN은 성장 아님)
+
+        Returns:
+            np.ndarray: int32 행렬 (종목 × 분기). 첫 분기 열은 항상 0. (공유되므로 읽기 전용)
+
+        Raises:
+            ValueError: metric이 패널에 없는 경우.
+        """
+        key = (metric, min_growth)
+        streak = self._streak_matrix_cache.get(key)
+        if streak is None:
+            rate = self._get_growth_matrix(metric)
+            grew = rate > 0 if min_growth is None else rate >= min_growth
+
+            positions = np.arange(1, rate.shape[1] + 1, dtype=np.int32)
+            last_reset = np.maximum.accumulate(np.where(grew, 0, positions), axis=1)
+
+            streak = np.zeros((rate.shape[0], rate.shape[1] + 1), dtype=np.int32, order="F")
+            streak[:, 1:] = positions - last_reset
+            streak.flags.writeable = False
+            with self._growth_cache_lock:
+                streak = self._streak_matrix_cache.setdefault(key, streak)
+        return streak
+
+    def _lookup_growth_matrix(
+        self, metric: str, base_quarter: str, target_quarter: str
+    ) -> Optional[np.ndarray]:
+        """미리 계산된 성장률 행렬에서 분기 쌍의 열을 조회합니다.
+
+        Returns:
+            Optional[np.ndarray]: 두 분기 간격의 행렬이 없으면 None.
+        """
+        try:
+            base_code = self.panel.quarter_code(base_quarter)
+            target_code = self.panel.quarter_code(target_quarter)
+        except KeyError:
+            return None
+
+        matrix = self._growth_matrix_cache.get((metric, target_code - base_code))
+        if matrix is None:
+            return None
+        return matrix[:, base_code]
+
+    def _get_quarterly_data(self, metric: str, quarter: str) -> np.ndarray:
+        """패널에서 특정 지표, 특정 분기(열)의 종목별 값을 추출합니다.
+
+        Args:
+            metric (str): 재무 지표 이름 (예: "영업이익").
             quarter (str): 추출할 분기 이름 (컬럼명).
 
         Returns:
-            pd.Series: 해당 분기의 데이터.
+            np.ndarray: 해당 분기의 값 (패널 종목 순서, 복사 없는 뷰).
 
         Raises:
-            KeyError: DataFrame에 해당 분기(컬럼)가 없는 경우.
+            KeyError: 패널에 해당 분기(열)가 없는 경우.
         """
-        if quarter not in df.columns:
-            raise KeyError(f"분기(열) 없음: {quarter}")
-        return df[quarter]
+        try:
+            return self.panel.column(metric, quarter)
+        except KeyError:
+            raise KeyError(f"분기(열) 없음: {quarter}") from None
 
     def _build_qoq_result_dataframe(
         self,
-        base: pd.Series,
-        target: pd.Series,
-        rate: pd.Series,
+        base: np.ndarray,
+        target: np.ndarray,
+        rate: np.ndarray,
         min_growth: float,
-        metric_name: str
+        metric_name: str,
+        top_n: Optional[int] = None
     ) -> pd.DataFrame:
         """계산된 성장률을 기준으로 필터링하고 결과 DataFrame을 생성합니다.
 
+        필터링과 정렬은 ndarray 위에서 끝내고, 통과한 종목에 대해서만
+        라벨이 붙은 DataFrame을 만듭니다.
+
         Args:
-            base (pd.Series): 기준 분기 값.
-            target (pd.Series): 비교 분기 값.
-            rate (pd.Series): 계산된 성장률.
+            base (np.ndarray): 기준 분기 값.
+            target (np.ndarray): 비교 분기 값.
+            rate (np.ndarray): 계산된 성장률.
             min_growth (float): 최소 통과 성장률.
             metric_name (str): 컬럼 이름에 사용할 Metric 이름 (예: "영업이익").
+            top_n (Optional[int]): 상위 N개만 남김 (None이면 통과 종목 전체).
 
         Returns:
             pd.DataFrame: 통과된 종목의 상세 결과 (인덱스: 종목명).
         """
-        passed_mask = (rate >= min_growth)
-        
-        # 필터링된 데이터로 새 DataFrame 생성
-        result_df = pd.DataFrame({
-            f"{metric_name}(Base)": base[passed_mask],
-            f"{metric_name}(Target)": target[passed_mask],
-            "Growth_Rate(%)": (rate[passed_mask] * 100).round(2) # 백분율로 변환
-        })
-        
-        # 성장률 높은 순으로 정렬
-        result_df.sort_values(by="Growth_Rate(%)", ascending=False, inplace=True)
-        
-        return result_df
+        passed = np.flatnonzero(rate >= min_growth)
+        order = self._rank_descending(rate, passed, top_n)
 
-    def _safe_growth_rate(self, base: pd.Series, target: pd.Series) -> pd.Series:
+        return pd.DataFrame(
+            {
+                f"{metric_name}(Base)": base[order],
+                f"{metric_name}(Target)": target[order],
+                "Growth_Rate(%)": np.round(rate[order] * 100, 2), # 백분율로 변환
+            },
+            index=self.panel.tickers[order],
+        )
+
+    def _rank_descending(
+        self,
+        rate: np.ndarray,
+        candidates: np.ndarray,
+        top_n: Optional[int] = None
+    ) -> np.ndarray:
+        """후보 종목을 성장률 내림차순으로 정렬합니다. (top_n이면 부분 선택 후 정렬)
+
+        top_n이 후보 수보다 작으면 np.partition으로 N번째 값(경계값)만 찾아
+        상위 N개를 O(n)에 고른 뒤, 그 N개만 정렬합니다.
+        동률(흑자전환 np.inf 포함)은 전체 정렬 경로와 같게 항상 패널 종목
+        순서가 앞선 종목을 우선합니다.
+
+        Args:
+            rate (np.ndarray): 성장률 벡터. (후보에는 NaN이 없어야 함)
+            candidates (np.ndarray): 후보 종목 위치 (오름차순).
+            top_n (Optional[int]): 선택할 개수.
+
+        Returns:
+            np.ndarray: 정렬된 종목 위치.
+        """
+        if top_n is not None and top_n < len(candidates):
+            values = rate[candidates]
+            boundary = np.partition(values, len(values) - top_n)[len(values) - top_n]
+
+            above = candidates[values > boundary]
+            ties = candidates[values == boundary][: top_n - len(above)]
+            candidates = np.sort(np.concatenate([above, ties]))
+
+        # 성장률 높은 순으로 정렬 (동률은 패널 종목 순서 유지)
+        return candidates[np.argsort(-rate[candidates], kind="stable")]
+
+    def _safe_growth_rate(self, base: np.ndarray, target: np.ndarray) -> np.ndarray:
         """안전한 분기 성장률을 계산합니다. (NaN/0/음수 처리)
 
         - (흑자): (target / base) - 1
         - (흑자전환): base <= 0 이고 target > 0 이면 'np.inf' (무한 성장)
         - (그 외): 'np.nan' (계산 불가, 필터 시 탈락)
 
+        벡터(한 분기 쌍)와 행렬(여러 분기 쌍) 모두에 같은 규칙으로 동작합니다.
+
         Args:
-            base (pd.Series): 기준 분기 값 (V1).
-            target (pd.Series): 비교 분기 값 (V2).
+            base (np.ndarray): 기준 분기 값 (V1).
+            target (np.ndarray): 비교 분기 값 (V2). (base와 같은 모양)
 
         Returns:
-            pd.Series: 계산된 성장률. (인덱스: 종목명)
+            np.ndarray: 계산된 성장률. (입력과 같은 모양)
         """
-        growth = (target / base) - 1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            growth = (target / base) - 1
         
         conditions = [
             (base > 0),
@@ -200,5 +1381,4 @@ class QuantScreeningService(ScreeningUseCasePort):
             np.inf,
         ]
         
-        safe_growth = np.select(conditions, choices, default=np.nan)
-        return pd.Series(safe_growth, index=base.index)
\ No newline at end of file
+        return np.select(conditions, choices, default=np.nan)
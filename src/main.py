@@ -4,9 +4,27 @@
 
 # --- 1. 경로 설정 ---
 STRATEGIES_DIR = "strategies/active"
+# 전략 파싱 결과 인덱스 (생성 파일이므로 전략 폴더 밖에 둠)
+STRATEGY_INDEX_FILE = "output/cache/strategy_index.json"
 DATA_FILE_PATH = "data/재무데이터_통합_최종.xlsx"
 # (NEW) Excel 저장 경로
 XLSX_OUTPUT_FILE = "output/results/quant_screening_results.xlsx" 
+# 전략 실행 방식 ("sequential" | "thread" | "process") 및 풀 크기(None: CPU 개수)
+EXECUTION_MODE = "sequential"
+MAX_WORKERS = None
+# 단계별 시간/메모리 계측 리포트 (예: "output/results/run_trace.json". None이면 계측 비활성화,
+# 콘솔 실행에만 적용) 및 메모리 측정 여부 (tracemalloc: 모든 할당이 느려지므로 필요할 때만)
+TRACE_REPORT_FILE = None
+TRACE_MEMORY = False
+# 실행 간 결과 캐시 (None이면 비활성화) 및 최대 크기
+RESULT_CACHE_DIR = "output/cache/results"
+RESULT_CACHE_MAX_BYTES = 256 * 2**20
+# 실행 방식 ("console": 한 번 실행 후 종료 | "stream": 끝난 전략부터 바로 저장/출력 후 종료
+#           | "watch": 파일 변경 시 바뀐 부분만 재실행 | "http": 데이터를 상주시킨 로컬 HTTP API)
+RUN_MODE = "console"
+WATCH_POLL_INTERVAL = 1.0
+HTTP_HOST = "127.0.0.1"
+HTTP_PORT = 8765
 
 
 # --- 2. 모든 구성 요소 임포트 ---
@@ -14,9 +32,12 @@ from adapters.outbound.excel_data_source import ExcelFinancialDataSource
 from adapters.outbound.toml_strategy_loader import TomlStrategyLoader
 # (CHANGE) CSV 대신 Excel 어댑터 임포트
 from adapters.outbound.excel_result_persistence import ExcelResultPersistenceAdapter
+from adapters.outbound.run_tracer import RunTracer
+from adapters.outbound.disk_result_cache import DiskResultCache
 
 from domain.service.screening_service import QuantScreeningService
 from adapters.inbound.console_runner import ConsoleRunner
+from adapters.inbound.http_server import HttpScreeningServer
 
 
 def main():
@@ -26,12 +47,27 @@ def main():
 
     # --- 3. Outbound 어댑터 생성 (외부 의존성) ---
     try:
-        data_source_adapter = ExcelFinancialDataSource(file_path=DATA_FILE_PATH)
-        strategy_loader_adapter = TomlStrategyLoader(active_strategies_path=STRATEGIES_DIR)
+        # (모든 어댑터와 서비스가 같은 트레이서를 공유. 상주 서버는 기록이 계속 쌓이므로 제외)
+        tracer = (
+            RunTracer(trace_memory=TRACE_MEMORY)
+            if TRACE_REPORT_FILE and RUN_MODE in ("console", "stream") else None
+        )
+
+        data_source_adapter = ExcelFinancialDataSource(file_path=DATA_FILE_PATH, tracer=tracer)
+        strategy_loader_adapter = TomlStrategyLoader(
+            active_strategies_path=STRATEGIES_DIR, tracer=tracer, index_path=STRATEGY_INDEX_FILE
+        )
         
         # (CHANGE) CSV 어댑터 대신 Excel 어댑터 생성
+        # (컬럼형 어댑터 ColumnarResultPersistenceAdapter로 바꾸면 종목별 Base/Target 결과만
+        #  저장되고, 임계값 스윕 / 모든 분기 YoY / 조합 조건(Composite) 결과는 저장되지 않음)
         persistence_adapter = ExcelResultPersistenceAdapter(
-            output_file_path=XLSX_OUTPUT_FILE
+            output_file_path=XLSX_OUTPUT_FILE, tracer=tracer
+        )
+
+        result_cache = (
+            DiskResultCache(RESULT_CACHE_DIR, max_bytes=RESULT_CACHE_MAX_BYTES)
+            if RESULT_CACHE_DIR else None
         )
         
     except Exception as e:
@@ -43,13 +79,23 @@ def main():
     try:
         quant_service = QuantScreeningService(
             data_source=data_source_adapter,
-            strategy_loader=strategy_loader_adapter
+            strategy_loader=strategy_loader_adapter,
+            execution_mode=EXECUTION_MODE,
+            max_workers=MAX_WORKERS,
+            tracer=tracer,
+            result_cache=result_cache
         )
     except Exception as e:
         print(f"🚨 [Main] Domain Service 초기화 실패 (데이터/전략 로드 오류): {e}")
         return
 
     # --- 5. Inbound 어댑터 생성 (실행기) ---
+    if RUN_MODE == "http":
+        HttpScreeningServer(
+            screening_service=quant_service, host=HTTP_HOST, port=HTTP_PORT
+        ).serve_forever()
+        return
+
     # (이 부분도 'persistence_adapter'가 포트 타입이라 수정할 필요가 없습니다)
     console_runner = ConsoleRunner(
         screening_service=quant_service,
@@ -57,7 +103,19 @@ def main():
     )
 
     # --- 6. 애플리케이션 실행 ---
-    console_runner.run()
+    if RUN_MODE == "watch":
+        console_runner.watch(STRATEGIES_DIR, DATA_FILE_PATH, poll_interval=WATCH_POLL_INTERVAL)
+        return
+
+    if RUN_MODE == "stream":
+        console_runner.run_streaming()
+    else:
+        console_runner.run()
+
+    # --- 7. 실행 계측 리포트 ---
+    if tracer:
+        tracer.print_summary()
+        tracer.dump_json(TRACE_REPORT_FILE)
 
 
 if __name__ == "__main__":